@@ -0,0 +1,3 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Benchmarks of Engineering Metrics, and the synthetic Jira data they (and the tests) run against."""
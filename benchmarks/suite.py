@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Benchmarks of the hot paths of the Jira adapter, run against synthetic issues at several scales.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --scales 1000 10000 --comments 5 --transitions 12 --output after.json
+    python -m benchmarks.suite --compare before.json --threshold 10
+
+Each benchmark is timed ``--repeat`` times at each scale and the best and median times are reported.
+``--output`` writes the results as JSON, and ``--compare`` reads the JSON of an earlier run and shows
+how each benchmark has changed. With ``--threshold`` the run fails if any benchmark got slower by more
+than that percentage, which is handy in CI.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import (Jira, JiraIssue, JQLResult, busday_duration,
+                                         busday_durations)
+
+SCALES = [1000, 10000]
+
+
+def _resources(client: FakeJIRA) -> list:
+    return client.search_issues('project = BENCH', maxResults=False, expand='changelog')
+
+
+def _result(client: FakeJIRA) -> JQLResult:
+    return JQLResult('project = BENCH', issues=_resources(client))
+
+
+def _date_pairs(count: int) -> tuple:
+    start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+    starts = [start + timedelta(minutes=97 * i) for i in range(count)]
+    return starts, [s + timedelta(hours=(i * 37) % 500) for i, s in enumerate(starts)]
+
+
+def _dataframe_rows(result: list) -> int:
+    # Filtered issues are views that are filled in as they are used, so use them like a report would.
+    return sum(len(issue) for issue in result)
+
+
+# Each benchmark is a setup function, given the fake client and the scale, and a function that is
+# timed, given what setup returned. Setup runs again before every repetition.
+BENCHMARKS = {
+    'jira_issue': (
+        lambda client, count: _resources(client),
+        lambda issues: [JiraIssue(issue) for issue in issues]),
+    'jira_issue_lazy': (
+        lambda client, count: _resources(client),
+        lambda issues: [JiraIssue(issue, lazy=True)['status'] for issue in issues]),
+    'populate_from_jql': (
+        lambda client, count: Jira(client, process_workers=1),
+        lambda jira: jira.populate_from_jql('project = BENCH')),
+    'filter': (
+        lambda client, count: _result(client),
+        lambda result: _dataframe_rows(result.filter(['Story', 'Bug'], ['key', 'status', 'leadTime', 'cycleTime']))),
+    'expand_issue_flow_logs': (
+        lambda client, count: _result(client),
+        lambda result: result.expand_issue_flow_logs()),
+    'calculate_cycle_times': (
+        lambda client, count: _result(client),
+        lambda result: result.calculate_cycle_times()),
+    'busday_duration': (
+        lambda client, count: _date_pairs(count),
+        lambda pairs: [busday_duration(a, b) for a, b in zip(*pairs)]),
+    'busday_durations': (
+        lambda client, count: _date_pairs(count),
+        lambda pairs: busday_durations(*pairs)),
+}
+
+
+def run(benchmark: str, client: FakeJIRA, count: int, repeat: int) -> dict:
+    setup, timed = BENCHMARKS[benchmark]
+    times = []
+    for _ in range(repeat):
+        state = setup(client, count)
+        started = time.perf_counter()
+        timed(state)
+        times.append(time.perf_counter() - started)
+    best = min(times)
+    return {
+        'benchmark': benchmark,
+        'scale': count,
+        'best': best,
+        'median': statistics.median(times),
+        'per_item_us': best * 10**6 / count,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, universal_newlines=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'commit': commit,
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float = None) -> bool:
+    """Print how each result changed since a baseline run. False if any got slower than threshold %."""
+    before = {(r['benchmark'], r['scale']): r for r in baseline['results']}
+    ok = True
+    print('\nCompared with {} ({})'.format(
+        baseline.get('created'), (baseline.get('environment') or {}).get('commit')))
+    for result in results:
+        old = before.get((result['benchmark'], result['scale']))
+        if old == None:
+            continue
+        change = (result['best'] / old['best'] - 1) * 100
+        flag = ''
+        if threshold != None and change > threshold:
+            flag = '  <-- slower'
+            ok = False
+        print('{:<24} {:>8} {:>10.1f} ms -> {:>10.1f} ms {:>+7.1f}%{}'.format(
+            result['benchmark'], result['scale'], old['best'] * 1000, result['best'] * 1000, change, flag))
+    return ok
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES,
+                        help='Numbers of issues to run each benchmark with.')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help='The benchmarks to run. Defaults to all of them.')
+    parser.add_argument('--comments', type=int, default=2, help='Comments on each issue.')
+    parser.add_argument('--transitions', type=int, default=6, help='Status changes of each issue.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic issues.')
+    parser.add_argument('--repeat', type=int, default=3, help='Times to run each benchmark.')
+    parser.add_argument('--output', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare with.')
+    parser.add_argument('--threshold', type=float,
+                        help='With --compare, fail if a benchmark got slower by more than this percentage.')
+    args = parser.parse_args(argv)
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'environment': environment(),
+        'config': {'comments': args.comments, 'transitions': args.transitions, 'seed': args.seed,
+                   'repeat': args.repeat},
+        'results': [],
+    }
+    print('{:<24} {:>8} {:>13} {:>13} {:>12}'.format(
+        'benchmark', 'issues', 'best', 'median', 'per issue'))
+    for count in args.scales:
+        client = FakeJIRA({'BENCH': raw_issues(count, comments=args.comments,
+                                               transitions=args.transitions, seed=args.seed)})
+        for benchmark in args.benchmarks:
+            result = run(benchmark, client, count, args.repeat)
+            report['results'].append(result)
+            print('{:<24} {:>8} {:>10.1f} ms {:>10.1f} ms {:>9.1f} us'.format(
+                benchmark, count, result['best'] * 1000, result['median'] * 1000, result['per_item_us']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if not compare(report['results'], json.load(f), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
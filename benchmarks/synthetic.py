@@ -0,0 +1,266 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Deterministic synthetic Jira data for benchmarks.
+
+``raw_issues`` makes the raw JSON of issues as the Jira REST api returns it from a search with the
+changelog expanded, with a configurable number of comments and status transitions. The same arguments
+always give the same issues. ``FakeJIRA`` serves them through the parts of the ``jira.JIRA`` client
+the :py:class:`engineeringmetrics.adapters.Jira` adapter uses, decoding each page from JSON as the real
+client would, so the adapter can be run end to end without a server:
+
+    >>> from benchmarks.synthetic import FakeJIRA, raw_issues
+    >>> client = FakeJIRA({'BENCH': raw_issues(1000, comments=3, transitions=8)})
+    >>> project = Jira(client).get_project_issues('BENCH')
+"""
+import copy
+import json
+import random
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from jira import JIRA, client
+from jira.resources import Issue, Project
+from requests import Session
+
+SERVER = 'https://bench.atlassian.net'
+OPTIONS = dict(JIRA.DEFAULT_OPTIONS, server=SERVER)
+_API = SERVER + '/rest/api/2/'
+
+# A workflow to walk issues through: the statuses an issue can move to from each status.
+WORKFLOW = {
+    'To Do': ['In Progress', 'In Progress', 'Blocked'],
+    'In Progress': ['In Review', 'In Review', 'Blocked', 'To Do'],
+    'In Review': ['Done', 'Done', 'In Progress'],
+    'Blocked': ['In Progress', 'To Do'],
+    'Done': ['In Progress'],
+}
+ISSUE_TYPES = ['Story', 'Story', 'Bug', 'Task', 'Sub-task']
+PRIORITIES = ['Highest', 'High', 'Medium', 'Medium', 'Low']
+UTC_OFFSETS = [0, 0, 60, -300, 330]
+PEOPLE = ['Ada Lovelace', 'Grace Hopper', 'Alan Turing', 'Barbara Liskov', 'Edsger Dijkstra',
+          'Margaret Hamilton', 'Donald Knuth', 'Frances Allen']
+WORDS = ('the quick brown fox jumps over lazy dog payment driver booking fare quote refund '
+         'airport journey invoice partner dispatch rating trip').split()
+
+
+def jira_timestamp(moment: datetime) -> str:
+    """A datetime in the format Jira sends, e.g. 2020-02-19T11:33:00.000+0100."""
+    offset = moment.utcoffset() // timedelta(minutes=1)
+    return '{}.{:03d}{}{:02d}{:02d}'.format(moment.strftime('%Y-%m-%dT%H:%M:%S'), moment.microsecond // 1000,
+                                            '-' if offset < 0 else '+', abs(offset) // 60, abs(offset) % 60)
+
+
+def _person(rng: random.Random) -> dict:
+    name = rng.choice(PEOPLE)
+    account = '5b10a2844c20165700ede{:03d}'.format(PEOPLE.index(name))
+    return {
+        'self': _API + 'user?accountId=' + account,
+        'accountId': account,
+        'accountType': 'atlassian',
+        'active': True,
+        'avatarUrls': {'48x48': 'https://avatar.example.com/{}.png'.format(account)},
+        'displayName': name,
+        'emailAddress': name.lower().replace(' ', '.') + '@example.com',
+        'timeZone': 'Europe/London',
+    }
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _named(kind: str, name: str, names: List[str]) -> dict:
+    return {'self': '{}{}/{}'.format(_API, kind, names.index(name) + 1), 'id': str(names.index(name) + 1), 'name': name}
+
+
+def raw_issue(rng: random.Random, number: int, project: str = 'BENCH', comments: int = 2, transitions: int = 6, resolved: bool = True) -> dict:
+    """The raw JSON of one issue, with its changelog expanded.
+
+    Args:
+        rng: The random number generator to draw from.
+        number: The issue number, used for its key and id.
+        project (optional): The project key.
+        comments (optional): The number of comments on the issue.
+        transitions (optional): The number of status changes in the changelog. The changelog has
+            about a third as many other changes as well.
+        resolved (optional): End the issue in Done with a resolution date, if it has any transitions.
+
+    Returns:
+        dict: The issue as the Jira REST api returns it from a search, histories newest first.
+    """
+    tz = timezone(timedelta(minutes=rng.choice(UTC_OFFSETS)))
+    created = datetime(2018, 1, 1, tzinfo=tz) + timedelta(seconds=rng.randrange(3 * 365 * 86400),
+                                                          milliseconds=rng.randrange(1000))
+    moment = created
+    status = 'To Do'
+    histories = []
+    for change in range(transitions + transitions // 3):
+        moment += timedelta(minutes=rng.randint(5, 6 * 24 * 60))
+        if change < transitions:
+            target = 'Done' if resolved and change == transitions - 1 else rng.choice(
+                [s for s in WORKFLOW[status] if s != 'Done' or change == transitions - 1] or ['In Progress'])
+            item = {'field': 'status', 'fieldtype': 'jira', 'fieldId': 'status', 'from': str(len(status)),
+                    'fromString': status, 'to': str(len(target)), 'toString': target}
+            status = target
+        else:
+            item = {'field': 'assignee', 'fieldtype': 'jira', 'fieldId': 'assignee', 'from': None,
+                    'fromString': None, 'to': None, 'toString': rng.choice(PEOPLE)}
+        histories.append({'id': str(number * 100000 + change), 'author': _person(rng),
+                          'created': jira_timestamp(moment), 'items': [item]})
+    # Changes after the status transitions are mixed in amongst them, as they would be in Jira.
+    histories.sort(key=lambda h: h['created'])
+    histories.reverse()
+
+    done = resolved and status == 'Done'
+    resolution_date = jira_timestamp(moment + timedelta(minutes=1)) if done else None
+    updated = jira_timestamp(moment + timedelta(minutes=2))
+    issue_type = rng.choice(ISSUE_TYPES)
+    key = '{}-{}'.format(project, number)
+    issue_id = str(100000 + number)
+    comment_list = []
+    for c in range(comments):
+        when = jira_timestamp(created + timedelta(hours=c + 1))
+        author = _person(rng)
+        comment_list.append({'self': '{}issue/{}/comment/{}'.format(_API, issue_id, number * 100 + c),
+                             'id': str(number * 100 + c), 'author': author, 'body': _sentence(rng, 20),
+                             'updateAuthor': author, 'created': when, 'updated': when})
+    links = []
+    if number > 1 and rng.random() < 0.3:
+        linked = rng.randrange(1, number)
+        links.append({'id': str(number), 'type': {'name': 'Relates'}, 'inwardIssue': {
+            'id': str(100000 + linked), 'key': '{}-{}'.format(project, linked)}})
+
+    fields = {
+        'assignee': _person(rng) if rng.random() < 0.8 else None,
+        'comment': {'comments': comment_list, 'maxResults': comments, 'total': comments, 'startAt': 0},
+        'created': jira_timestamp(created),
+        'customfield_10001': '{}-{}'.format(project, max(1, number // 50)) if rng.random() < 0.5 else None,
+        'description': _sentence(rng, 60),
+        'fixVersions': [{'self': _API + 'version/1', 'id': '1', 'name': 'v1.0'}] if done and rng.random() < 0.5 else [],
+        'issuelinks': links,
+        'issuetype': dict(_named('issuetype', issue_type, ISSUE_TYPES), subtask=issue_type == 'Sub-task'),
+        'labels': rng.sample(WORDS, rng.randint(0, 3)),
+        'priority': _named('priority', rng.choice(PRIORITIES), PRIORITIES),
+        'project': {'self': _API + 'project/' + project, 'id': '10000', 'key': project, 'name': project.title()},
+        'resolution': {'self': _API + 'resolution/1', 'id': '1', 'name': 'Done'} if done else None,
+        'resolutiondate': resolution_date,
+        'status': dict(_named('status', status, list(WORKFLOW)), statusCategory={'key': 'done' if done else 'indeterminate'}),
+        'summary': _sentence(rng, 8),
+        'updated': updated,
+    }
+    if issue_type == 'Sub-task' and number > 1:
+        parent = rng.randrange(1, number)
+        fields['parent'] = {'id': str(100000 + parent), 'key': '{}-{}'.format(project, parent),
+                            'fields': {'summary': 'Parent {}'.format(parent)}}
+    return {
+        'expand': 'operations,changelog',
+        'id': issue_id,
+        'self': _API + 'issue/' + issue_id,
+        'key': key,
+        'fields': fields,
+        'changelog': {'startAt': 0, 'maxResults': len(histories), 'total': len(histories), 'histories': histories},
+    }
+
+
+def raw_issues(count: int, project: str = 'BENCH', comments: int = 2, transitions: int = 6, resolved: float = 0.75, seed: int = 0) -> List[dict]:
+    """The raw JSON of count issues. The same arguments always give the same issues.
+
+    Args:
+        count: The number of issues.
+        project (optional): The project key.
+        comments (optional): The number of comments on each issue.
+        transitions (optional): The number of status changes of each issue.
+        resolved (optional): The fraction of issues that are resolved.
+        seed (optional): Seed for the random number generator.
+
+    Returns:
+        List[dict]: The issues, numbered from 1.
+    """
+    rng = random.Random('{}:{}'.format(project, seed))
+    return [raw_issue(rng, number, project, comments, transitions, rng.random() < resolved)
+            for number in range(1, count + 1)]
+
+
+class FakeJIRA:
+    """Stands in for a ``jira.JIRA`` client, serving searches of projects of raw issues from memory.
+
+    Issues are held as JSON and each page of a search is decoded from it, so searching costs what
+    it would with a real client once the response has been downloaded. Searches understand
+    ``project = KEY`` and ``key in (...)`` (anything else matches every issue), ``startAt``/
+    ``maxResults`` paging, the ``fields`` to return and ``expand=changelog``. As in Jira, a search only
+    returns the first page of a long changelog, and changelog pages are served by ``_get_json``.
+
+    Args:
+        projects: The raw issues of each project, keyed by project key.
+        max_results (optional): The most issues returned by a single page, as Jira Cloud caps it.
+        max_histories (optional): The most changelog histories returned with an issue by a search.
+
+    Attributes:
+        requests (int): The number of requests made so far.
+    """
+
+    def __init__(self, projects: Dict[str, List[dict]], max_results: int = 100, max_histories: int = 100) -> None:
+        self._options = copy.deepcopy(OPTIONS)
+        self._session = Session()
+        self._max_results = max_results
+        self._max_histories = max_histories
+        self._projects = {key: [json.dumps(issue, separators=(',', ':')) for issue in issues]
+                          for key, issues in projects.items()}
+        self._keys = {raw: json.loads(raw)['key']
+                      for issues in self._projects.values() for raw in issues}
+        self._changelogs = {issue['key']: issue['changelog']['histories']
+                            for issues in projects.values() for issue in issues}
+        self.requests = 0
+
+    def project(self, key: str) -> Project:
+        self.requests += 1
+        return Project(self._options, self._session, raw={
+            'self': _API + 'project/' + key, 'id': '10000', 'key': key, 'name': key.title()})
+
+    def search_issues(self, jql_str: str, startAt: int = 0, maxResults: int = 50, validate_query: bool = True, fields=None, expand: str = None, **kwargs) -> client.ResultList:
+        match = re.search(r'project\s*=\s*"?([\w-]+)"?', jql_str)
+        if match and match.group(1) in self._projects:
+            issues = self._projects[match.group(1)]
+        else:
+            issues = [issue for project in self._projects.values() for issue in project]
+        keys = re.search(r'\bkey\s+in\s*\(([^)]*)\)', jql_str, flags=re.IGNORECASE)
+        if keys:
+            wanted_keys = {key.strip().strip('"') for key in keys.group(1).split(',')}
+            issues = [issue for issue in issues if self._keys[issue] in wanted_keys]
+        wanted = None if fields in (None, '*all') else set(
+            fields.split(',') if isinstance(fields, str) else fields)
+
+        # maxResults=False asks the client for everything, which it gets a page at a time.
+        pages = []
+        start = startAt
+        end = len(issues) if maxResults is False else min(len(issues), startAt + maxResults)
+        while True:
+            self.requests += 1
+            stop = min(end, start + self._max_results)
+            pages.extend(json.loads('[' + ','.join(issues[start:stop]) + ']'))
+            start = stop
+            if start >= end:
+                break
+
+        results = []
+        for raw in pages:
+            if wanted != None:
+                raw['fields'] = {k: v for k, v in raw['fields'].items() if k in wanted}
+            if expand == None or 'changelog' not in expand:
+                raw.pop('changelog', None)
+            elif len(raw['changelog']['histories']) > self._max_histories:
+                del raw['changelog']['histories'][self._max_histories:]
+                raw['changelog']['maxResults'] = self._max_histories
+            results.append(Issue(self._options, self._session, raw=raw))
+        return client.ResultList(results, startAt, maxResults or len(results), len(issues), True)
+
+    def _get_json(self, path: str, params: dict = None) -> dict:
+        self.requests += 1
+        key = path.split('/')[1]
+        histories = list(reversed(self._changelogs[key]))
+        start = int((params or {}).get('startAt', 0))
+        size = int((params or {}).get('maxResults', 100))
+        page = histories[start:start + size]
+        return {'startAt': start, 'maxResults': size, 'total': len(histories),
+                'isLast': start + size >= len(histories), 'values': page}
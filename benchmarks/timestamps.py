@@ -0,0 +1,49 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of parsing Jira timestamps with dateutil and with parse_jira_timestamp.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.timestamps
+"""
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from dateutil.parser import parse
+from engineeringmetrics.adapters import parse_jira_timestamp
+
+
+def jira_timestamps(count: int, distinct: int) -> list:
+    """count timestamps in Jira's format, drawn from a pool of distinct values."""
+    start = datetime(2019, 1, 1)
+    pool = []
+    for _ in range(distinct):
+        moment = start + timedelta(seconds=random.randrange(3 * 365 * 86400))
+        pool.append(moment.strftime('%Y-%m-%dT%H:%M:%S.') + '{:03d}{}'.format(
+            random.randrange(1000), random.choice(['+0000', '+0100', '-0500', '+0530'])))
+    return [random.choice(pool) for _ in range(count)]
+
+
+def run(label: str, parser, timestamps: list, repeat: int = 5, setup=lambda: None) -> float:
+    best = min(timeit.repeat(lambda: [parser(t) for t in timestamps],
+                             setup=setup, number=1, repeat=repeat))
+    print('{:<42} {:>9.1f} ms {:>8.2f} us/timestamp'.format(
+        label, best * 1000, best * 10**6 / len(timestamps)))
+    return best
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    count = 50000
+    for distinct in (count, count // 10):
+        timestamps = jira_timestamps(count, distinct)
+        print('{} timestamps drawn from {} values'.format(count, distinct))
+        baseline = run('dateutil.parser.parse', parse, timestamps)
+        uncached = run('parse_jira_timestamp (no memo)',
+                       parse_jira_timestamp.__wrapped__, timestamps)
+        # Start each run with an empty memo so we only count the repeats within the run.
+        cached = run('parse_jira_timestamp', parse_jira_timestamp, timestamps,
+                     setup=parse_jira_timestamp.cache_clear)
+        print('speedup: {:.0f}x without the memo, {:.0f}x with it\n'.format(
+            baseline / uncached, baseline / cached))
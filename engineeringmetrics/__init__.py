@@ -16,3 +16,4 @@ __python_requires__ = '>=3.6'
 
 from .engine import EngineeringMetrics
 from .engine import jirametrics
+from .adapters import BusinessCalendar
@@ -4,83 +4,340 @@
 pulling engineering metrics.
 """
 from dateutil.parser import parse
-from datetime import datetime, timedelta
+from dateutil.tz import tzoffset, tzutc
+from collections import deque
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timedelta, timezone
 import numpy as np
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
+from typing import Callable, List, Dict, Tuple
 
 from configparser import ConfigParser
+from engineeringmetrics.cache import IssueCache, SQLiteIssueCache
+from engineeringmetrics.lazy import LazyDict, _MISSING
+from engineeringmetrics.scheduler import RequestScheduler, mounted_scheduler
+from engineeringmetrics.replay import RecordingJIRA, ReplayJIRA
+from engineeringmetrics.stats import AdapterStats, timed
 from jira import JIRA, client
+from jira.resources import Issue
+from requests.adapters import HTTPAdapter
+import asyncio
+import copy
+import functools
+import hashlib
+import json
 import os
+import re
+import threading
+import warnings
+import weakref
 
 
-def busday_duration(date_a: datetime, date_b: datetime = None, interval="hours") -> int:
+_US_PER_SECOND = 10**6
+_US_PER_DAY = 86400 * _US_PER_SECOND
+
+# The format Jira sends timestamps in e.g. 2020-02-19T11:33:00.000+0100
+_JIRA_TIMESTAMP = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(?:(Z)|([+-])(\d\d):?(\d\d))?$')
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_jira_timestamp(timestamp: str) -> datetime:
+    """Parse a timestamp from Jira.
+
+    Timestamps in the ISO-8601 format Jira uses are parsed directly, which is much quicker than
+    ``dateutil.parser.parse``, and anything else is handed to dateutil. UTC offsets are given
+    ``dateutil.tz`` timezones just as dateutil would give them. Results are memoized as the same
+    timestamps turn up again and again in changelogs.
+
+    Args:
+        timestamp: The timestamp string.
+
+    Returns:
+        datetime: The parsed timestamp.
+    """
+    match = _JIRA_TIMESTAMP.match(timestamp)
+    if match == None:
+        return parse(timestamp)
+
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    tzinfo = None
+    if utc:
+        tzinfo = tzutc()
+    elif sign:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        tzinfo = tzutc() if offset == 0 else tzoffset(
+            None, -offset if sign == '-' else offset)
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                        int(fraction.ljust(6, '0')) if fraction else 0, tzinfo)
+    except ValueError:
+        # Let dateutil deal with (and report) out of range values.
+        return parse(timestamp)
+
+
+def _timestamp_arrays(dates: List[datetime]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a sequence of datetimes into UTC and wall clock microseconds since the epoch.
+
+    The wall clock values give the calendar day of each date in its own timezone, which is
+    what business days are counted against.
+    """
+    wall = np.array([d.replace(tzinfo=None) for d in dates],
+                    dtype='datetime64[us]').astype(np.int64)
+    offsets = np.array([(d.utcoffset() or timedelta(0)) // timedelta(microseconds=1) for d in dates],
+                       dtype=np.int64)
+    return wall - offsets, wall
+
+
+class BusinessCalendar:
+    """The working week that durations are measured against.
+
+    A calendar is built once, wraps a prebuilt `numpy.busdaycalendar <https://numpy.org/doc/stable/reference/generated/numpy.busdaycalendar.html>`_
+    and memoizes the number of business days before each day it has seen, so counting the business days
+    between two dates is a couple of array lookups. Share a single instance between everything that
+    works out durations, e.g. by passing it to :py:class:`engineeringmetrics.EngineeringMetrics` with the
+    ``"business_calendar"`` config key.
+
+    Args:
+        weekmask:
+            The days of the week that are working days in any format accepted by numpy, e.g. ``"1111100"``
+            or ``"Sun Mon Tue Wed Thu"``. Defaults to Monday to Friday.
+        holidays:
+            A list of dates that are not working days.
+        working_hours:
+            An optional (start, end) tuple with the hours of the working day, e.g. ``(9, 17.5)``. If given, only
+            time inside working hours on business days counts towards a duration. If not given, business days
+            count as whole days and durations are calculated as they always have been.
+
+    Example usage:
+
+        >>> from engineeringmetrics.adapters import BusinessCalendar
+        >>> uk_calendar = BusinessCalendar(holidays=['2019-12-25', '2019-12-26'], working_hours=(9, 17.5))
+    """
+
+    def __init__(self, weekmask: str = '1111100', holidays: List[str] = None, working_hours: Tuple[float, float] = None) -> None:
+        self._busdaycal = np.busdaycalendar(
+            weekmask=weekmask, holidays=[] if holidays == None else holidays)
+        if working_hours != None:
+            start, end = working_hours
+            if not 0 <= start < end <= 24:
+                raise ValueError(
+                    "working_hours must be a (start, end) tuple of hours within a day. Got: {}".format(working_hours))
+            working_hours = (start, end)
+        self._working_hours = working_hours
+        # An anchor day (days since the epoch) and a table with the number of business days
+        # between the anchor and each day after it. Grown as dates outside of it are seen.
+        self._offsets = None
+
+    def __reduce__(self):
+        # numpy calendars can't be pickled so we rebuild from the settings.
+        weekmask = ''.join('1' if d else '0' for d in self.weekmask)
+        holidays = [str(d) for d in self.holidays]
+        return (BusinessCalendar, (weekmask, holidays, self._working_hours))
+
+    @property
+    def busdaycalendar(self) -> np.busdaycalendar:
+        """
+        numpy.busdaycalendar: `busdaycalendar`
+            The prebuilt numpy calendar.
+        """
+        return self._busdaycal
+
+    @property
+    def weekmask(self) -> np.ndarray:
+        """
+        numpy.ndarray: `weekmask`
+            A boolean array of the working days of the week, starting with Monday.
+        """
+        return self._busdaycal.weekmask
+
+    @property
+    def holidays(self) -> np.ndarray:
+        """
+        numpy.ndarray: `holidays`
+            The holidays in this calendar.
+        """
+        return self._busdaycal.holidays
+
+    @property
+    def working_hours(self) -> Tuple[float, float]:
+        """
+        Tuple[float, float]: `working_hours`
+            The (start, end) hours of the working day or None if whole days are counted.
+        """
+        return self._working_hours
+
+    def _day_offsets(self, days: np.ndarray) -> np.ndarray:
+        """The number of business days between the epoch and each of days (as days since the epoch)."""
+        if not len(days):
+            return np.zeros(0, dtype=np.int64)
+        lo, hi = int(days.min()), int(days.max())
+        offsets = self._offsets
+        if offsets == None or lo < offsets[0] or hi + 1 > offsets[0] + len(offsets[1]) - 1:
+            if offsets != None:
+                lo, hi = min(lo, offsets[0]), max(hi, offsets[0] + len(offsets[1]) - 2)
+            # Pad by a year either side so nearby dates don't need the table to grow again.
+            anchor = lo - 366
+            span = np.arange(anchor, hi + 368).astype('datetime64[D]')
+            is_busday = np.is_busday(span, busdaycal=self._busdaycal)
+            # Count from the epoch rather than the anchor so offsets looked up before the table
+            # grows can still be compared with ones looked up after.
+            base = np.busday_count(np.datetime64(0, 'D'), span[0], busdaycal=self._busdaycal)
+            offsets = (anchor, np.concatenate(
+                ([0], np.cumsum(is_busday, dtype=np.int64))) + base)
+            self._offsets = offsets
+        return offsets[1][days - offsets[0]]
+
+    def busday_count(self, days_a: np.ndarray, days_b: np.ndarray) -> np.ndarray:
+        """Vectorised equivalent of ``numpy.busday_count`` for this calendar.
+
+        Args:
+            days_a: Start days (anything that can be cast to ``datetime64[D]``)
+            days_b: End days
+
+        Returns:
+            The number of business days in each [start, end) range (negative if the end is before the start).
+        """
+        return self._busday_count(np.asarray(days_a, dtype='datetime64[D]').astype(np.int64),
+                                  np.asarray(days_b, dtype='datetime64[D]').astype(np.int64))
+
+    def _busday_count(self, days_a: np.ndarray, days_b: np.ndarray) -> np.ndarray:
+        """``busday_count`` for days given as days since the epoch."""
+        # Like numpy, count the (end, start] range when the end is before the start.
+        shift = (days_b < days_a).astype(np.int64)
+        return self._day_offsets(days_b + shift) - self._day_offsets(days_a + shift)
+
+    def _working_time(self, wall: np.ndarray) -> np.ndarray:
+        """Working microseconds between the epoch and each wall clock time."""
+        start, end = (int(round(h * 3600 * _US_PER_SECOND))
+                      for h in self._working_hours)
+        days = wall // _US_PER_DAY
+        offsets = self._day_offsets(days)
+        is_busday = self._day_offsets(days + 1) - offsets
+        time_of_day = wall - days * _US_PER_DAY
+        return offsets * (end - start) + is_busday * np.clip(time_of_day - start, 0, end - start)
+
+    def durations(self, dates_a: List[datetime], dates_b: List[datetime] = None, interval="hours") -> np.ndarray:
+        """Business time between each pair of dates. See :py:func:`busday_durations`."""
+        if dates_b == None:
+            dates_b = [None] * len(dates_a)
+        if len(dates_a) != len(dates_b):
+            raise ValueError("dates_a and dates_b must be the same length. Got: {a} and {b}".format(
+                a=len(dates_a), b=len(dates_b)))
+        if interval not in ('years', 'days', 'hours', 'minutes', 'seconds', 'default'):
+            raise KeyError(interval)
+
+        dates_b = [datetime.now(a.tzinfo) if b == None else b for a, b in zip(dates_a, dates_b)]
+        utc_a, wall_a = _timestamp_arrays(dates_a)
+        utc_b, wall_b = _timestamp_arrays(dates_b)
+        return self._array_durations(utc_a, wall_a, utc_b, wall_b, interval)
+
+    def _array_durations(self, utc_a: np.ndarray, wall_a: np.ndarray, utc_b: np.ndarray, wall_b: np.ndarray, interval="hours") -> np.ndarray:
+        """Business time between pairs of dates given as UTC and wall clock microseconds since the epoch."""
+        if self._working_hours != None:
+            # Working hours are those of the timezone the span starts in.
+            wall_b = utc_b + (wall_a - utc_a)
+            duration = self._working_time(wall_b) - self._working_time(wall_a)
+        else:
+            full_duration = utc_b - utc_a
+            full_days = full_duration // _US_PER_DAY
+            bus_days = self._busday_count(
+                wall_a // _US_PER_DAY, wall_b // _US_PER_DAY)
+
+            duration = np.where(
+                (full_days == 2) & (bus_days == 1),
+                full_duration - 2 * _US_PER_DAY,
+                np.where(full_days > bus_days, full_duration - (full_days - bus_days) * _US_PER_DAY, full_duration))
+        duration_in_s = duration / _US_PER_SECOND
+
+        if interval == 'seconds':
+            return duration_in_s.astype(np.int64)
+        if interval != 'default':
+            seconds_per_interval = {
+                'years': 31556926,  # Seconds in a year=31556926.
+                'days': 86400,
+                'hours': 3600,
+                'minutes': 60,
+            }[interval]
+            return np.floor_divide(duration_in_s, seconds_per_interval).astype(np.int64)
+
+        # Use each remainder to calculate the next unit
+        y, rem = np.divmod(duration_in_s, 31556926)
+        d, rem = np.divmod(rem, 86400)
+        h, rem = np.divmod(rem, 3600)
+        m, rem = np.divmod(rem, 60)
+        s = np.floor(rem)
+        return np.array([
+            "Time between dates: {} years, {} days, {} hours, {} minutes and {} seconds".format(*map(int, parts))
+            for parts in zip(y, d, h, m, s)
+        ], dtype=object)
+
+
+# Monday to Friday with no holidays, which is what numpy gives us by default.
+DEFAULT_CALENDAR = BusinessCalendar()
+
+
+def busday_durations(dates_a: List[datetime], dates_b: List[datetime] = None, interval="hours", calendar: BusinessCalendar = None) -> np.ndarray:
+    """
+    Vectorised version of :py:func:`busday_duration`. Computes the duration between each pair of
+    dates in a single pass, which is much cheaper than calling :py:func:`busday_duration` once per pair
+    when working with the flow logs of a large :py:class:`JQLResult`.
+
+    Args:
+        dates_a:
+            First dates
+        dates_b (Optional):
+            Second dates. Any entry that is None (or all of them if no list is given) is taken to be
+            now, in the timezone of the corresponding first date.
+        interval (Optional):
+            One of ``"years"``, ``"days"``, ``"hours"``, ``"minutes"``, ``"seconds"`` or ``"default"``
+        calendar (Optional):
+            The :py:class:`BusinessCalendar` to count business days with. Defaults to Monday to Friday.
+
+    Returns:
+        An array with the duration between each pair of dates in the interval indicated (or hours if none is given)
+
+    """
+    if calendar == None:
+        calendar = DEFAULT_CALENDAR
+    return calendar.durations(dates_a, dates_b, interval)
+
+
+def busday_duration(date_a: datetime, date_b: datetime = None, interval="hours", calendar: BusinessCalendar = None) -> int:
     """
     Returns a duration as specified by variable interval. Only includes business days.
-    Functions, except totalDuration, returns[quotient, remainder]
+
+    This is a convenience wrapper around :py:func:`busday_durations` for a single pair of dates.
 
     Args:
         date_a:
             First date
-        date_a (Optional):
+        date_b (Optional):
             Second date
+        calendar (Optional):
+            The :py:class:`BusinessCalendar` to count business days with. Defaults to Monday to Friday.
 
     Returns:
         The duration between the two dates in the interval indicated (or hours if none is given)
 
     """
-    if date_b == None:
-        date_b = datetime.now(date_a.tzinfo)
-    full_duration = date_b - date_a
-    # pylint: disable=no-member
-    bus_days = np.busday_count(
-        date_a.date(), date_b.date()).item()
-    duration = full_duration
-
-    if full_duration.days == 2 and bus_days == 1:
-        duration = full_duration - timedelta(days=(2))
-    elif full_duration.days > bus_days:
-        duration = full_duration - \
-            timedelta(days=(full_duration.days - bus_days))
-
-    duration_in_s = duration.total_seconds()
-
-    def years():
-        return divmod(duration_in_s, 31556926)  # Seconds in a year=31556926.
-
-    def days(seconds=None):
-        # Seconds in a day = 86400
-        return divmod(seconds if seconds != None else duration_in_s, 86400)
-
-    def hours(seconds=None):
-        # Seconds in an hour = 3600
-        return divmod(seconds if seconds != None else duration_in_s, 3600)
-
-    def minutes(seconds=None):
-        # Seconds in a minute = 60
-        return divmod(seconds if seconds != None else duration_in_s, 60)
-
-    def seconds(seconds=None):
-        if seconds != None:
-            return divmod(seconds, 1)
-        return duration_in_s
-
-    def totalDuration():
-        y = years()
-        d = days(y[1])  # Use remainder to calculate next variable
-        h = hours(d[1])
-        m = minutes(h[1])
-        s = seconds(m[1])
-
-        return "Time between dates: {} years, {} days, {} hours, {} minutes and {} seconds".format(int(y[0]), int(d[0]), int(h[0]), int(m[0]), int(s[0]))
-
-    return {
-        'years': int(years()[0]),
-        'days': int(days()[0]),
-        'hours': int(hours()[0]),
-        'minutes': int(minutes()[0]),
-        'seconds': int(seconds()),
-        'default': totalDuration()
-    }[interval]
+    return busday_durations([date_a], [date_b], interval, calendar).tolist()[0]
+
+
+def _span_durations(spans: List[tuple], calendar: BusinessCalendar = None) -> List[int]:
+    """Business hours for each (start, end) pair in spans in one vectorised pass. Spans that are
+    None (e.g. an unresolved issue) come back as -1.
+    """
+    durations = [-1] * len(spans)
+    index = [i for i, span in enumerate(spans) if span != None]
+    if index:
+        computed = busday_durations(
+            [spans[i][0] for i in index], [spans[i][1] for i in index], calendar=calendar)
+        for i, duration in zip(index, computed.tolist()):
+            durations[i] = duration
+    return durations
 
 
 class FlowLog(list):
@@ -99,10 +356,80 @@ class FlowLog(list):
     This should faciliate reporting on cycle time and should help to surface bottlenecks, by allowing
     issues to be graphed with regard to the time they spend in each ``"state"`` of a workflow.
 
+    Args:
+        calendar (optional): The :py:class:`BusinessCalendar` durations in this log are measured against.
+
     """
 
+    def __init__(self, *args, calendar: BusinessCalendar = None) -> None:
+        super(FlowLog, self).__init__(*args)
+        self.calendar = DEFAULT_CALENDAR if calendar == None else calendar
+
+    @classmethod
+    def from_changelog(cls, histories: List[object], created: datetime = None, calendar: BusinessCalendar = None) -> 'FlowLog':
+        """Build a flow log from the histories of an issue's changelog.
+
+        Every status change in the histories becomes an entry in the log. The duration of each one is the
+        time until the next status change (or until now for the latest one) and the entries are ordered
+        once, after they have all been collected, rather than on every append.
+
+        Args:
+            histories: The changelog histories of a JIRA issue, as returned by the server (newest first).
+            created (optional): When the issue was created. If given the log starts with a ``"Created"`` entry.
+            calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+
+        Returns:
+            FlowLog: A new flow log.
+        """
+        entries = []
+        if created != None:
+            entries.append(cls._validate(dict(entered_at=created, state="Created")))
+
+        transitions = []
+        try:
+            for history in reversed(histories):
+                for item in history.items:
+                    if item.field == 'status':
+                        transitions.append(cls._validate(
+                            dict(
+                                entered_at=parse_jira_timestamp(history.created),
+                                state=item.toString
+                            )
+                        ))
+        except AttributeError:
+            pass
+
+        # Each transition lasts until the next one, or until now for the latest.
+        if transitions:
+            entered = [t['entered_at'] for t in transitions]
+            durations = busday_durations(entered, entered[1:] + [None], calendar=calendar)
+            for transition, duration in zip(transitions, durations.tolist()):
+                transition['duration'] = duration
+            entries.extend(transitions)
+
+        # sort is stable so entries entered at the same time keep their changelog order.
+        entries.sort(key=itemgetter('entered_at'))
+        return cls(entries, calendar=calendar)
+
+    @staticmethod
+    def _validate(value: dict) -> dict:
+        """Check a flow log entry has the keys we need and normalise its state to a string."""
+        try:
+            entered_at = value['entered_at']
+            value['state'] = str(value['state'])
+        except (KeyError, TypeError):
+            raise TypeError(
+                "Flow log items must have a 'entered_at' datetime and a 'state' string. Got: {value}".format(value=value))
+
+        if not isinstance(entered_at, datetime):
+            raise TypeError(
+                "Flow log items must have a entered_at datetime. Got: {val_type} / {val}".format(
+                    val_type=type(entered_at), val=entered_at))
+        return value
+
     def append(self, value: dict) -> None:
-        """Add items to the list.
+        """Add items to the list. Items are inserted in ``"entered_at"`` order, after any items
+        entered at the same time.
 
         Args:
             value (dict): Must contain an ``"entered_at"`` and ``"state key"``.
@@ -113,27 +440,32 @@ class FlowLog(list):
         Raises:
             TypeError: Flow log items must have a 'entered_at' datetime and a 'state' string.
         """
-        try:
-            ('entered_at', 'state') in value.keys()
-        except AttributeError:
-            raise TypeError(
-                "Flow log items must have a 'entered_at' datetime and a 'state' string. Got: {value}".format(value=value))
-
+        value = self._validate(value)
         entered_at = value['entered_at']
-        try:
-            datetime.now(entered_at.tzinfo) - entered_at
-        except (AttributeError, TypeError) as e:
-            msgvars = dict(
-                val_type=type(entered_at),
-                val=entered_at,
-                exc=str(e)
-            )
-            raise TypeError(
-                "Flow log items must have a entered_at datetime. Got: {val_type} / {val}, \n Exception: {exc}".format(**msgvars))
 
-        value[u'state'] = str(value['state'])
-        super(FlowLog, self).append(value)
-        self.sort(key=lambda l: l['entered_at'])
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if entered_at < self[mid]['entered_at']:
+                hi = mid
+            else:
+                lo = mid + 1
+        self.insert(lo, value)
+
+    def last_entered_at(self, state: str) -> datetime:
+        """The last time the issue entered a given state.
+
+        Args:
+            state: The name of the state.
+
+        Returns:
+            The ``"entered_at"`` date of the last entry for the state or None if the issue never entered it.
+        """
+        entered_at = None
+        for log in self:
+            if log['state'] == state:
+                entered_at = log['entered_at']
+        return entered_at
 
     def as_dict(self) -> Dict[str, str]:
         log_as_dic = {}
@@ -144,7 +476,677 @@ class FlowLog(list):
         return log_as_dic
 
 
-class JiraIssue(dict):
+class StatusTable:
+    """Interns status names as small integer codes.
+
+    A :py:class:`CompactFlowLog` stores the code of each state rather than its name, so a single table
+    shared by every log means each status name is only held in memory once.
+    """
+
+    def __init__(self) -> None:
+        self._codes: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __reduce__(self):
+        return (StatusTable, ())
+
+    def code(self, name: str) -> int:
+        """The code for a status name, adding it to the table if it is new.
+
+        Args:
+            name: A status name.
+
+        Returns:
+            The code for the status.
+        """
+        name = str(name)
+        try:
+            return self._codes[name]
+        except KeyError:
+            with self._lock:
+                if name not in self._codes:
+                    self._codes[name] = len(self._names)
+                    self._names.append(name)
+                return self._codes[name]
+
+    def lookup(self, name: str) -> int:
+        """The code for a status name or -1 if the name has never been seen."""
+        return self._codes.get(str(name), -1)
+
+    def name(self, code: int) -> str:
+        """The status name for a code."""
+        return self._names[code]
+
+    @property
+    def names(self) -> List[str]:
+        """
+        List[str]: `names`
+            All status names in the table, in code order.
+        """
+        return list(self._names)
+
+
+# The table shared by all compact flow logs unless another one is given.
+STATUS_TABLE = StatusTable()
+
+_COMPACT_FLOW_LOG_DTYPE = np.dtype([
+    ('entered_at', np.int64),   # Microseconds since the epoch (UTC)
+    ('utc_offset', np.int32),   # Seconds east of UTC of the original timestamp
+    ('state', np.int32),        # Code in the status table
+    ('duration', np.int64),
+])
+# Marks entries that have no duration (e.g. the "Created" entry) or timestamps that had no timezone.
+_NO_DURATION = np.iinfo(np.int64).min
+_NAIVE = np.iinfo(np.int32).min
+_TIMEZONES: Dict[int, timezone] = {}
+
+
+def _entry_datetime(entered_at: int, utc_offset: int) -> datetime:
+    """Turn a compact timestamp back in to a datetime."""
+    if utc_offset == _NAIVE:
+        return datetime.fromtimestamp(entered_at / _US_PER_SECOND, timezone.utc).replace(tzinfo=None)
+    tz = _TIMEZONES.get(utc_offset)
+    if tz == None:
+        tz = _TIMEZONES.setdefault(
+            utc_offset, timezone(timedelta(seconds=utc_offset)))
+    # Microseconds since the epoch fit in a float with room to spare, so this round trips exactly.
+    return datetime.fromtimestamp(entered_at / _US_PER_SECOND, tz)
+
+
+class CompactFlowLog(Sequence):
+    """An array backed alternative to :py:class:`FlowLog`.
+
+    Rather than a list of dictionaries, the log is a single numpy structured array holding, for each
+    entry, the time it was entered at as microseconds since the epoch, the state as a code in a shared
+    :py:class:`StatusTable` and the duration as an integer. This takes a fraction of the memory of a
+    :py:class:`FlowLog`, and looking up when an issue entered a state doesn't touch any Python objects.
+
+    For backwards compatibility a compact log still behaves as a read only list of flow log dictionaries
+    (with the same ``"entered_at"``, ``"state"`` and ``"duration"`` keys). The dictionaries are built
+    when they are accessed; use ``to_flow_log`` to get a regular :py:class:`FlowLog`.
+
+    Args:
+        entries (optional): A structured array of entries, ordered by ``"entered_at"``.
+        calendar (optional): The :py:class:`BusinessCalendar` durations in this log are measured against.
+        status_table (optional): The :py:class:`StatusTable` state codes refer to.
+    """
+
+    __slots__ = ('_entries', 'calendar', 'status_table')
+
+    def __init__(self, entries: np.ndarray = None, calendar: BusinessCalendar = None, status_table: StatusTable = None) -> None:
+        self._entries = np.zeros(
+            0, dtype=_COMPACT_FLOW_LOG_DTYPE) if entries is None else entries
+        self.calendar = DEFAULT_CALENDAR if calendar == None else calendar
+        self.status_table = STATUS_TABLE if status_table == None else status_table
+
+    def __getstate__(self):
+        # Codes only mean something with the table they came from so pickle the names instead.
+        states = [self.status_table.name(c) for c in self._entries['state'].tolist()]
+        return (self._entries, states, self.calendar)
+
+    def __setstate__(self, state):
+        entries, states, calendar = state
+        self.__init__(entries.copy(), calendar)
+        self._entries['state'] = [self.status_table.code(s) for s in states]
+
+    @classmethod
+    def from_flow_log(cls, flow_log: List[dict], calendar: BusinessCalendar = None, status_table: StatusTable = None) -> 'CompactFlowLog':
+        """Build a compact log from a :py:class:`FlowLog` (or any list of flow log dictionaries).
+
+        Args:
+            flow_log: The entries, ordered by ``"entered_at"``.
+            calendar (optional): The :py:class:`BusinessCalendar` durations are measured against.
+                Defaults to the calendar of flow_log.
+            status_table (optional): The :py:class:`StatusTable` to store states in.
+
+        Returns:
+            CompactFlowLog: A new compact flow log.
+        """
+        if calendar == None:
+            calendar = getattr(flow_log, 'calendar', None)
+        log = cls(calendar=calendar, status_table=status_table)
+        log._entries = log._to_entries(flow_log)
+        return log
+
+    @classmethod
+    def from_changelog(cls, histories: List[object], created: datetime = None, calendar: BusinessCalendar = None, status_table: StatusTable = None) -> 'CompactFlowLog':
+        """Build a compact log from the histories of an issue's changelog. See ``FlowLog.from_changelog``.
+
+        Returns:
+            CompactFlowLog: A new compact flow log.
+        """
+        return cls.from_flow_log(FlowLog.from_changelog(histories, created, calendar), calendar, status_table)
+
+    def _to_entries(self, values: List[dict]) -> np.ndarray:
+        values = [FlowLog._validate(v) for v in values]
+        entries = np.zeros(len(values), dtype=_COMPACT_FLOW_LOG_DTYPE)
+        utc, wall = _timestamp_arrays([v['entered_at'] for v in values])
+        entries['entered_at'] = utc
+        entries['utc_offset'] = (wall - utc) // _US_PER_SECOND
+        entries['utc_offset'][[v['entered_at'].tzinfo == None for v in values]] = _NAIVE
+        entries['state'] = [self.status_table.code(v['state']) for v in values]
+        entries['duration'] = [v.get('duration', _NO_DURATION) for v in values]
+        return entries
+
+    def _to_dict(self, entry: np.void) -> dict:
+        entered_at, utc_offset, state, duration = entry.tolist()
+        value = dict(
+            entered_at=_entry_datetime(entered_at, utc_offset),
+            state=self.status_table.name(state)
+        )
+        if duration != _NO_DURATION:
+            value['duration'] = duration
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._to_dict(e) for e in self._entries[index]]
+        return self._to_dict(self._entries[index])
+
+    def __iter__(self):
+        for entry in self._entries:
+            yield self._to_dict(entry)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactFlowLog):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return 'CompactFlowLog({})'.format(list(self))
+
+    @property
+    def entries(self) -> np.ndarray:
+        """
+        numpy.ndarray: `entries`
+            The structured array backing this log with ``"entered_at"``, ``"utc_offset"``, ``"state"`` and
+            ``"duration"`` fields.
+        """
+        return self._entries
+
+    def append(self, value: dict) -> None:
+        """Add an item to the log, after any items entered at the same time.
+
+        Args:
+            value (dict): Must contain an ``"entered_at"`` and ``"state key"``.
+
+        Raises:
+            TypeError: Flow log items must have a 'entered_at' datetime and a 'state' string.
+        """
+        entry = self._to_entries([value])
+        index = np.searchsorted(
+            self._entries['entered_at'], entry['entered_at'][0], side='right')
+        self._entries = np.insert(self._entries, index, entry)
+
+    def last_entered_at(self, state: str) -> datetime:
+        """The last time the issue entered a given state.
+
+        Args:
+            state: The name of the state.
+
+        Returns:
+            The ``"entered_at"`` date of the last entry for the state or None if the issue never entered it.
+        """
+        # For logs of this size a list search is quicker than going through numpy ufuncs.
+        states = self._entries['state'].tolist()
+        try:
+            index = len(states) - 1 - \
+                states[::-1].index(self.status_table.lookup(state))
+        except ValueError:
+            return None
+        entered_at, utc_offset = self._entries[index].item()[:2]
+        return _entry_datetime(entered_at, utc_offset)
+
+    def as_dict(self) -> Dict[str, int]:
+        """The total duration of each state in the log, in the order the states were first entered."""
+        states = self._entries['state']
+        codes, first, inverse = np.unique(
+            states, return_index=True, return_inverse=True)
+        durations = self._entries['duration']
+        totals = np.bincount(inverse.ravel(), weights=np.where(
+            durations == _NO_DURATION, 0, durations), minlength=len(codes)).astype(np.int64)
+        order = np.argsort(first, kind='stable')
+        return {self.status_table.name(c): t for c, t in zip(codes[order].tolist(), totals[order].tolist())}
+
+    def to_flow_log(self) -> FlowLog:
+        """A regular :py:class:`FlowLog` with the entries of this log."""
+        return FlowLog(self, calendar=self.calendar)
+
+
+def _flatten_flow_logs(logs: List[object], table: StatusTable) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten flow logs (where None is an empty log) into a single array of compact entries.
+
+    Args:
+        logs: The flow logs, :py:class:`FlowLog` or :py:class:`CompactFlowLog` instances.
+        table: The :py:class:`StatusTable` for the state codes of the entries.
+
+    Returns:
+        The entries and the offset of each log's first entry, followed by the number of entries.
+    """
+    # Convert the entries of every regular flow log in one go, it's much quicker than a log at a time.
+    plain = CompactFlowLog.from_flow_log([e for log in logs if not isinstance(log, CompactFlowLog) for e in log or []],
+                                         status_table=table).entries
+    position = 0
+    lookups: Dict[int, np.ndarray] = {}
+    entries = []
+    for log in logs:
+        if isinstance(log, CompactFlowLog):
+            # Move the codes over to the table we were given.
+            lookup = lookups.get(id(log.status_table))
+            if lookup is None or len(lookup) < len(log.status_table):
+                lookup = lookups[id(log.status_table)] = np.array(
+                    [table.code(n) for n in log.status_table.names], dtype=np.int32)
+            log_entries = log.entries.copy()
+            log_entries['state'] = lookup[log_entries['state']]
+        else:
+            log_entries = plain[position:position + len(log or [])]
+            position += len(log_entries)
+        entries.append(log_entries)
+
+    offsets = np.zeros(len(logs) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in entries], out=offsets[1:])
+    flat = np.concatenate(entries) if entries else np.zeros(
+        0, dtype=_COMPACT_FLOW_LOG_DTYPE)
+    return flat, offsets
+
+
+_FLOW_LOG_RECORD_DTYPE = np.dtype([
+    ('issue', np.int64),        # The Jira id of the issue
+    ('entered_at', np.int64),   # Microseconds since the epoch (UTC)
+    ('utc_offset', np.int32),   # Seconds east of UTC of the original timestamp
+    ('state', np.int32),        # Code in the store's status table
+    ('duration', np.int64),
+])
+_FLOW_LOG_INDEX_DTYPE = np.dtype([
+    ('issue', np.int64),
+    ('start', np.int64),        # Position of the issue's first record
+    ('count', np.int64),
+    ('resolved_at', np.int64),  # The issue's resolution date, in microseconds since the epoch (UTC)
+    ('resolved_offset', np.int32),  # and seconds east of UTC, or _NO_DURATION and 0 if it had none
+])
+
+
+class FlowLogStore:
+    """An append only file of flow log entries, for analysing more history than fits in memory.
+
+    The entries of every stored flow log are fixed width records (the issue id, when the state was entered,
+    the state and the duration) one after the other in a single file, which is memory mapped for reading.
+    A second file indexes where each issue's records start, along with its resolution date. Storing the flow log of an issue again appends
+    the new log and points the index at it, so nothing is ever rewritten. Both files are only appended to,
+    and a record is only indexed once it has been written, so a store is never left half updated.
+
+    ``flow_log`` reads the log of a single issue. ``last_entered_at``, ``lead_times`` and ``cycle_times``
+    work across every issue in the store a chunk of records at a time, so they run in constant memory
+    however many years of history the store holds.
+
+    Args:
+        path: The directory the store is kept in. It is created if it doesn't exist.
+        calendar (optional): The :py:class:`BusinessCalendar` to measure lead and cycle times against, and
+            to give the flow logs read from the store.
+
+    Example usage:
+
+        >>> from engineeringmetrics.adapters import FlowLogStore
+        >>> store = FlowLogStore('~/.engineeringmetrics/flow_logs')
+        >>> for page in jm.iter_jql('project = "INT"', pages=True):
+        ...     store.extend(page)
+        >>> issue_ids, cycle_times = store.cycle_times()
+    """
+
+    # The number of records read at a time by the methods that look at the whole store.
+    __CHUNK_RECORDS__ = 1 << 20
+
+    def __init__(self, path: str, calendar: BusinessCalendar = None) -> None:
+        path = os.path.expanduser(str(path))
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self.calendar = DEFAULT_CALENDAR if calendar == None else calendar
+        self._lock = threading.Lock()
+
+        self._status_table = StatusTable()
+        states_path = os.path.join(path, 'states.jsonl')
+        if os.path.exists(states_path):
+            with open(states_path, encoding='utf-8') as f:
+                for line in f:
+                    if line.endswith('\n'):
+                        self._status_table.code(json.loads(line))
+        self._saved_states = len(self._status_table)
+        self._state_codes = None
+
+        # Anything after the last whole record was cut short by a crash and is dropped.
+        self._records_path = os.path.join(path, 'records.bin')
+        self._size = self._truncate(
+            self._records_path, _FLOW_LOG_RECORD_DTYPE.itemsize)
+        index_path = os.path.join(path, 'index.bin')
+        self._truncate(index_path, _FLOW_LOG_INDEX_DTYPE.itemsize)
+
+        self._records_file = open(self._records_path, 'ab')
+        self._index_file = open(index_path, 'ab')
+        self._states_file = open(states_path, 'a', encoding='utf-8')
+        self._index = self._latest_runs(np.fromfile(
+            index_path, dtype=_FLOW_LOG_INDEX_DTYPE))
+        self._appended: Dict[int, Tuple[int, int]] = {}
+        self._records = None
+
+    @staticmethod
+    def _truncate(path: str, itemsize: int) -> int:
+        """Cut a file of records back to a whole number of them, returning how many there are."""
+        if not os.path.exists(path):
+            return 0
+        size = os.path.getsize(path)
+        if size % itemsize:
+            os.truncate(path, size - size % itemsize)
+        return size // itemsize
+
+    @staticmethod
+    def _latest_runs(index: np.ndarray) -> np.ndarray:
+        """The last run of records written for each issue in an index, ordered by issue id."""
+        latest = index[::-1]
+        _, first = np.unique(latest['issue'], return_index=True)
+        return latest[first]
+
+    def _runs(self) -> np.ndarray:
+        """The current run of records of every issue, ordered by issue id."""
+        if self._appended:
+            appended = np.array([(issue,) + run for issue, run in self._appended.items()],
+                                dtype=_FLOW_LOG_INDEX_DTYPE)
+            self._index = self._latest_runs(
+                np.concatenate([self._index, appended]))
+            self._appended = {}
+        return self._index
+
+    def _run(self, issue_id: int) -> Tuple[int, int, int, int]:
+        """The start and number of records of an issue and its resolution date, or None if it isn't in
+        the store.
+        """
+        run = self._appended.get(issue_id)
+        if run != None:
+            return run
+        i = np.searchsorted(self._index['issue'], issue_id)
+        if i < len(self._index) and self._index['issue'][i] == issue_id:
+            return tuple(self._index[i].tolist()[1:])
+        return None
+
+    def _mapped_records(self) -> np.ndarray:
+        """The records file memory mapped, read only."""
+        if self._records is None or len(self._records) < self._size:
+            self._records = np.memmap(self._records_path, dtype=_FLOW_LOG_RECORD_DTYPE, mode='r',
+                                      shape=(self._size,)) if self._size else np.zeros(0, dtype=_FLOW_LOG_RECORD_DTYPE)
+        return self._records
+
+    def _status_codes(self) -> np.ndarray:
+        """The code in the shared ``STATUS_TABLE`` of each of the store's state codes."""
+        if self._state_codes is None or len(self._state_codes) < len(self._status_table):
+            self._state_codes = np.array(
+                [STATUS_TABLE.code(s) for s in self._status_table.names], dtype=np.int32)
+        return self._state_codes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._runs())
+
+    def __contains__(self, issue_id: object) -> bool:
+        with self._lock:
+            return self._run(int(issue_id)) != None
+
+    @property
+    def path(self) -> str:
+        """
+        str: `path`
+            The directory the store is kept in.
+        """
+        return self._path
+
+    @property
+    def issue_ids(self) -> np.ndarray:
+        """
+        numpy.ndarray: `issue_ids`
+            The ids of the issues in the store, in order.
+        """
+        with self._lock:
+            return self._runs()['issue'].copy()
+
+    def append(self, issue_id: object, flow_log: List[dict], resolution_date: datetime = None) -> None:
+        """Store the flow log of an issue, replacing any log already stored for it.
+
+        Args:
+            issue_id: The Jira id of the issue (its ``id``, not its key).
+            flow_log: A :py:class:`FlowLog` or :py:class:`CompactFlowLog`.
+            resolution_date (optional): The resolution date of the issue, if it has one. Cycle times are
+                measured to it, as ``calculate_cycle_time`` does.
+        """
+        self._write([int(issue_id)], [flow_log], [resolution_date])
+
+    def extend(self, issues: List['JiraIssue']) -> None:
+        """Store the flow logs of a list of issues, e.g. a :py:class:`JQLResult`, in one write.
+
+        Issues whose flow log and resolution date are already in the store unchanged are skipped, so
+        storing the same issues again doesn't grow the store.
+
+        Args:
+            issues: :py:class:`JiraIssue` instances.
+        """
+        issues = list(issues)
+        self._write([int(issue.id) for issue in issues],
+                    [issue.flow_log for issue in issues],
+                    [issue.resolution_date for issue in issues])
+
+    def _write(self, issue_ids: List[int], flow_logs: List[object], resolution_dates: List[datetime]) -> None:
+        # Unresolved issues have a resolution date of '' (or None if it wasn't fetched).
+        resolved = [(_NO_DURATION, 0)] * len(issue_ids)
+        dated = [i for i, date in enumerate(resolution_dates) if date]
+        if dated:
+            utc, wall = _timestamp_arrays([resolution_dates[i] for i in dated])
+            for i, at, offset in zip(dated, utc.tolist(), ((wall - utc) // _US_PER_SECOND).tolist()):
+                resolved[i] = (at, offset)
+        with self._lock:
+            entries, offsets = _flatten_flow_logs(
+                flow_logs, self._status_table)
+            records = np.zeros(len(entries), dtype=_FLOW_LOG_RECORD_DTYPE)
+            for name in _COMPACT_FLOW_LOG_DTYPE.names:
+                records[name] = entries[name]
+            records['issue'] = np.repeat(issue_ids, np.diff(offsets))
+
+            stored = self._mapped_records()
+            keep = []
+            runs = []
+            position = self._size
+            for issue_id, start, end, resolution in zip(issue_ids, offsets[:-1].tolist(), offsets[1:].tolist(), resolved):
+                run = self._run(issue_id)
+                if run != None and run[1] == end - start and run[2:] == resolution and np.array_equal(
+                        stored[run[0]:run[0] + run[1]], records[start:end]):
+                    continue
+                keep.append(records[start:end])
+                runs.append((issue_id, position, end - start) + resolution)
+                self._appended[issue_id] = (position, end - start) + resolution
+                position += end - start
+            if not runs:
+                return
+
+            # New state names first, then the records and last of all the index that points at them.
+            for name in self._status_table.names[self._saved_states:]:
+                self._states_file.write(json.dumps(name) + '\n')
+            self._saved_states = len(self._status_table)
+            self._states_file.flush()
+            self._records_file.write(np.concatenate(keep).tobytes())
+            self._records_file.flush()
+            self._index_file.write(
+                np.array(runs, dtype=_FLOW_LOG_INDEX_DTYPE).tobytes())
+            self._index_file.flush()
+            self._size = position
+
+    def flow_log(self, issue_id: object, compact: bool = True) -> object:
+        """Read the flow log of an issue from the store.
+
+        Args:
+            issue_id: The Jira id of the issue.
+            compact (optional): Return a :py:class:`CompactFlowLog`. Otherwise a :py:class:`FlowLog` is built.
+
+        Returns:
+            The flow log, measured against the calendar of the store.
+
+        Raises:
+            KeyError: The issue isn't in the store.
+        """
+        with self._lock:
+            run = self._run(int(issue_id))
+            if run == None:
+                raise KeyError(issue_id)
+            start, count = run[:2]
+            records = self._mapped_records()[start:start + count]
+            entries = np.zeros(count, dtype=_COMPACT_FLOW_LOG_DTYPE)
+            for name in _COMPACT_FLOW_LOG_DTYPE.names:
+                entries[name] = records[name]
+            entries['state'] = self._status_codes()[entries['state']]
+        flow_log = CompactFlowLog(entries, self.calendar)
+        return flow_log if compact else flow_log.to_flow_log()
+
+    def _last_positions(self, runs: np.ndarray, state: str) -> np.ndarray:
+        """The position of the last record of each run for a state, or -1 if it has none."""
+        last = np.full(len(runs), -1, dtype=np.int64)
+        code = self._status_table.lookup(state)
+        if code < 0 or not len(runs):
+            return last
+        order = np.argsort(runs['start'], kind='stable')
+        starts = runs['start'][order]
+        ends = starts + runs['count'][order]
+        records = self._mapped_records()
+        for lo in range(0, self._size, self.__CHUNK_RECORDS__):
+            positions = lo + \
+                np.flatnonzero(
+                    records['state'][lo:lo + self.__CHUNK_RECORDS__] == code)
+            # Records of older runs of an issue (or of nothing) aren't in any current run.
+            run = np.searchsorted(starts, positions, side='right') - 1
+            current = (run >= 0) & (positions < ends[np.maximum(run, 0)])
+            np.maximum.at(last, order[run[current]], positions[current])
+        return last
+
+    def _times(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """UTC and wall clock microseconds since the epoch of the records at some positions."""
+        records = self._mapped_records()[positions]
+        offsets = records['utc_offset'].astype(np.int64)
+        offsets[offsets == _NAIVE] = 0
+        return records['entered_at'], records['entered_at'] + offsets * _US_PER_SECOND
+
+    def last_entered_at(self, state: str) -> Tuple[np.ndarray, np.ndarray]:
+        """The last time each issue in the store entered a state, worked out across the whole store
+        without reading any flow logs in to memory. See ``FlowLog.last_entered_at``.
+
+        Args:
+            state: The name of the state.
+
+        Returns:
+            The issue ids, in order, and a UTC ``datetime64[us]`` array of when each entered the state, with
+            ``NaT`` for issues that never did.
+        """
+        with self._lock:
+            runs = self._runs()
+            last = self._last_positions(runs, state)
+            entered_at = np.full(len(runs), np.datetime64(
+                'NaT'), dtype='datetime64[us]')
+            found = last >= 0
+            entered_at[found] = self._mapped_records(
+            )['entered_at'][last[found]].astype('datetime64[us]')
+            return runs['issue'].copy(), entered_at
+
+    def _durations(self, runs: np.ndarray, begin: np.ndarray, end: np.ndarray, interval: str, resolved: bool = False) -> np.ndarray:
+        """Business time between pairs of record positions, -1 where there is no end. With ``resolved``
+        the durations of resolved issues run to their resolution date instead.
+        """
+        durations = np.full(len(runs), -1, dtype=np.int64)
+        has_date = runs['resolved_at'] != _NO_DURATION if resolved else np.zeros(len(runs), dtype=bool)
+        done = (end >= 0) | has_date
+        if done.any():
+            utc_a, wall_a = self._times(begin[done])
+            utc_b, wall_b = self._times(np.maximum(end[done], 0))
+            dated = has_date[done]
+            utc_b[dated] = runs['resolved_at'][done][dated]
+            wall_b[dated] = utc_b[dated] + \
+                runs['resolved_offset'][done][dated].astype(np.int64) * _US_PER_SECOND
+            durations[done] = self.calendar._array_durations(
+                utc_a, wall_a, utc_b, wall_b, interval)
+        return durations
+
+    def lead_times(self, resolution_status: str = 'Done', interval: str = 'hours') -> Tuple[np.ndarray, np.ndarray]:
+        """The lead time of every issue in the store, from the first entry of its flow log (when it was
+        created) to the last time it entered ``resolution_status``, whatever its resolution date. This
+        is ``calculate_lead_time`` with ``override=True``.
+
+        Args:
+            resolution_status (optional): The status that indicates the issue was resolved.
+            interval (optional): One of ``"days"``, ``"hours"``, ``"minutes"`` or ``"seconds"``.
+
+        Returns:
+            The issue ids, in order, and an ``int64`` array of their lead times, -1 for issues that weren't
+            resolved.
+        """
+        with self._lock:
+            runs = self._runs()
+            return runs['issue'].copy(), self._durations(
+                runs, runs['start'], self._last_positions(runs, resolution_status), interval)
+
+    def cycle_times(self, begin_status: str = 'In Progress', resolution_status: str = 'Done', interval: str = 'hours') -> Tuple[np.ndarray, np.ndarray]:
+        """The cycle time of every issue in the store, from the last time it entered ``begin_status`` (or
+        was created, if it never did) to its resolution date, or the last time it entered
+        ``resolution_status`` if it has none. This is ``calculate_cycle_time`` with ``override=True``.
+
+        Args:
+            begin_status (optional): The status that indicates work started on the issue.
+            resolution_status (optional): The status that indicates the issue was resolved.
+            interval (optional): One of ``"days"``, ``"hours"``, ``"minutes"`` or ``"seconds"``.
+
+        Returns:
+            The issue ids, in order, and an ``int64`` array of their cycle times, -1 for issues that weren't
+            resolved.
+        """
+        with self._lock:
+            runs = self._runs()
+            begin = self._last_positions(runs, begin_status)
+            begin = np.where(begin >= 0, begin, runs['start'])
+            return runs['issue'].copy(), self._durations(
+                runs, begin, self._last_positions(runs, resolution_status), interval, resolved=True)
+
+    def close(self) -> None:
+        """Close the files of the store."""
+        with self._lock:
+            self._records = None
+            for f in (self._records_file, self._index_file, self._states_file):
+                f.close()
+
+
+def _fetched_fields(fields: List[str], changelog: bool) -> frozenset:
+    """The Jira fields an issue was fetched with, including ``"changelog"`` if it was, or None if it
+    was fetched with all the fields the :py:class:`Jira` adapter normally asks for and its changelog.
+    """
+    if fields == None and changelog:
+        return None
+    return frozenset(Jira.__ISSUES_FIELDS__ if fields == None else fields).union(
+        ['changelog'] if changelog else [])
+
+
+def _detached(value: object) -> object:
+    """A copy of a mutable value that a filtered copy reads from its source issue, so changing the value
+    on one issue doesn't change it on the other. Anything else is returned as it is.
+    """
+    if isinstance(value, CompactFlowLog):
+        return CompactFlowLog(value.entries.copy(), value.calendar, value.status_table)
+    if isinstance(value, FlowLog):
+        return FlowLog([dict(entry) for entry in value], calendar=value.calendar)
+    if isinstance(value, (list, dict)):
+        return copy.deepcopy(value)
+    return value
+
+
+class JiraIssue(LazyDict):
     """Representation of issues from Jira.
 
     Attributes:
@@ -163,6 +1165,8 @@ class JiraIssue(dict):
             ``"timeZone"``
 
             where ``"self"`` is the URL to the user in Jira Cloud.
+        calendar (:py:class:`BusinessCalendar`):
+            The calendar used to work out durations for this issue.
         comments (List):
             A list of comments. Each comment of the list is a `dict` with the following keys:
 
@@ -187,7 +1191,8 @@ class JiraIssue(dict):
         fix_version (string):
             The latest fix version associated with this issue.
         flow_log (:py:class:`FlowLog`):
-            A list of status changes for the issue. See :py:class:`FlowLog` for more details.
+            A list of status changes for the issue. See :py:class:`FlowLog` for more details. If the issue
+            was created with ``compact_flow_log`` this is a :py:class:`CompactFlowLog`.
         id (string):
             The Jira Cloud id for this issue.
         issue_links (List):
@@ -253,132 +1258,329 @@ class JiraIssue(dict):
             The date the `lastComment` was created
     """
 
-    def __init__(self, issue: JIRA.issue) -> None:
+    def __init__(self, issue: JIRA.issue, calendar: BusinessCalendar = None, compact_flow_log: bool = False, lazy: bool = False, fields: List[str] = None, changelog: bool = True) -> None:
         """Init a JiraIssue.
 
         Args:
             issue: A JIRA issue instance
+            calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+            compact_flow_log (optional): Store the flow log as a :py:class:`CompactFlowLog`.
+            lazy (optional): Don't parse anything up front. Each attribute and dictionary entry is worked
+                out from the issue the first time it is used and then kept. Iterating over the dictionary
+                (or anything else that needs all of it, like ``keys()``, ``items()``, ``len()``, building
+                a DataFrame, copying or pickling) fills in every entry. See
+                :py:class:`engineeringmetrics.lazy.LazyDict`.
+            fields (optional): The Jira fields the issue was fetched with, if not all of the ones the
+                :py:class:`Jira` adapter normally asks for. Dictionary entries that need other fields are
+                left out and the attributes they would be worked out from are None.
+            changelog (optional): False if the issue was fetched without its changelog. The flow log then
+                only has the ``"Created"`` entry and the ``"leadTime"`` and ``"cycleTime"`` entries are
+                left out.
         """
-        try:
-            self['ttype'] = issue.fields.issuetype.name
-        except AttributeError:
-            self['ttype'] = "Ticket"
+        self.calendar = DEFAULT_CALENDAR if calendar == None else calendar
         self._issue = issue
-
-        if issue.fields.assignee:
-            self.assignee = issue.fields.assignee.raw
-            self['assigneeName'] = self.assignee['displayName']
-            self['assigneeEmail'] = self.assignee['emailAddress']
-
-        self.comments = list(
-            map(lambda c: c.raw, issue.fields.comment.comments))
-        if len(self.comments) > 0:
-            self['lastComment'] = self.comments[0]['body']
-            self['lastCommentDate'] = self.comments[0]['created']
-
-        self.created = parse(issue.fields.created)
-        self['created'] = self.created
-
-        self.description = issue.fields.description
-        self['description'] = self.description
+        self._compact_flow_log = compact_flow_log
+        self._lazy = lazy
+        self._fields = _fetched_fields(fields, changelog)
+        self._source = None
+        self._unloaded = set(self.__ATTRIBUTE_LOADERS__.values())
+        self._key_order = self.__KEY_ORDER__
+        self._pending = dict.fromkeys(self._key_order)
+        if not lazy:
+            for loader in list(self._unloaded):
+                self._load_attributes(loader)
+            self._materialize()
+
+    def _field(self, name: str, default: object = None) -> object:
+        """A field of the issue, or default if it wasn't fetched."""
+        return getattr(self._issue.fields, name, default)
+
+    def _load_fields(self) -> None:
+        """The attributes that are read straight off the issue."""
+        issue = self._issue
+        assignee = self._field('assignee')
+        if assignee:
+            self.assignee = assignee.raw
+
+        self.description = self._field('description')
 
         self.fix_version = None
-        if len(issue.fields.fixVersions) > 0:
-            self.fix_version = issue.fields.fixVersions[0]
-        self['fixVersion'] = self.fix_version
+        fix_versions = self._field('fixVersions', [])
+        if len(fix_versions) > 0:
+            self.fix_version = fix_versions[0]
 
         self.id = issue.id
-        self['id'] = self.id
-
         self.key = issue.key
-        self['key'] = self.key
-
-        self.project = issue.fields.project.key
-        self['project'] = self.project
-
-        self.project_name = issue.fields.project.name
-        self['projectName'] = self.project_name
+        project = self._field('project')
+        self.project = project.key if project else None
+        self.project_name = project.name if project else None
+        self.labels = self._field('labels', [])
+        priority = self._field('priority')
+        self.priority = priority.name if priority else None
+        self.resolution = self._field('resolution')
+        status = self._field('status')
+        self.status = status.raw if status else None
+        self.summary = self._field('summary')
+        self.url = issue.permalink()
 
-        self.labels = issue.fields.labels
-        self['labels'] = self.labels
+        parent = self._field('parent')
+        self.parent = parent.key if parent else parent
 
-        self.priority = issue.fields.priority.name
-        self['priority'] = self.priority
+    def _load_comments(self) -> None:
+        comment = self._field('comment')
+        self.comments = list(
+            map(lambda c: c.raw, comment.comments)) if comment else []
 
-        self.resolution = issue.fields.resolution
-        self['resolution'] = self.resolution
-        self.resolution_date = parse(
-            issue.fields.resolutiondate) if issue.fields.resolutiondate else ''
-        self['resolutionDate'] = self.resolution_date
+    def _load_created(self) -> None:
+        created = self._field('created')
+        self.created = parse_jira_timestamp(created) if created else None
 
-        self.status = issue.fields.status.raw
-        self['status'] = self.status['name']
+    def _load_resolution_date(self) -> None:
+        resolution_date = self._field('resolutiondate')
+        self.resolution_date = parse_jira_timestamp(
+            resolution_date) if resolution_date else ''
 
-        self.summary = issue.fields.summary
-        self['summary'] = self.summary
+    def _load_updated_at(self) -> None:
+        updated = self._field('updated')
+        self.updated_at = parse_jira_timestamp(updated) if updated else None
 
-        self.url = issue.permalink()
-        self['url'] = self.url
+    def _load_issue_links(self) -> None:
+        self.issue_links = []
+        for link in self._field('issuelinks', []):
+            if getattr(link, 'inwardIssue', None):
+                self.issue_links.append(link.inwardIssue.key)
 
-        self.updated_at = parse(issue.fields.updated)
-        self['updatedAt'] = self.updated_at
+    def _load_flow_log(self) -> None:
+        try:
+            histories = self._issue.changelog.histories
+        except AttributeError:
+            histories = []
+        flow_log_class = CompactFlowLog if self._compact_flow_log else FlowLog
+        self.flow_log = flow_log_class.from_changelog(
+            histories, self.created, self.calendar)
+
+    def _load_times(self) -> None:
+        if not self._has_fields('leadTime'):
+            # Without the dates and changelog they are worked out from, -1 would claim it is unresolved.
+            self.lead_time = self.cycle_time = None
+            return
+        # Lead and cycle time only need dates from the flow log so we can work both out in one go.
+        self.lead_time, self.cycle_time = _span_durations(
+            [self._lead_time_span(), self._cycle_time_span()], self.calendar)
+
+    # The method that sets each attribute worked out from the issue.
+    __ATTRIBUTE_LOADERS__ = {
+        'assignee': '_load_fields',
+        'description': '_load_fields',
+        'fix_version': '_load_fields',
+        'id': '_load_fields',
+        'key': '_load_fields',
+        'project': '_load_fields',
+        'project_name': '_load_fields',
+        'labels': '_load_fields',
+        'priority': '_load_fields',
+        'resolution': '_load_fields',
+        'status': '_load_fields',
+        'summary': '_load_fields',
+        'url': '_load_fields',
+        'parent': '_load_fields',
+        'comments': '_load_comments',
+        'created': '_load_created',
+        'resolution_date': '_load_resolution_date',
+        'updated_at': '_load_updated_at',
+        'issue_links': '_load_issue_links',
+        'flow_log': '_load_flow_log',
+        'lead_time': '_load_times',
+        'cycle_time': '_load_times',
+    }
+
+    def __getattr__(self, name: str) -> object:
+        # Only called for attributes that haven't been set, i.e. ones a lazy issue hasn't loaded yet,
+        # ones a filtered copy reads from the issue it was made from or ones an issue loaded from a
+        # snapshot hasn't read yet.
+        loader = JiraIssue.__ATTRIBUTE_LOADERS__.get(name)
+        if loader != None and self.__dict__.get('_source') != None:
+            value = getattr(self._source, name)
+            detached = _detached(value)
+            if detached is not value:
+                # Keep the copy so changes made to it stick.
+                self.__dict__[name] = detached
+            return detached
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot != None:
+            if name == '_pending':
+                # Issues in a snapshot share their state until an entry is used.
+                self._pending = dict.fromkeys(self._key_order)
+                return self._pending
+            if loader != None:
+                value = snapshot.attribute(name, self._row)
+                if value is not _MISSING:
+                    self.__dict__[name] = value
+                    return value
+        return super().__getattr__(name)
+
+    def _issue_type(self) -> str:
+        try:
+            return self._issue.fields.issuetype.name
+        except AttributeError:
+            return "Ticket"
 
-        # The following allows you to debug individual fields per
+    def _epic_link(self) -> str:
+        # The following allows you to debug individual fields per
         # https://stackoverflow.com/questions/30615846/python-and-jira-get-fields-from-specific-issue
         # for field_name in issue.raw['fields']:
         #    print("Field:", field_name, "Value:", issue.raw['fields'][field_name])
         # print("============================================================")
         # 10001 is old JIRA.  New JIRA has a whole new parent thing going on
-        if getattr(issue.fields, 'parent', None):
-            self['epiclink'] = issue.fields.parent.key
-            self['epicName'] = issue.fields.parent.fields.summary
-        else:
-            self['epiclink'] = issue.fields.customfield_10001
+        if getattr(self._issue.fields, 'parent', None):
+            return self._issue.fields.parent.key
+        return self._issue.fields.customfield_10001
+
+    def _epic_name(self) -> str:
+        if getattr(self._issue.fields, 'parent', None):
+            return self._issue.fields.parent.fields.summary
+        return _MISSING
+
+    # How to work out each dictionary entry, in the order they are added to the dictionary. Entries
+    # that are _MISSING are left out.
+    __KEY_LOADERS__ = {
+        'ttype': _issue_type,
+        'assigneeName': lambda self: self.assignee['displayName'] if getattr(self, 'assignee', None) else _MISSING,
+        'assigneeEmail': lambda self: self.assignee['emailAddress'] if getattr(self, 'assignee', None) else _MISSING,
+        'lastComment': lambda self: self.comments[0]['body'] if len(self.comments) > 0 else _MISSING,
+        'lastCommentDate': lambda self: self.comments[0]['created'] if len(self.comments) > 0 else _MISSING,
+        'created': lambda self: self.created,
+        'description': lambda self: self.description,
+        'fixVersion': lambda self: self.fix_version,
+        'id': lambda self: self.id,
+        'key': lambda self: self.key,
+        'project': lambda self: self.project,
+        'projectName': lambda self: self.project_name,
+        'labels': lambda self: self.labels,
+        'priority': lambda self: self.priority,
+        'resolution': lambda self: self.resolution,
+        'resolutionDate': lambda self: self.resolution_date,
+        'status': lambda self: self.status['name'],
+        'summary': lambda self: self.summary,
+        'url': lambda self: self.url,
+        'updatedAt': lambda self: self.updated_at,
+        'epiclink': _epic_link,
+        'epicName': _epic_name,
+        'issueLinks': lambda self: self.issue_links,
+        'leadTime': lambda self: self.lead_time,
+        'cycleTime': lambda self: self.cycle_time,
+    }
+    __KEY_ORDER__ = tuple(__KEY_LOADERS__)
+
+    # The Jira fields each dictionary entry is worked out from, where ``"changelog"`` is the expanded
+    # changelog. Only the id, key and url of an issue come with every search.
+    __KEY_FIELDS__ = {
+        'ttype': ('issuetype',),
+        'assigneeName': ('assignee',),
+        'assigneeEmail': ('assignee',),
+        'lastComment': ('comment',),
+        'lastCommentDate': ('comment',),
+        'created': ('created',),
+        'description': ('description',),
+        'fixVersion': ('fixVersions',),
+        'project': ('project',),
+        'projectName': ('project',),
+        'labels': ('labels',),
+        'priority': ('priority',),
+        'resolution': ('resolution',),
+        'resolutionDate': ('resolutiondate',),
+        'status': ('status',),
+        'summary': ('summary',),
+        'updatedAt': ('updated',),
+        'epiclink': ('parent', 'customfield_10001'),
+        'epicName': ('parent',),
+        'issueLinks': ('issuelinks',),
+        'leadTime': ('created', 'resolutiondate', 'changelog'),
+        'cycleTime': ('created', 'resolutiondate', 'changelog'),
+        'parent': ('parent',),
+    }
+
+    @classmethod
+    def jira_fields(cls, keys: List[str]) -> List[str]:
+        """The Jira fields needed to work out a set of dictionary entries.
 
-        self.issue_links = []
-        for link in issue.fields.issuelinks:
-            if getattr(link, 'inwardIssue', None):
-                self.issue_links.append(link.inwardIssue.key)
-        self['issueLinks'] = self.issue_links
+        Args:
+            keys: The dictionary keys, e.g. ``['status', 'leadTime']``. Anything that isn't one of the
+                keys of a JiraIssue is taken to be the name of a Jira field and passed straight through.
 
-        parent = getattr(issue.fields, 'parent', None)
-        self.parent = parent.key if parent else parent
+        Returns:
+            List[str]: The Jira fields, which always include ``"updated"`` and the fields of the entries
+            filtered copies always keep (see ``filtered_copy``). The changelog isn't a field and is asked
+            for separately.
+        """
+        fields = ['updated']
+        for key in cls.__PROTECTED_FIELDS__ + list(keys):
+            for field in cls.__KEY_FIELDS__.get(key, () if key in cls.__KEY_LOADERS__ else (key,)):
+                if field not in fields and field != 'changelog':
+                    fields.append(field)
+        return fields
+
+    def _has_fields(self, key: str) -> bool:
+        """Whether the issue was fetched with the fields a dictionary entry is worked out from."""
+        # Issues unpickled from before fields could be left out don't have _fields.
+        fields = self.__dict__.get('_fields')
+        return fields == None or all(field in fields for field in self.__KEY_FIELDS__.get(key, ()))
+
+    def _key_value(self, key: str) -> object:
+        """Work out a dictionary entry, or _MISSING if the issue doesn't have it."""
+        if not self._has_fields(key):
+            return _MISSING
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot != None:
+            return snapshot.entry(key, self._row)
+        if self._source == None:
+            return self.__KEY_LOADERS__[key](self)
+        if key in self._source:
+            return _detached(self._source[key])
+        # parent is only ever added to filtered copies.
+        if key == 'parent':
+            return self.parent
+        # Issues loaded from a snapshot have no Jira issue to work entries out from.
+        if key in self.__KEY_LOADERS__ and self._issue != None:
+            return self.__KEY_LOADERS__[key](self)
+        return _MISSING
+
+    # The attributes that take real work to parse, which a process pool works out for us.
+    __PARSED_ATTRIBUTES__ = ('created', 'resolution_date', 'updated_at',
+                             'flow_log', 'lead_time', 'cycle_time')
+
+    def _parsed_values(self) -> tuple:
+        """The values of ``__PARSED_ATTRIBUTES__``, ready to be sent back from a worker process.
+
+        The flow log is detached from the calendar so the calendar isn't pickled once per issue.
+        """
+        values = tuple(getattr(self, name)
+                       for name in self.__PARSED_ATTRIBUTES__)
+        values[3].calendar = None
+        return values
 
-        self.flow_log = FlowLog()
-        self.flow_log.append(
-            dict(
-                entered_at=self['created'],
-                state=str("Created")
-            )
-        )
-        try:
-            previous_item = None
-            for history in reversed(issue.changelog.histories):
-                for item in history.items:
-                    if item.field == 'status':
-                        new_log_item = dict(
-                            entered_at=parse(history.created),
-                            state=str(item.toString)
-                        )
-                        if previous_item != None:
-                            previous_item['duration'] = busday_duration(  # pylint: disable=unsupported-assignment-operation
-                                previous_item['entered_at'], new_log_item['entered_at'])  # pylint: disable=unsupported-assignment-operation, unsubscriptable-object
-                        previous_item = new_log_item
-                        self.flow_log.append(new_log_item)
-            if previous_item != None:
-                previous_item['duration'] = busday_duration(
-                    previous_item['entered_at'], datetime.now(previous_item['entered_at'].tzinfo))
-        except AttributeError:
-            pass
+    def _adopt_parsed_values(self, values: tuple) -> None:
+        """Take on the ``_parsed_values`` of the same issue parsed in another process."""
+        for name, value in zip(self.__PARSED_ATTRIBUTES__, values):
+            setattr(self, name, value)
+            self._unloaded.discard(self.__ATTRIBUTE_LOADERS__[name])
+        self.flow_log.calendar = self.calendar
 
-        self['leadTime'] = None
-        self.calculate_lead_time()
-        self.lead_time = self['leadTime']
+    def _lead_time_span(self, resolution_status: str = 'Done', override: bool = False) -> Tuple[datetime, datetime]:
+        """The dates lead time is measured between. See ``calculate_lead_time``.
 
-        # We do this after the flow log is built as cycleTime uses data from that log.
-        self['cycleTime'] = None
-        self.calculate_cycle_time()
-        self.cycle_time = self['cycleTime']
+        Returns:
+            A (start, end) tuple or None if the issue is not resolved.
+        """
+        if self.created == None:
+            return None
+        if self.resolution_date and not override:
+            return (self.created, self.resolution_date)
+
+        resolution_date = self.flow_log.last_entered_at(resolution_status)
+        if resolution_date != None:
+            return (self.created, resolution_date)
+        return None
 
     def calculate_lead_time(self, resolution_status: str = 'Done', override: bool = False) -> int:
         """Counts the number of business days an issue took to resolve. This is
@@ -396,21 +1598,29 @@ class JiraIssue(dict):
         Returns:
             Number of days to resolve issue or -1 if issue is not resolved.
         """
-        self['leadTime'] = -1
+        self['leadTime'] = _span_durations(
+            [self._lead_time_span(resolution_status, override)], self.calendar)[0]
+        return self['leadTime']
 
-        if self.resolution_date and not override:
-            self['leadTime'] = busday_duration(
-                self.created, self.resolution_date)
-        else:
-            resolution_date = None
-            for log in self.flow_log:
-                if log['state'] == resolution_status:
-                    resolution_date = log['entered_at']
-            if resolution_date != None:
-                self['leadTime'] = busday_duration(
-                    self.created, resolution_date)
+    def _cycle_time_span(self, begin_status: str = 'In Progress', resolution_status: str = 'Done', override: bool = False) -> Tuple[datetime, datetime]:
+        """The dates cycle time is measured between. See ``calculate_cycle_time``.
 
-        return self['leadTime']
+        Returns:
+            A (start, end) tuple or None if the issue is not resolved.
+        """
+        start_date = self.flow_log.last_entered_at(begin_status)
+        if start_date == None:
+            start_date = self.created
+
+        resolution_date = None
+        if self.resolution_date:
+            resolution_date = self.resolution_date
+        elif override:
+            resolution_date = self.flow_log.last_entered_at(resolution_status)
+
+        if start_date != None and resolution_date != None:
+            return (start_date, resolution_date)
+        return None
 
     def calculate_cycle_time(self, begin_status: str = 'In Progress', resolution_status: str = 'Done', override: bool = False) -> int:
         """Calculates the number of business days an issue took to resolve once work had begun. As a
@@ -432,63 +1642,377 @@ class JiraIssue(dict):
         Returns:
             Number of days to resolve issue or -1 if issue is not resolved.
         """
-        self['cycleTime'] = -1
+        self['cycleTime'] = _span_durations(
+            [self._cycle_time_span(begin_status, resolution_status, override)], self.calendar)[0]
+        return self['cycleTime']
 
-        start_date = None
-        for log in self.flow_log:
-            if log['state'] == begin_status:
-                start_date = log['entered_at']
-        if start_date == None:
-            start_date = self.created
+    __PROTECTED_FIELDS__ = ['key', 'ttype']
 
-        resolution_date = None
-        if self.resolution_date:
-            resolution_date = self.resolution_date
-        elif override:
-            for log in self.flow_log:
-                if log['state'] == resolution_status:
-                    resolution_date = log['entered_at']
+    def filtered_copy(self, fields_filter: List[str]) -> 'JiraIssue':
+        """Return a copy of this JiraIssue instance with only the set of fields defined in the fields_filter list.
 
-        if resolution_date != None:
-            self['cycleTime'] = busday_duration(start_date, resolution_date)
+        id and ttype are protected fields and cannot be removed by this method.
 
-        return self['cycleTime']
+        The copy is a view of this issue rather than a new parse of it: its attributes are those of this
+        issue and each of its dictionary entries is read from this issue the first time it is used.
+        Mutable values (the flow log, labels, comments and the like) are copied as they are read, so
+        setting or changing attributes or entries on the copy doesn't change this issue.
+
+        Args:
+            fields_filter:
+                List of field names to include in the filtered copy. Available fields are
+                ``"assignee"``, ``"created"``, ``"cycleTime"``, ``"description"``, ``"fixVersion"``, ``"fixVersion"``, ``"id"``, ``"key"``,
+                ``"labels"``, ``"leadTime"``, ``"parent"``, ``"priority"``, ``"resolution"``, ``"resolutiondate"``, ``"status"``, ``"summary"``, ``"ttype"``,
+                ``"url"``, ``"updated_at"``
+
+        Returns:
+            JiraIssue: A filtered copy of this issue.
+        """
+        if type(fields_filter) is list:
+            fields = set().union(self.__PROTECTED_FIELDS__, fields_filter)
+            keys = [k for k in self.__KEY_ORDER__ if k in fields]
+            keys.extend(k for k in fields_filter if k not in keys)
+        else:
+            keys = list(self.keys())
+
+        filtered = JiraIssue.__new__(JiraIssue)
+        filtered.calendar = self.calendar
+        filtered._issue = self._issue
+        filtered._compact_flow_log = self._compact_flow_log
+        filtered._lazy = self._lazy
+        filtered._fields = self._fields
+        filtered._source = self
+        filtered._unloaded = set()
+        filtered._key_order = tuple(keys)
+        filtered._pending = dict.fromkeys(keys)
+        if not self._lazy:
+            filtered._materialize()
+        return filtered
+
+
+def _encode_categories(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Dictionary encode values as integer codes and an array of categories (in the order first seen).
+    Missing values get the code -1.
+    """
+    categories: Dict[str, int] = {}
+    codes = np.fromiter((-1 if v == None else categories.setdefault(v, len(categories)) for v in values),
+                        dtype=np.int32, count=len(values))
+    return codes, np.array(list(categories), dtype=object)
+
+
+def _datetime64_column(dates: List[datetime]) -> np.ndarray:
+    """UTC datetime64 column for a list of dates, where anything that isn't a date becomes NaT."""
+    column = np.full(len(dates), np.datetime64('NaT'), dtype='datetime64[us]')
+    index = [i for i, d in enumerate(dates) if isinstance(d, datetime)]
+    if index:
+        column[index] = _timestamp_arrays(
+            [dates[i] for i in index])[0].astype('datetime64[us]')
+    return column
+
+
+class IssueColumns:
+    """A columnar copy of the most used fields of a set of :py:class:`JiraIssue` instances.
+
+    Each field is held in a typed numpy array, with one row per issue in the same order as the issues
+    the columns were built from. Dates are UTC ``datetime64[us]`` arrays with ``NaT`` for missing values,
+    lead and cycle times are ``int64`` and the string fields (priority, status and issue type) are
+    dictionary encoded as ``int32`` codes into an array of categories, with ``-1`` for missing values.
+
+    Columns are named after the corresponding :py:class:`JiraIssue` dictionary keys:
+
+        ``"key"``, ``"created"``, ``"resolutionDate"``, ``"leadTime"``, ``"cycleTime"``, ``"priority"``,
+        ``"status"`` and ``"ttype"``
+
+    Args:
+        issues: The issues to build the columns from.
+    """
+
+    __CATEGORICAL_FIELDS__ = ['priority', 'status', 'ttype']
+
+    def __init__(self, issues: List['JiraIssue']) -> None:
+        self.key = np.array([i.get('key') for i in issues], dtype=object)
+        self.created = _datetime64_column([i.get('created') for i in issues])
+        self.resolution_date = _datetime64_column(
+            [i.get('resolutionDate') for i in issues])
+        self.lead_time = np.array(
+            [i.get('leadTime', -1) for i in issues], dtype=np.int64)
+        self.cycle_time = np.array(
+            [i.get('cycleTime', -1) for i in issues], dtype=np.int64)
+        self.categories: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for field in self.__CATEGORICAL_FIELDS__:
+            self.codes[field], self.categories[field] = _encode_categories(
+                [i.get(field) for i in issues])
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    def to_numpy(self, decode: bool = True) -> Dict[str, np.ndarray]:
+        """The columns as a dictionary of numpy arrays keyed by column name.
+
+        Args:
+            decode (optional): If True the categorical columns are decoded to object arrays of strings.
+                Otherwise their integer codes are returned and the categories can be found in ``categories``.
+
+        Returns:
+            Dict[str, numpy.ndarray]: The columns. Apart from decoded categories these are the arrays backing
+            this store, not copies.
+        """
+        columns = {
+            'key': self.key,
+            'created': self.created,
+            'resolutionDate': self.resolution_date,
+            'leadTime': self.lead_time,
+            'cycleTime': self.cycle_time,
+        }
+        for field in self.__CATEGORICAL_FIELDS__:
+            codes = self.codes[field]
+            if decode:
+                # Index with a trailing None so missing values (-1) decode to None.
+                columns[field] = np.append(
+                    self.categories[field], None)[codes]
+            else:
+                columns[field] = codes
+        return columns
+
+    def to_dataframe(self) -> 'pandas.DataFrame':
+        """The columns as a pandas DataFrame. Dates are timezone aware (UTC) and the string fields are
+        pandas categoricals.
+
+        Returns:
+            pandas.DataFrame: A DataFrame with one row per issue.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "pandas is required to build a DataFrame. Install it with `pip install pandas`.")
+
+        columns = {
+            'key': self.key,
+            'created': pd.DatetimeIndex(self.created).tz_localize('UTC'),
+            'resolutionDate': pd.DatetimeIndex(self.resolution_date).tz_localize('UTC'),
+            'leadTime': self.lead_time,
+            'cycleTime': self.cycle_time,
+        }
+        for field in self.__CATEGORICAL_FIELDS__:
+            columns[field] = pd.Categorical.from_codes(
+                self.codes[field], categories=self.categories[field])
+        return pd.DataFrame(columns, copy=False)
+
+
+# The layout of the snapshots written by JQLResult.save, checked by JQLResult.load.
+_SNAPSHOT_VERSION = 1
+
+# What each value of a datetime or int column in a snapshot is.
+_SNAPSHOT_VALUE, _SNAPSHOT_NONE, _SNAPSHOT_EMPTY, _SNAPSHOT_ABSENT = range(4)
+
+
+def _snapshot_json(value: object) -> object:
+    """JSON for the values json doesn't know about: dates as ISO-8601 strings and Jira resources, like a
+    fix version or resolution, by name."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.integer):
+        return int(value)
+    name = getattr(value, 'name', None)
+    if isinstance(name, str):
+        return name
+    return str(value)
+
+
+def _snapshot_states(values: List[object]) -> np.ndarray:
+    return np.array([_SNAPSHOT_ABSENT if v is _MISSING else _SNAPSHOT_NONE if v is None else
+                     _SNAPSHOT_EMPTY if isinstance(v, str) else _SNAPSHOT_VALUE for v in values], dtype=np.uint8)
+
+
+def _snapshot_column(values: List[object]) -> Tuple[str, Dict[str, np.ndarray]]:
+    """Encode the values of an entry or attribute for every issue in a snapshot, where _MISSING marks
+    an issue without one.
 
-    __PROTECTED_FIELDS__ = ['key', 'ttype']
+    Returns:
+        The kind of column and its arrays. Dates are ``"datetime"`` columns of UTC microseconds and
+        offsets, whole numbers are ``"int"`` columns and anything else is a ``"json"`` column, with the
+        JSON of every value one after the other in a byte array.
+    """
+    present = [v for v in values if not (
+        v is _MISSING or v is None or isinstance(v, str) and v == '')]
+    if present and all(isinstance(v, datetime) for v in present):
+        index = [i for i, v in enumerate(values) if isinstance(v, datetime)]
+        utc, wall = _timestamp_arrays([values[i] for i in index])
+        entered_at = np.zeros(len(values), dtype=np.int64)
+        entered_at[index] = utc
+        utc_offset = np.zeros(len(values), dtype=np.int32)
+        utc_offset[index] = (wall - utc) // _US_PER_SECOND
+        utc_offset[[i for i in index if values[i].tzinfo == None]] = _NAIVE
+        return 'datetime', {'state': _snapshot_states(values), 'values': entered_at, 'utc_offset': utc_offset}
+
+    if present and all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) and
+                       -2**63 <= v < 2**63 for v in present):
+        numbers = np.array([0 if v is _MISSING or v is None or isinstance(v, str) else v for v in values],
+                           dtype=np.int64)
+        return 'int', {'state': _snapshot_states(values), 'values': numbers}
+
+    # An issue without a value has no bytes, as the JSON of any value has at least one.
+    encode = json.JSONEncoder(default=_snapshot_json,
+                              separators=(',', ':')).encode
+    encoded = [b'' if v is _MISSING else encode(v).encode('utf-8')
+               for v in values]
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return 'json', {'data': np.frombuffer(b''.join(encoded), dtype=np.uint8), 'offsets': offsets}
+
+
+def _calendar_settings(calendar: BusinessCalendar) -> list:
+    """The arguments that build a calendar, as JSON."""
+    weekmask, holidays, working_hours = calendar.__reduce__()[1]
+    return [weekmask, holidays, None if working_hours == None else list(working_hours)]
+
+
+class _Snapshot:
+    """A snapshot written by ``JQLResult.save``, opened for reading.
+
+    The arrays in the snapshot are memory mapped as they are first used and the issues built from it
+    decode their entries and attributes a value at a time, so opening a snapshot doesn't read more
+    than its metadata.
 
-    def filtered_copy(self, fields_filter: List[str]) -> 'JiraIssue':
-        """Return a copy of this JiraIssue instance with only the set of fields defined in the fields_filter list.
+    Args:
+        path: The snapshot directory.
+        calendar (optional): The calendar for the issues. Defaults to the one the snapshot was saved with.
+    """
 
-        id and ttype are protected fields and cannot be removed by this method.
+    def __init__(self, path: str, calendar: BusinessCalendar = None) -> None:
+        self._path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != _SNAPSHOT_VERSION:
+            raise ValueError("{} is not a snapshot this version of engineeringmetrics can read (version {}).".format(
+                path, self.meta.get('version')))
+        if calendar == None:
+            settings = self.meta['calendar']
+            calendar = DEFAULT_CALENDAR if settings == _calendar_settings(
+                DEFAULT_CALENDAR) else BusinessCalendar(*settings)
+        self.calendar = calendar
+        self._entries = {key: ('entry{}'.format(i), kind)
+                         for i, (key, kind) in enumerate(self.meta['entries'])}
+        self._attributes = {name: ('attribute.' + name, kind)
+                            for name, kind in self.meta['attributes']}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._state_codes = None
+
+    def __reduce__(self):
+        # Pickled issues from a snapshot open it again rather than copying the arrays.
+        return (_Snapshot, (self._path, self.calendar))
+
+    def __len__(self) -> int:
+        return self.meta['rows']
+
+    def _array(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            path = os.path.join(self._path, name + '.npy')
+            # Copy on write, so writing to a column (as calculate_lead_times does) doesn't change the file.
+            try:
+                array = np.load(path, mmap_mode='c')
+            except ValueError:
+                # Empty arrays can't be memory mapped.
+                array = np.load(path)
+            self._arrays[name] = array
+        return array
+
+    def _value(self, prefix: str, kind: str, row: int) -> object:
+        if kind == 'json':
+            offsets = self._array(prefix + '.offsets')
+            start, end = offsets[row], offsets[row + 1]
+            if start == end:
+                return _MISSING
+            return json.loads(self._array(prefix + '.data')[start:end].tobytes())
+        state = self._array(prefix + '.state')[row]
+        if state != _SNAPSHOT_VALUE:
+            return (None, '', _MISSING)[state - 1]
+        value = int(self._array(prefix + '.values')[row])
+        if kind == 'datetime':
+            return _entry_datetime(value, int(self._array(prefix + '.utc_offset')[row]))
+        return value
+
+    def entry(self, key: str, row: int) -> object:
+        """The dictionary entry of an issue, or _MISSING if it doesn't have it."""
+        column = self._entries.get(key)
+        return _MISSING if column == None else self._value(*column, row)
+
+    def attribute(self, name: str, row: int) -> object:
+        """An attribute of an issue, or _MISSING if it doesn't have it."""
+        if name == 'flow_log':
+            return self.flow_log(row)
+        column = self._attributes.get(name)
+        return _MISSING if column == None else self._value(*column, row)
+
+    def flow_log(self, row: int) -> object:
+        """The flow log of an issue."""
+        if self._state_codes is None:
+            self._state_codes = np.array(
+                [STATUS_TABLE.code(s) for s in self.meta['states']], dtype=np.int32)
+        offsets = self._array('flow_log.offsets')
+        entries = np.array(
+            self._array('flow_log.entries')[offsets[row]:offsets[row + 1]])
+        entries['state'] = self._state_codes[entries['state']]
+        flow_log = CompactFlowLog(entries, self.calendar)
+        return flow_log if self.meta['compact_flow_logs'] else flow_log.to_flow_log()
 
-        Args:
-            fields_filter:
-                List of field names to include in the filtered copy. Available fields are
-                ``"assignee"``, ``"created"``, ``"cycleTime"``, ``"description"``, ``"fixVersion"``, ``"fixVersion"``, ``"id"``, ``"key"``,
-                ``"labels"``, ``"leadTime"``, ``"parent"``, ``"priority"``, ``"resolution"``, ``"resolutiondate"``, ``"status"``, ``"summary"``, ``"ttype"``,
-                ``"url"``, ``"updated_at"``
+    def issues(self) -> List[JiraIssue]:
+        """A lazy :py:class:`JiraIssue` for each row of the snapshot."""
+        state = {
+            'calendar': self.calendar,
+            '_issue': None,
+            '_compact_flow_log': self.meta['compact_flow_logs'],
+            '_lazy': True,
+            '_fields': None,
+            '_source': None,
+            '_unloaded': frozenset(),
+            '_key_order': tuple(self._entries),
+            '_snapshot': self,
+        }
+        issues = []
+        for row in range(len(self)):
+            issue = JiraIssue.__new__(JiraIssue)
+            issue.__dict__.update(state)
+            issue._row = row
+            issues.append(issue)
+        return issues
+
+    def columns(self) -> IssueColumns:
+        """The :py:class:`IssueColumns` saved with the snapshot."""
+        columns = IssueColumns.__new__(IssueColumns)
+        columns.key = self._array('columns.key')
+        columns.created = self._array('columns.created')
+        columns.resolution_date = self._array('columns.resolution_date')
+        columns.lead_time = self._array('columns.lead_time')
+        columns.cycle_time = self._array('columns.cycle_time')
+        columns.categories = {field: np.array(categories, dtype=object)
+                              for field, categories in self.meta['categories'].items()}
+        columns.codes = {field: self._array('columns.codes.' + field)
+                         for field in self.meta['categories']}
+        return columns
+
+
+def _write_snapshot_arrays(path: str, arrays: Dict[str, np.ndarray]) -> None:
+    """Save arrays into a snapshot directory.
+
+    Each file is written alongside the old one and moved over it, so a snapshot that is open (and
+    memory mapped) keeps reading the arrays it opened.
+    """
+    for name, array in arrays.items():
+        target = os.path.join(path, name + '.npy')
+        with open(target + '.tmp', 'wb') as f:
+            np.save(f, array)
+        os.replace(target + '.tmp', target)
 
-        Returns:
-            JiraIssue: A filtered copy of this issue.
-        """
 
-        filtered = JiraIssue(self._issue)
-        if type(fields_filter) is list:
-            fields_filter = set().union(self.__PROTECTED_FIELDS__, fields_filter)
-            to_delete = set(filtered.keys()).difference(fields_filter)
-            for d in to_delete:
-                del filtered[d]
-
-        if 'leadTime' in fields_filter:
-            filtered['leadTime'] = self.get(
-                'leadTime', self.calculate_lead_time())
-        if 'cycleTime' in fields_filter:
-            filtered['cycleTime'] = self.get(
-                'cycleTime', self.calculate_cycle_time())
-        # We have to copy parent from a property into the map if it is a requested field
-        if 'parent' in fields_filter:
-            filtered['parent'] = filtered.parent
-        return filtered
+def _latest_update(issues: List[object]) -> datetime:
+    """The latest ``updated_at`` date of a list of issues (or results, by their watermark)."""
+    updates = [getattr(i, 'watermark', None) if isinstance(i, JQLResult) else getattr(i, 'updated_at', None)
+               for i in issues]
+    return max((u for u in updates if u), default=None)
 
 
 class JQLResult(list):
@@ -499,10 +2023,21 @@ class JQLResult(list):
         label (optional): A string label used to cache the query result. If not set the default key
             `JQL` is used and the result overwrites any previous query results.
         issues: A list of :py:class:`JiraIssue` instances.
+        calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+        compact_flow_logs (optional): Store issue flow logs as :py:class:`CompactFlowLog` instances.
+        columnar (optional): Build the :py:class:`IssueColumns` store as soon as the result is created.
+            Otherwise it is built the first time it is needed.
+        lazy_issues (optional): Create ``lazy`` :py:class:`JiraIssue` instances that only parse the
+            fields that are used.
+        stats (optional): An :py:class:`engineeringmetrics.stats.AdapterStats` to time working out
+            lead and cycle times, filtering and building the column store in.
 
     """
 
-    def __init__(self, query: str, label: str = 'JQL', issues: List[JIRA.issue] = []) -> None:
+    # Results unpickled from before stats were kept have none.
+    _stats = None
+
+    def __init__(self, query: str, label: str = 'JQL', issues: List[JIRA.issue] = [], calendar: BusinessCalendar = None, compact_flow_logs: bool = False, columnar: bool = False, lazy_issues: bool = False, stats: AdapterStats = None) -> None:
         """Init a JQLResult
 
         Args:
@@ -510,13 +2045,290 @@ class JQLResult(list):
             label (optional): A string label used to cache the query result. If not set the default key
                 `JQL` is used and the result overwrites any previous query results.
             issues: A list of :py:class:`JiraIssue` instances.
+            calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+            compact_flow_logs (optional): Store issue flow logs as :py:class:`CompactFlowLog` instances.
+            columnar (optional): Build the :py:class:`IssueColumns` store straight away.
+            lazy_issues (optional): Create ``lazy`` :py:class:`JiraIssue` instances.
+            stats (optional): An :py:class:`engineeringmetrics.stats.AdapterStats` to time work on the result in.
         """
+        self._columns = None
+        self._watermark = None
+        self._snapshot = None
+        self._stats = stats
+        self._calendar = DEFAULT_CALENDAR if calendar == None else calendar
         if type(issues) is client.ResultList:
-            self.extend(list(map(lambda i: JiraIssue(i), issues)))
+            self.extend(list(map(lambda i: JiraIssue(
+                i, self._calendar, compact_flow_logs, lazy_issues), issues)))
         else:
             self.extend(issues)
         self._query = query
         self._label = label
+        if columnar:
+            self.build_columns()
+
+    def _load_rows(self) -> None:
+        """Build the issues of a result loaded from a snapshot, if they haven't been yet."""
+        # Look _snapshot up in __dict__ as issues are added before it when a result is unpickled.
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot != None:
+            self._snapshot = None
+            # Straight on to the list, the column store came from the snapshot too.
+            list.extend(self, snapshot.issues())
+
+    def _loading_rows(method):
+        """Wrap a list method that uses the issues in the result so a loaded snapshot builds them first."""
+        def wrapper(self, *args, **kwargs):
+            self._load_rows()
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _comparing_rows(method):
+        """Wrap a list comparison so both sides build their issues first."""
+        def wrapper(self, other):
+            self._load_rows()
+            if isinstance(other, JQLResult):
+                other._load_rows()
+            return method(self, other)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _invalidate_columns(method):
+        """Wrap a list method that changes the issues in the result so it drops the column store."""
+        def wrapper(self, *args, **kwargs):
+            self._columns = None
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    append = _invalidate_columns(_loading_rows(list.append))
+    extend = _invalidate_columns(_loading_rows(list.extend))
+    insert = _invalidate_columns(_loading_rows(list.insert))
+    remove = _invalidate_columns(_loading_rows(list.remove))
+    pop = _invalidate_columns(_loading_rows(list.pop))
+    clear = _invalidate_columns(_loading_rows(list.clear))
+    sort = _invalidate_columns(_loading_rows(list.sort))
+    reverse = _invalidate_columns(_loading_rows(list.reverse))
+    __setitem__ = _invalidate_columns(_loading_rows(list.__setitem__))
+    __delitem__ = _invalidate_columns(_loading_rows(list.__delitem__))
+    __iadd__ = _invalidate_columns(_loading_rows(list.__iadd__))
+    __imul__ = _invalidate_columns(_loading_rows(list.__imul__))
+    __getitem__ = _loading_rows(list.__getitem__)
+    __iter__ = _loading_rows(list.__iter__)
+    __reversed__ = _loading_rows(list.__reversed__)
+    __contains__ = _loading_rows(list.__contains__)
+    __repr__ = _loading_rows(list.__repr__)
+    __add__ = _loading_rows(list.__add__)
+    __mul__ = _loading_rows(list.__mul__)
+    __rmul__ = _loading_rows(list.__rmul__)
+    __reduce_ex__ = _loading_rows(list.__reduce_ex__)
+    index = _loading_rows(list.index)
+    count = _loading_rows(list.count)
+    copy = _loading_rows(list.copy)
+    __eq__ = _comparing_rows(list.__eq__)
+    __ne__ = _comparing_rows(list.__ne__)
+    __lt__ = _comparing_rows(list.__lt__)
+    __le__ = _comparing_rows(list.__le__)
+    __gt__ = _comparing_rows(list.__gt__)
+    __ge__ = _comparing_rows(list.__ge__)
+    del _loading_rows, _comparing_rows, _invalidate_columns
+
+    def __len__(self) -> int:
+        snapshot = self.__dict__.get('_snapshot')
+        return len(snapshot) if snapshot != None else list.__len__(self)
+
+    def build_columns(self) -> IssueColumns:
+        """(Re)build the columnar store for this result from its issues.
+
+        The store is kept up to date by ``calculate_lead_times`` and ``calculate_cycle_times`` and is
+        dropped if issues are added to or removed from the result. Call this method if you have changed
+        issues yourself.
+
+        Returns:
+            IssueColumns: The new column store.
+        """
+        with timed(self._stats, 'columns'):
+            self._columns = IssueColumns(self)
+        return self._columns
+
+    @property
+    def columns(self) -> IssueColumns:
+        """
+        :py:class:`IssueColumns`: `columns`
+            Typed numpy columns for the issues in this result, built the first time they are needed.
+        """
+        if self._columns == None:
+            self.build_columns()
+        return self._columns
+
+    def to_numpy(self, decode: bool = True) -> Dict[str, np.ndarray]:
+        """The issues in this result as a dictionary of numpy arrays keyed by field name.
+        See :py:class:`IssueColumns` for the fields available.
+
+        Args:
+            decode (optional): If False string fields are returned as integer codes in to ``columns.categories``.
+
+        Returns:
+            Dict[str, numpy.ndarray]: The columns for this result.
+
+        Examples:
+            To get the lead times of a query result.
+
+                .. code-block:: python
+
+                    query_result = jm.populate_from_jql('project = "INT"')
+                    lead_times = query_result.to_numpy()['leadTime']
+        """
+        return self.columns.to_numpy(decode)
+
+    def to_dataframe(self) -> 'pandas.DataFrame':
+        """The issues in this result as a pandas DataFrame built straight from the column store, without
+        going through a dictionary per issue. See :py:class:`IssueColumns` for the fields available.
+
+        Returns:
+            pandas.DataFrame: A DataFrame with one row per issue.
+        """
+        return self.columns.to_dataframe()
+
+    def _snapshot_metadata(self) -> Dict[str, object]:
+        """What, other than its issues, a snapshot needs to recreate this result."""
+        watermark = self.watermark
+        return {
+            'class': type(self).__name__,
+            'query': self._query,
+            'label': self._label,
+            'watermark': watermark.isoformat() if watermark != None else None,
+            'calendar': _calendar_settings(self._calendar),
+        }
+
+    def save(self, path: str) -> None:
+        """Write this result to a snapshot that ``JQLResult.load`` can open again.
+
+        A snapshot is a directory of numpy ``.npy`` arrays and a ``meta.json`` file with the query, label,
+        watermark and calendar of the result. It holds the :py:class:`IssueColumns` store, every dictionary
+        entry and attribute of the issues (in typed columns for dates and numbers and as JSON otherwise)
+        and the flow logs of all of the issues flattened into a single array of compact entries. Jira
+        resources, like a fix version or resolution, are saved by name.
+
+        Saving works out every entry and attribute of lazy issues. Saving over an existing snapshot
+        replaces it, even if it is open.
+
+        Args:
+            path: The snapshot directory. It is created if it doesn't exist.
+
+        Examples:
+            To save a project for a notebook to pick up later.
+
+                .. code-block:: python
+
+                    project = jm.get_project_issues('INT')
+                    project.save('snapshots/INT')
+        """
+        path = os.path.expanduser(str(path))
+        os.makedirs(path, exist_ok=True)
+        issues = list(self)
+        arrays: Dict[str, np.ndarray] = {}
+
+        columns = self.columns
+        arrays['columns.key'] = np.array(
+            ['' if k == None else str(k) for k in columns.key.tolist()], dtype=str)
+        arrays['columns.created'] = columns.created
+        arrays['columns.resolution_date'] = columns.resolution_date
+        arrays['columns.lead_time'] = columns.lead_time
+        arrays['columns.cycle_time'] = columns.cycle_time
+        for field, codes in columns.codes.items():
+            arrays['columns.codes.' + field] = codes
+
+        keys: Dict[str, None] = {}
+        for issue in issues:
+            keys.update(dict.fromkeys(issue.keys()))
+        # Loaded issues list their entries in this order, so keep the order issues have when built, with
+        # any entries added since (such as expanded flow log statuses) after them.
+        order = {key: i for i, key in enumerate(JiraIssue.__KEY_ORDER__)}
+        keys = sorted(keys, key=lambda k: order.get(k, len(order)))
+        entries = []
+        for i, key in enumerate(keys):
+            kind, column = _snapshot_column(
+                [issue.get(key, _MISSING) for issue in issues])
+            entries.append([key, kind])
+            arrays.update(('entry{}.{}'.format(i, name), array)
+                          for name, array in column.items())
+
+        attributes = []
+        for name in JiraIssue.__ATTRIBUTE_LOADERS__:
+            if name == 'flow_log':
+                continue
+            kind, column = _snapshot_column(
+                [getattr(issue, name, _MISSING) for issue in issues])
+            attributes.append([name, kind])
+            arrays.update(('attribute.{}.{}'.format(name, n), array)
+                          for n, array in column.items())
+
+        flow_logs = [getattr(issue, 'flow_log', None) for issue in issues]
+        table = StatusTable()
+        arrays['flow_log.entries'], arrays['flow_log.offsets'] = _flatten_flow_logs(
+            flow_logs, table)
+
+        _write_snapshot_arrays(path, arrays)
+        meta = self._snapshot_metadata()
+        meta.update({
+            'version': _SNAPSHOT_VERSION,
+            'rows': len(issues),
+            'compact_flow_logs': bool(flow_logs) and all(isinstance(f, CompactFlowLog) for f in flow_logs),
+            'states': table.names,
+            'entries': entries,
+            'attributes': attributes,
+            'categories': {field: categories.tolist() for field, categories in columns.categories.items()},
+        })
+        # The metadata goes last, so a snapshot is never read with arrays that don't match it.
+        with open(os.path.join(path, 'meta.json.tmp'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, default=_snapshot_json)
+        os.replace(os.path.join(path, 'meta.json.tmp'),
+                   os.path.join(path, 'meta.json'))
+
+    @classmethod
+    def load(cls, path: str, calendar: BusinessCalendar = None) -> 'JQLResult':
+        """Open a snapshot written by ``save``.
+
+        Only the metadata is read up front. The arrays are memory mapped when they are first used, so
+        ``columns``, ``to_numpy()`` and ``to_dataframe()`` work straight from the file without building
+        any issues. The :py:class:`JiraIssue` instances are made the first time the issues in the result
+        are used, and each of them reads its entries and attributes from the snapshot as they are used.
+        The column arrays are mapped copy on write: changing them doesn't change the snapshot.
+
+        Args:
+            path: The snapshot directory.
+            calendar (optional): The :py:class:`BusinessCalendar` to measure durations against. Defaults
+                to the calendar the result had when it was saved.
+
+        Returns:
+            JQLResult: The result, a :py:class:`JiraProject` if it was saved from one.
+
+        Examples:
+            To pick up a saved project in a notebook.
+
+                .. code-block:: python
+
+                    project = JQLResult.load('snapshots/INT')
+                    lead_times = project.to_numpy()['leadTime']
+        """
+        snapshot = _Snapshot(os.path.expanduser(str(path)), calendar)
+        meta = snapshot.meta
+        result_class = JiraProject if meta['class'] == 'JiraProject' else JQLResult
+        result = result_class.__new__(result_class)
+        JQLResult.__init__(result, meta['query'],
+                           meta['label'], [], snapshot.calendar)
+        if result_class is JiraProject:
+            result._key = meta['project']['key']
+            result._name = meta['project']['name']
+        if meta['watermark'] != None:
+            result._watermark = parse_jira_timestamp(meta['watermark'])
+        result._columns = snapshot.columns()
+        result._snapshot = snapshot
+        return result
 
     @property
     def query(self) -> str:
@@ -534,6 +2346,47 @@ class JQLResult(list):
         """
         return self._label
 
+    @property
+    def calendar(self) -> BusinessCalendar:
+        """
+        :py:class:`BusinessCalendar`: `calendar`
+            The calendar durations are measured against.
+        """
+        return self._calendar
+
+    @property
+    def watermark(self) -> datetime:
+        """
+        datetime: `watermark`
+            The latest ``updated_at`` date of the issues in this result (None if it has no issues). Used
+            by the incremental mode of :py:class:`Jira` to only fetch issues that have changed since.
+        """
+        if self._watermark == None:
+            self._watermark = _latest_update(self)
+        return self._watermark
+
+    def merge(self, issues: List[JiraIssue]) -> 'JQLResult':
+        """Merge issues in to this result in place. Any issue with the same key as one already in the result
+        replaces it, anything else is added to the end.
+
+        Args:
+            issues: A list of :py:class:`JiraIssue` instances.
+
+        Returns:
+            JQLResult: This result.
+        """
+        positions = {issue['key']: i for i, issue in enumerate(self)}
+        for issue in issues:
+            position = positions.get(issue['key'])
+            if position == None:
+                positions[issue['key']] = len(self)
+                self.append(issue)
+            else:
+                self[position] = issue
+
+        self._watermark = _latest_update([self] + list(issues))
+        return self
+
     @property
     def issues(self) -> List[JiraIssue]:
         """
@@ -542,6 +2395,14 @@ class JQLResult(list):
         """
         return self
 
+    @property
+    def stats(self) -> AdapterStats:
+        """
+        :py:class:`engineeringmetrics.stats.AdapterStats`: `stats`
+            The stats work on this result is timed in (or None).
+        """
+        return self._stats
+
     @property
     def resolved_issues(self) -> List[JiraIssue]:
         """
@@ -567,8 +2428,13 @@ class JQLResult(list):
             resolution_status (str):
                 The issue status that indicates the issue was resolved
         """
-        for issue in self:
-            issue.calculate_lead_time(*args, **kwargs)
+        with timed(self._stats, 'lead_times'):
+            lead_times = _span_durations(
+                [issue._lead_time_span(*args, **kwargs) for issue in self], self._calendar)
+            for issue, lead_time in zip(self, lead_times):
+                issue['leadTime'] = lead_time
+            if self._columns != None:
+                self._columns.lead_time[:] = lead_times
 
     def calculate_cycle_times(self, override: bool = True, *args, **kwargs) -> None:
         """Calculate the cycle times for all issues in this JQLResult instance.
@@ -582,8 +2448,13 @@ class JQLResult(list):
             resolution_status (str):
                 The issue status that indicates the issue was resolved
         """
-        for issue in self:
-            issue.calculate_cycle_time(override=override, *args, **kwargs)
+        with timed(self._stats, 'cycle_times'):
+            cycle_times = _span_durations(
+                [issue._cycle_time_span(override=override, *args, **kwargs) for issue in self], self._calendar)
+            for issue, cycle_time in zip(self, cycle_times):
+                issue['cycleTime'] = cycle_time
+            if self._columns != None:
+                self._columns.cycle_time[:] = cycle_times
 
     def expand_issue_flow_logs(self, statuses: List[str] = None):
         """Add all flow log statuses as properties on the items with the duration of that status as the value.
@@ -601,13 +2472,14 @@ class JQLResult(list):
                             'project = "INT" AND issuetype in ("Sub-task", "Story")')
                     query_result.expand_issue_flow_logs()
         """
-        for issue in self:
-            status_dict = issue.flow_log.as_dict()
-            if type(statuses) is list:
-                to_delete = set(status_dict.keys()).difference(statuses)
-                for d in to_delete:
-                    del status_dict[d]
-            issue.update(status_dict)
+        with timed(self._stats, 'expand_flow_logs'):
+            for issue in self:
+                status_dict = issue.flow_log.as_dict()
+                if type(statuses) is list:
+                    to_delete = set(status_dict.keys()).difference(statuses)
+                    for d in to_delete:
+                        del status_dict[d]
+                issue.update(status_dict)
 
     def filter(self, issue_type_filter: List[str] = None, fields_filter: List[str] = None) -> 'JQLResult':
         """Filter the issues in this JQLResult instance.
@@ -627,7 +2499,8 @@ class JQLResult(list):
                 A list of issue types to return
 
         Returns:
-            JQLResult: An new JQLResult instance with a shallow copy of the filtered issues.
+            JQLResult: An new JQLResult instance with filtered copies of the issues. The copies share the
+            data already parsed for the issues in this result (see ``JiraIssue.filtered_copy``).
 
         Examples:
             To filter a previous query set.
@@ -639,22 +2512,22 @@ class JQLResult(list):
                     filtered = query_result.filter(['Sub-task'])
         """
 
-        # Make a copy of the issues from this query to not return references to the exitsing ones.
-        filtered_issues = list(map(lambda i: JiraIssue(i._issue), self))
-        filtered_label = self.label + '_filtered'
+        with timed(self._stats, 'filter'):
+            filtered_issues = self
+            filtered_label = self.label + '_filtered'
 
-        if type(issue_type_filter) is list:
-            filtered_issues = list(
-                filter(lambda fi: fi['ttype'] in issue_type_filter, filtered_issues))
+            if type(issue_type_filter) is list:
+                filtered_issues = list(
+                    filter(lambda fi: fi['ttype'] in issue_type_filter, filtered_issues))
 
-        ff = []
-        if not fields_filter and len(self):
-            ff.extend(self[0].keys())
-        else:
-            ff = fields_filter
-        filtered_issues = list(
-            map(lambda ffi: ffi.filtered_copy(ff), filtered_issues))
-        return JQLResult(self.query, filtered_label, filtered_issues)
+            ff = []
+            if not fields_filter and len(self):
+                ff.extend(self[0].keys())
+            else:
+                ff = fields_filter
+            filtered_issues = list(
+                map(lambda ffi: ffi.filtered_copy(ff), filtered_issues))
+        return JQLResult(self.query, filtered_label, filtered_issues, self._calendar, stats=self._stats)
 
 
 class JiraProject(JQLResult):
@@ -663,17 +2536,28 @@ class JiraProject(JQLResult):
 
     """
 
-    def __init__(self, project: JIRA.project, query_string: str = '', issues: List[JIRA.issue] = []) -> None:
+    def __init__(self, project: JIRA.project, query_string: str = '', issues: List[JIRA.issue] = [], calendar: BusinessCalendar = None, compact_flow_logs: bool = False, columnar: bool = False, lazy_issues: bool = False, stats: AdapterStats = None) -> None:
         """Init a JiraProject
 
         Args:
             project (JiraProject): A JIRA project instance
             query_string (srt): The query used to grab this project data.
+            calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+            compact_flow_logs (optional): Store issue flow logs as :py:class:`CompactFlowLog` instances.
+            columnar (optional): Build the :py:class:`IssueColumns` store straight away.
+            lazy_issues (optional): Create ``lazy`` :py:class:`JiraIssue` instances.
+            stats (optional): An :py:class:`engineeringmetrics.stats.AdapterStats` to time work on the project in.
         """
-        super().__init__(query_string, project.name, issues)
+        super().__init__(query_string, project.name, issues,
+                         calendar, compact_flow_logs, columnar, lazy_issues, stats)
         self._key = project.key
         self._name = project.name
 
+    def _snapshot_metadata(self) -> Dict[str, object]:
+        meta = super()._snapshot_metadata()
+        meta['project'] = {'key': self._key, 'name': self._name}
+        return meta
+
     @property
     def key(self) -> str:
         """
@@ -691,12 +2575,117 @@ class JiraProject(JQLResult):
         return self._name
 
 
+class _RawResource:
+    """Attribute access to the raw JSON of an issue, a light stand in for a jira Resource."""
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: object) -> None:
+        self.raw = raw
+
+    def __getattr__(self, name: str) -> object:
+        try:
+            return _raw_resource(self.raw[name])
+        except KeyError:
+            raise AttributeError(name)
+
+
+def _raw_resource(value: object) -> object:
+    if isinstance(value, dict):
+        return _RawResource(value)
+    if isinstance(value, list):
+        return [_raw_resource(v) for v in value]
+    return value
+
+
+def _parse_issues(calendar: BusinessCalendar, compact_flow_log: bool, fields: List[str], changelog: bool, raws: List[dict]) -> List[tuple]:
+    """Parse the dates, flow log and lead and cycle times of raw issues in a worker process."""
+    return [JiraIssue(_RawResource(raw), calendar, compact_flow_log, True, fields, changelog)._parsed_values()
+            for raw in raws]
+
+
+def _status_changes(raw: dict) -> int:
+    """The number of status changes in the changelog of a raw issue."""
+    changelog = raw.get('changelog') or {}
+    return sum(item.get('field') == 'status' for history in changelog.get('histories', ())
+               for item in history.get('items', ()))
+
+
 class Jira:
     """An Engineering Metrics wrapper for data we can harvest from Jira.
+
+    Args:
+        jiraclient: The `Jira client <https://jira.readthedocs.io/en/master/>`_ to pull data with. Wrap it
+            in an :py:class:`engineeringmetrics.replay.RecordingJIRA` to record what it returns, or pass an
+            :py:class:`engineeringmetrics.replay.ReplayJIRA` to pull from a recording instead.
+        calendar (optional): The :py:class:`BusinessCalendar` to measure durations against.
+        compact_flow_logs (optional): Store issue flow logs as :py:class:`CompactFlowLog` instances
+            to cut the memory used by large result sets.
+        columnar (optional): Build the :py:class:`IssueColumns` store of each result as the issues are
+            pulled rather than the first time it is used.
+        cache (optional): An :py:class:`engineeringmetrics.cache.IssueCache` to keep raw issues in. When
+            set, searches first ask Jira for just the key and ``updated`` date of each matching issue and
+            only download the issues that are not in the cache or have changed since they were cached.
+        fetch_workers (optional): The number of pages of search results to fetch at the same time. With
+            the default of 1 pages are fetched one after another by the Jira client.
+        page_size (optional): The number of issues to ask for in each page when fetching pages in parallel.
+        project_workers (optional): The number of projects ``populate_projects`` pulls at the same time.
+        lazy_issues (optional): Create ``lazy`` :py:class:`JiraIssue` instances that only parse the fields
+            that are used. This makes pulling large numbers of issues much cheaper when only a few fields
+            are needed.
+        process_workers (optional): The number of processes to build issues in when a search returns at
+            least ``process_pool_threshold`` issues. Defaults to the number of CPUs. Set it to 1 to always
+            build issues in this process. The processes are started the first time they are needed and
+            kept until ``close``. Only calls made on the main thread use them, searches run by project
+            workers or :py:class:`AsyncJira` build their issues in this process.
+        process_pool_threshold (optional): The number of issues a search has to return before they are
+            built in a process pool. Defaults to 10000.
+        share_issues (optional): Keep one :py:class:`JiraIssue` for each issue key and ``updated`` date.
+            Results that contain an issue which hasn't changed since another result pulled it reuse the
+            same instance instead of parsing it again. Changes made to an issue through one result (such
+            as recalculated cycle times or expanded flow logs) then show in every result that shares it,
+            so only turn it on when results are read and not changed. Defaults to False.
+        scheduler (optional): An :py:class:`engineeringmetrics.scheduler.RequestScheduler` to send the
+            client's requests through. It paces them, retries throttled ones and adjusts how many are
+            sent at once, and keeps ``metrics`` of how they went.
+        stats (optional): An :py:class:`engineeringmetrics.stats.AdapterStats` to time each phase of
+            pulling issues in and count requests, bytes, issues, transitions and cache hits. The results
+            returned time their own work in it too.
     """
 
-    def __init__(self, jiraclient: JIRA) -> None:
+    def __init__(self, jiraclient: JIRA, calendar: BusinessCalendar = None, compact_flow_logs: bool = False, columnar: bool = False, cache: IssueCache = None, fetch_workers: int = 1, page_size: int = 100, project_workers: int = 1, lazy_issues: bool = False, process_workers: int = None, process_pool_threshold: int = None, share_issues: bool = False, scheduler: RequestScheduler = None, stats: AdapterStats = None) -> None:
         self._client = jiraclient
+        self._calendar = DEFAULT_CALENDAR if calendar == None else calendar
+        self._compact_flow_logs = compact_flow_logs
+        self._columnar = columnar
+        self._cache = cache
+        self._fetch_workers = max(1, fetch_workers or 1)
+        self._page_size = page_size
+        self._project_workers = max(1, project_workers or 1)
+        self._lazy_issues = lazy_issues
+        self._process_workers = process_workers or os.cpu_count() or 1
+        self._process_pool_threshold = self.__PROCESS_POOL_THRESHOLD__ if process_pool_threshold == None else process_pool_threshold
+        # Started on the main thread the first time a large result is built.
+        self._process_pool = None
+        self._share_issues = share_issues
+        self._scheduler = scheduler
+        self._stats = stats
+        self._release = None
+        session = getattr(jiraclient, '_session', None)
+        if session != None and (scheduler != None or stats != None):
+            if scheduler != None:
+                scheduler.mount(session)
+            if stats != None:
+                stats.watch(session)
+            # Taken off the session by close, or when the adapter is garbage collected.
+            self._release = weakref.finalize(self, _release_session, session, scheduler, stats)
+            self._release.atexit = False
+            _SESSION_OWNERS[session] = self._release
+        # The latest issue built for each key. Issues are only held here while a result refers to them.
+        self._issue_map = weakref.WeakValueDictionary()
+        self._issue_map_lock = threading.Lock()
+        self._project_errors = {}
+        # Guards writes to the datastore from concurrent populate calls.
+        self._lock = threading.Lock()
         self._datastore = {
             "issues": {},
             "projects": {}
@@ -725,27 +2714,338 @@ class Jira:
         'updated'
     ]
 
-    def _get_issues_for_projects(self, project_ids: List[str],  max_results: int = False) -> Dict[str, JiraProject]:
+    # The number of issue keys to ask for in a single "key in (...)" query when filling in the cache.
+    __CACHE_FETCH_BATCH__ = 100
 
-        issues_by_project = {}
-        for pid in project_ids:
-            pdata = self._client.project(pid)
+    # Below this many issues starting a process pool costs more than it saves.
+    __PROCESS_POOL_THRESHOLD__ = 10000
+
+    # The number of histories to ask for in each page of the changelog of an issue.
+    __CHANGELOG_PAGE_SIZE__ = 100
 
-            query_string = 'project = "{}" ORDER BY priority DESC'.format(pid)
-            issues = self._client.search_issues(
-                query_string,
-                maxResults=max_results,
+    def _search(self, query: str, **kwargs) -> client.ResultList:
+        """Run one search on the client, timing and counting it if there are stats."""
+        if self._stats == None:
+            return self._client.search_issues(query, **kwargs)
+        with self._stats.phase('search'):
+            page = self._client.search_issues(query, **kwargs)
+        self._stats.count('searches')
+        self._stats.count('issues_fetched', len(page))
+        return page
+
+    def _fetch_pages(self, query: str, max_results: int = False, **kwargs) -> client.ResultList:
+        """Run a JQL search and get every page of results (up to max_results).
+
+        With more than one fetch worker the first page tells us how many issues match and the rest
+        of the pages are then fetched concurrently, and put back together in the order the server
+        returned them.
+        """
+        if self._fetch_workers == 1:
+            return self._search(query, maxResults=max_results, **kwargs)
+
+        page_size = min(self._page_size, max_results) if max_results else self._page_size
+        first = self._search(
+            query, startAt=0, maxResults=page_size, **kwargs)
+        total = min(first.total, max_results) if max_results else first.total
+        # The server may cap the page size below what we asked for.
+        page_size = len(first) or page_size
+
+        def fetch(start_at: int) -> client.ResultList:
+            return self._search(
+                query, startAt=start_at, maxResults=min(page_size, total - start_at), **kwargs)
+
+        pages = [first]
+        if len(first) < total:
+            with ThreadPoolExecutor(max_workers=self._fetch_workers) as pool:
+                pages.extend(pool.map(fetch, range(len(first), total, page_size)))
+
+        issues = [issue for page in pages for issue in page]
+        return client.ResultList(issues, 0, len(issues), len(issues), True)
+
+    def _search_fields(self, fields: List[str] = None, changelog: bool = True) -> Dict[str, object]:
+        """The search arguments that ask for the given Jira fields (all of ours if None) and the changelog."""
+        kwargs = dict(fields=self.__ISSUES_FIELDS__ if fields == None else fields)
+        if changelog:
+            kwargs['expand'] = 'changelog'
+        return kwargs
+
+    def _search_issues(self, query: str, max_results: int = False, fields: List[str] = None, changelog: bool = True) -> client.ResultList:
+        """Run a JQL search for full issues (with their changelogs), going through the cache if there is one.
+
+        Searches for just some of the fields, or without the changelog, skip the cache as it only holds
+        whole issues.
+        """
+        if self._cache == None or fields != None or not changelog:
+            issues = self._fetch_pages(query, max_results, **self._search_fields(fields, changelog))
+            if changelog:
+                self._complete_changelogs(issues)
+            return issues
+
+        # A cheap search for what matches and when it last changed.
+        headers = self._fetch_pages(query, max_results, fields=['updated'])
+        keys = [h.key for h in headers]
+        with timed(self._stats, 'cache'):
+            cached_updated = self._cache.updated(keys)
+        fresh = [h.key for h in headers
+                 if cached_updated.get(h.key) == h.raw['fields']['updated']]
+        # Read the fresh issues before storing the stale ones, as storing them can evict fresh ones.
+        # Anything that has gone from the cache since it was checked is fetched with the stale ones.
+        with timed(self._stats, 'cache'):
+            cached = self._cache.get(fresh)
+        stale = [k for k in keys if k not in cached]
+        if self._stats != None:
+            self._stats.count('cache_hits', len(cached))
+            self._stats.count('cache_misses', len(stale))
+
+        fetched = {}
+        for i in range(0, len(stale), self.__CACHE_FETCH_BATCH__):
+            batch = stale[i:i + self.__CACHE_FETCH_BATCH__]
+            issues = self._fetch_pages(
+                'key in ({})'.format(','.join(batch)),
                 expand='changelog',
                 fields=self.__ISSUES_FIELDS__
             )
-            proj = JiraProject(pdata, query_string, issues)
+            self._complete_changelogs(issues)
+            with timed(self._stats, 'cache'):
+                self._cache.put([issue.raw for issue in issues])
+            fetched.update((issue.key, issue) for issue in issues)
+
+        issues = []
+        for key in keys:
+            if key in fetched:
+                issues.append(fetched[key])
+            elif key in cached:
+                issues.append(Issue(self._client._options,
+                                    self._client._session, raw=cached[key]))
+        return client.ResultList(issues, headers.startAt, headers.maxResults, len(issues), True)
+
+    def _complete_changelogs(self, issues: List[Issue]) -> None:
+        """Fill in the changelogs that a search cut short, replacing the issues in the list.
+
+        Search only returns the first page of the histories of each issue. For any issue with more, the
+        pages that are missing are fetched from its changelog (up to ``fetch_workers`` at a time) and
+        merged in, in the same order as the page the search returned, before the issue is parsed. If the
+        client can't fetch changelog pages the issues are left with the first page, with a warning.
+        """
+        truncated = {}
+        for i, issue in enumerate(issues):
+            changelog = issue.raw.get('changelog')
+            if changelog and changelog.get('total', 0) > len(changelog.get('histories', [])):
+                truncated[i] = {h['id']: h for h in changelog['histories']}
+        if not truncated:
+            return
+        get_page = self._changelog_pages()
+        if get_page == None:
+            warnings.warn('The Jira client has no way to fetch changelog pages, so the changelogs of {} issues '
+                          'are missing their older histories'.format(len(truncated)))
+            return
+        with timed(self._stats, 'changelog'):
+            self._fetch_changelogs(issues, truncated, get_page)
+
+    def _changelog_pages(self) -> Callable[[str, int, int], dict]:
+        """A function to fetch a page of an issue's changelog with, called as ``get_page(key, start_at,
+        max_results)``, or None if the client can't.
+
+        A ``jira.JIRA`` client's changelog pages are requested through its session from its
+        ``server_url``, and so are those of the client a :py:class:`engineeringmetrics.replay.RecordingJIRA`
+        records. Stand-ins for a client (such as :py:class:`engineeringmetrics.replay.ReplayJIRA`) serve
+        them from their ``_get_json`` instead.
+        """
+        if isinstance(self._client, RecordingJIRA):
+            get_page = _session_changelog_pages(self._client.jiraclient)
+            return None if get_page == None else self._client.record_changelog_pages(get_page)
+        get_json = getattr(self._client, '_get_json', None)
+        if not isinstance(self._client, JIRA) and callable(get_json):
+            return lambda key, start_at, max_results: get_json('issue/{}/changelog'.format(key), params={
+                'startAt': start_at, 'maxResults': max_results})
+        return _session_changelog_pages(self._client)
+
+    def _fetch_changelogs(self, issues: List[Issue], truncated: Dict[int, Dict[str, dict]], get_page: Callable[[str, int, int], dict]) -> None:
+        """Fetch the missing changelog pages of the issues at the positions in ``truncated`` and merge them in."""
+        def fetch(request: Tuple[int, int]) -> List[dict]:
+            i, start_at = request
+            page = get_page(issues[i].key, start_at, self.__CHANGELOG_PAGE_SIZE__)
+            if self._stats != None:
+                self._stats.count('changelog_pages')
+            return page.get('values', [])
+
+        def fetch_all(requests: List[Tuple[int, int]]) -> None:
+            if self._fetch_workers == 1 or len(requests) < 2:
+                pages = map(fetch, requests)
+            else:
+                with ThreadPoolExecutor(max_workers=self._fetch_workers) as pool:
+                    pages = list(pool.map(fetch, requests))
+            for (i, _), histories in zip(requests, pages):
+                truncated[i].update((h['id'], h) for h in histories)
+
+        def missing(i: int) -> int:
+            return issues[i].raw['changelog']['total'] - len(truncated[i])
+
+        # The search has the first page of the changelog, so the rest usually follows on from it. If the
+        # server gave us some other page we go back for the ones before it too.
+        fetch_all([(i, start_at) for i, known in truncated.items()
+                   for start_at in range(len(known), issues[i].raw['changelog']['total'], self.__CHANGELOG_PAGE_SIZE__)])
+        fetch_all([(i, start_at) for i in truncated if missing(i) > 0
+                   for start_at in range(0, len(issues[i].raw['changelog']['histories']), self.__CHANGELOG_PAGE_SIZE__)])
+
+        for i, histories in truncated.items():
+            raw = issues[i].raw
+            page = raw['changelog']['histories']
+            newest_first = len(page) < 2 or parse_jira_timestamp(
+                page[0]['created']) >= parse_jira_timestamp(page[-1]['created'])
+            histories = sorted(histories.values(), key=lambda h: (
+                parse_jira_timestamp(h['created']), int(h['id'])), reverse=newest_first)
+            raw = dict(raw, changelog=dict(raw['changelog'], startAt=0,
+                       maxResults=len(histories), total=len(histories), histories=histories))
+            issues[i] = Issue(self._client._options,
+                              self._client._session, raw=raw)
+
+    def _issues(self, result: client.ResultList, fields: List[str] = None, changelog: bool = True) -> List:
+        """The issues of a search ready to go in to a :py:class:`JQLResult`.
+
+        Issues that are in the identity map with the same ``updated`` date, and that were fetched with
+        at least the fields (and changelog) asked for, are reused rather than built again. The ones that
+        are built take their place in the map.
+        """
+        wanted = _fetched_fields(fields, changelog)
+        issues = [None] * len(result)
+        missing = []
+        with self._issue_map_lock:
+            for i, issue in enumerate(result):
+                known = self._issue_map.get(issue.key) if self._share_issues else None
+                updated = issue.raw['fields'].get('updated')
+                if (known != None and updated != None and known._issue.raw['fields'].get('updated') == updated
+                        and (known._fields == None or (wanted != None and wanted <= known._fields))):
+                    issues[i] = known
+                else:
+                    missing.append(i)
+        if self._stats != None:
+            self._stats.count('issue_map_hits', len(issues) - len(missing))
+            self._stats.count('issue_map_misses', len(missing))
+        if not missing:
+            return issues
+
+        with timed(self._stats, 'build'):
+            built = [issue if isinstance(issue, JiraIssue) else
+                     JiraIssue(issue, self._calendar,
+                               self._compact_flow_logs, self._lazy_issues, fields, changelog)
+                     for issue in self._build_issues([result[i] for i in missing], fields, changelog)]
+        if self._stats != None:
+            self._stats.count('issues_built', len(built))
+            self._stats.count('transitions', sum(
+                _status_changes(result[i].raw) for i in missing))
+        with self._issue_map_lock:
+            for i, issue in zip(missing, built):
+                if self._share_issues:
+                    self._issue_map[result[i].key] = issue
+                issues[i] = issue
+        return issues
+
+    def _build_issues(self, result: List[Issue], fields: List[str] = None, changelog: bool = True) -> List:
+        """Build the :py:class:`JiraIssue` instances for a list of issue resources.
+
+        For large results the slow part of building :py:class:`JiraIssue` instances (parsing dates and
+        changelogs and working out durations) is shared out to a pool of processes, each parsing a run
+        of issues from their raw JSON. The rest of each issue is filled in here from the results, in
+        order. Otherwise the issues are returned as they are for the caller to build.
+
+        The pool is only used from the main thread. Forking the processes from a worker thread (or
+        having them fork more later) while other threads hold locks can leave them deadlocked.
+        """
+        if self._lazy_issues or self._process_workers < 2 or len(result) < max(self._process_pool_threshold, 1):
+            return result
+        if threading.current_thread() is not threading.main_thread():
+            return result
+        if self._process_pool == None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self._process_workers)
+
+        raws = [issue.raw for issue in result]
+        # A few runs per worker evens out the load without sending too many small batches.
+        run = -(-len(raws) // (self._process_workers * 4))
+        parse = functools.partial(
+            _parse_issues, self._calendar, self._compact_flow_logs, fields, changelog)
+        parsed = self._process_pool.map(parse, [raws[i:i + run]
+                                                for i in range(0, len(raws), run)])
+        issues = []
+        for issue, values in zip(result, chain.from_iterable(parsed)):
+            issue = JiraIssue(issue, self._calendar,
+                              self._compact_flow_logs, True, fields, changelog)
+            issue._adopt_parsed_values(values)
+            issue._lazy = False
+            issue._materialize()
+            issues.append(issue)
+        return issues
+
+    # Jira evaluates relative dates against its own clock, so we go back a little further than the
+    # watermark in case that is ahead of ours. Re-fetching a few issues is harmless as they are merged by key.
+    __WATERMARK_OVERLAP__ = timedelta(minutes=10)
+
+    def _updated_since(self, query: str, watermark: datetime) -> str:
+        """Restrict a JQL query to issues updated at or after the watermark, keeping any ORDER BY clause."""
+        minutes = (datetime.now(watermark.tzinfo) - watermark +
+                   self.__WATERMARK_OVERLAP__) // timedelta(minutes=1) + 1
+        updated_clause = 'updated >= "-{}m"'.format(minutes)
+
+        order_by = re.search(r'\bORDER\s+BY\b', query, flags=re.IGNORECASE)
+        clause, order = (query[:order_by.start()], ' ' +
+                         query[order_by.start():]) if order_by else (query, '')
+        if clause.strip():
+            return '({}) AND {}{}'.format(clause.strip(), updated_clause, order)
+        return updated_clause + order
+
+    def _cached_project(self, pid: str) -> JiraProject:
+        """A project already pulled by ``populate_projects`` or ``get_project_issues`` (or None)."""
+        project = self._datastore['projects'].get(pid, self._datastore.get(pid))
+        return project if isinstance(project, JiraProject) else None
+
+    def _get_project(self, pid: str, max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> JiraProject:
+        """Pull the issues of a single project, or just its updates if ``incremental`` and it has been pulled before."""
+        query_string = 'project = "{}" ORDER BY priority DESC'.format(pid)
+
+        cached = self._cached_project(pid) if incremental else None
+        if cached != None and cached.query == query_string and cached.watermark != None:
+            issues = self._search_issues(
+                self._updated_since(query_string, cached.watermark), max_results, fields, changelog)
+            return cached.merge(JQLResult(
+                query_string, issues=self._issues(issues, fields, changelog), calendar=self._calendar, compact_flow_logs=self._compact_flow_logs,
+                lazy_issues=self._lazy_issues, stats=self._stats))
+
+        with timed(self._stats, 'project'):
+            pdata = self._client.project(pid)
+        issues = self._search_issues(query_string, max_results, fields, changelog)
+        return JiraProject(pdata, query_string, self._issues(issues, fields, changelog),
+                           self._calendar, self._compact_flow_logs, self._columnar, self._lazy_issues, self._stats)
+
+    def _get_issues_for_projects(self, project_ids: List[str],  max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> Tuple[Dict[str, JiraProject], Dict[str, Exception]]:
+        """Pull a list of projects, up to ``project_workers`` at a time.
+
+        An error pulling one project doesn't stop the others. It is returned alongside the projects
+        that were pulled.
+        """
+        def get(pid: str) -> Tuple[str, JiraProject, Exception]:
+            try:
+                return pid, self._get_project(pid, max_results, incremental, fields, changelog), None
+            except Exception as error:
+                return pid, None, error
+
+        project_ids = list(dict.fromkeys(project_ids))
+        if self._project_workers == 1 or len(project_ids) < 2:
+            outcomes = [get(pid) for pid in project_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._project_workers, len(project_ids))) as pool:
+                outcomes = list(pool.map(get, project_ids))
 
-            if len(proj):
+        issues_by_project = {}
+        errors = {}
+        for pid, proj, error in outcomes:
+            if error != None:
+                errors[pid] = error
+            elif len(proj):
                 issues_by_project[pid] = proj
 
-        return issues_by_project
+        return issues_by_project, errors
 
-    def populate_projects(self, projectids: List[str], max_results: int = False) -> Dict[str, JiraProject]:
+    def populate_projects(self, projectids: List[str], max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> Dict[str, JiraProject]:
         """Populate the Jira instance with data from the Jira app.
 
         Given a list of ids this method will build a dictionary containing issues from
@@ -756,16 +3056,41 @@ class Jira:
         Args:
             projectids: A list of project ids for which you want to pull issues.
             max_results: Limit the number of issues returned by the query.
+            incremental (optional):
+                If a project has been pulled before only fetch the issues updated since the
+                ``watermark`` of the stored :py:class:`JiraProject` and merge them in to it.
+                Issues that have been deleted or moved out of the project are not removed.
+            fields (optional):
+                Only fetch what is needed to work out these :py:class:`JiraIssue` dictionary entries
+                (e.g. ``['status', 'leadTime']``) rather than every field. The other entries are left
+                out of the issues. See ``JiraIssue.jira_fields``.
+            changelog (optional):
+                Set to False to fetch the issues without their changelogs. Their flow logs then only
+                have the ``"Created"`` entry and ``"leadTime"`` and ``"cycleTime"`` are left out.
+
+        Projects are pulled ``project_workers`` at a time. If pulling a project fails the rest of
+        the projects are still pulled, the project is left out of the result and the error is kept
+        in ``project_errors``. The stored projects are only updated once every project has been
+        pulled.
 
         Returns:
             Dict[str, JiraProject]: A dictionary of JiraProjects. Each key will be the id for the corresponding project.
         """
-        projects = self._get_issues_for_projects(projectids,  max_results)
-        self._datastore['projects'] = {
-            **self._datastore['projects'], **projects}
+        if fields != None:
+            fields = JiraIssue.jira_fields(fields)
+        projects, errors = self._get_issues_for_projects(
+            projectids,  max_results, incremental, fields, changelog)
+        self._store_projects(projects, errors)
         return projects
 
-    def get_project_issues(self, projectid: str, max_results: int = False) -> JiraProject:
+    def _store_projects(self, projects: Dict[str, JiraProject], errors: Dict[str, Exception]) -> None:
+        """Add a batch of pulled projects to the datastore in one go."""
+        with self._lock:
+            self._datastore['projects'] = {
+                **self._datastore['projects'], **projects}
+            self._project_errors = errors
+
+    def get_project_issues(self, projectid: str, max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> JiraProject:
         """Get issues for a particular project key.
 
         Given a project key this method will retuen a list of issues from
@@ -776,16 +3101,27 @@ class Jira:
         Args:
             projectid: A project id for which you want to pull issues.
             max_results: Limit the number of issues returned by the query.
+            incremental (optional): Only fetch issues updated since the project was last pulled. See
+                ``populate_projects``.
+            fields (optional): Only fetch what is needed for these dictionary entries. See ``populate_projects``.
+            changelog (optional): Set to False to fetch the issues without their changelogs.
 
         Returns:
             JiraProject: A list of JiraIssue instances.
         """
-        project = self._get_issues_for_projects(
-            [projectid],  max_results).get(projectid, JQLResult(projectid, projectid))
-        self._datastore[projectid] = project
+        if fields != None:
+            fields = JiraIssue.jira_fields(fields)
+        projects, errors = self._get_issues_for_projects(
+            [projectid],  max_results, incremental, fields, changelog)
+        if projectid in errors:
+            raise errors[projectid]
+        project = projects.get(projectid, JQLResult(
+            projectid, projectid, calendar=self._calendar, stats=self._stats))
+        with self._lock:
+            self._datastore[projectid] = project
         return project
 
-    def populate_from_jql(self, query: str = None, max_results: int = False, label: str = "JQL") -> JQLResult:
+    def populate_from_jql(self, query: str = None, max_results: int = False, label: str = "JQL", incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> JQLResult:
         """Populate the Jira instance with data from the Jira app accorging to a JQL
         string.
 
@@ -802,19 +3138,152 @@ class Jira:
             label (optional):
                 A string label to store the query result internally. If not set the query
                 result is stored under the key 'JQL' and overwrites any previous query results.
+            incremental (optional):
+                If the same query has already been stored under this label only fetch the issues
+                updated since the ``watermark`` of the stored result and merge them in to it. Issues
+                that no longer match the query are not removed.
+            fields (optional):
+                Only fetch what is needed to work out these :py:class:`JiraIssue` dictionary entries
+                (e.g. ``['status', 'leadTime']``) rather than every field. The other entries are left
+                out of the issues. See ``JiraIssue.jira_fields``.
+            changelog (optional):
+                Set to False to fetch the issues without their changelogs. Their flow logs then only
+                have the ``"Created"`` entry and ``"leadTime"`` and ``"cycleTime"`` are left out.
 
         Returns:
             JQLResult: an instance of :py:class:`JQLResult`
+
+        Examples:
+            To refresh a query result with just the issues that have changed.
+
+                .. code-block:: python
+
+                    jm.populate_from_jql('project = "INT"', label='INT')
+                    # ...some time later
+                    query_result = jm.populate_from_jql('project = "INT"', label='INT', incremental=True)
+
+            To count issues by status without downloading their other fields, comments or changelogs.
+
+                .. code-block:: python
+
+                    result = jm.populate_from_jql('project = "INT"', fields=['status'], changelog=False)
         """
         if query == None:
             raise ValueError("query string is required to get issues")
-
-        result = self._client.search_issues(
-            query, maxResults=max_results, expand='changelog', fields=self.__ISSUES_FIELDS__)
-        query_result = JQLResult(query, label, result)
+        if fields != None:
+            fields = JiraIssue.jira_fields(fields)
+
+        cached = self._datastore.get(label) if incremental else None
+        if isinstance(cached, JQLResult) and cached.query == query and cached.watermark != None:
+            result = self._search_issues(
+                self._updated_since(query, cached.watermark), max_results, fields, changelog)
+            return cached.merge(JQLResult(query, label, self._issues(result, fields, changelog), self._calendar, self._compact_flow_logs,
+                                          lazy_issues=self._lazy_issues, stats=self._stats))
+
+        result = self._search_issues(query, max_results, fields, changelog)
+        query_result = JQLResult(
+            query, label, self._issues(result, fields, changelog), self._calendar, self._compact_flow_logs, self._columnar, self._lazy_issues, self._stats)
         self._datastore[query_result.label] = query_result
         return query_result
 
+    def iter_jql(self, query: str = None, page_size: int = None, max_results: int = False, pages: bool = False, fields: List[str] = None, changelog: bool = True) -> Iterator:
+        """Stream the issues matching a JQL query a page at a time.
+
+        Unlike ``populate_from_jql`` nothing is stored and the issues are handed over as each page
+        arrives, so only a few pages are held in memory however many issues match. While a page is
+        being processed the next ones (up to ``fetch_workers`` of them) are downloaded in the background.
+
+        Pages are requested by offset, so issues that start or stop matching the query while it is being
+        streamed may be skipped or seen twice.
+
+        Args:
+            query: The JQL query to perform against the Jira data.
+            page_size (optional): The number of issues to ask for in each page. Defaults to the
+                ``page_size`` of this adapter.
+            max_results (optional): Limit the number of issues returned by the query.
+            pages (optional): Yield a :py:class:`JQLResult` for each page rather than each issue.
+            fields (optional): Only fetch what is needed for these dictionary entries. See ``populate_from_jql``.
+            changelog (optional): Set to False to fetch the issues without their changelogs.
+
+        Returns:
+            Iterator: The :py:class:`JiraIssue` instances (or :py:class:`JQLResult` pages) in the order
+            the server returns them.
+
+        Examples:
+            To count the issues in each status without holding them all in memory.
+
+                .. code-block:: python
+
+                    from collections import Counter
+                    statuses = Counter(issue['status'] for issue in jm.iter_jql(
+                        'project = "INT"', fields=['status'], changelog=False))
+        """
+        if query == None:
+            raise ValueError("query string is required to get issues")
+
+        page_size = page_size or self._page_size
+        if fields != None:
+            fields = JiraIssue.jira_fields(fields)
+        search_fields = self._search_fields(fields, changelog)
+
+        def fetch(start_at: int) -> client.ResultList:
+            count = min(page_size, max_results - start_at) if max_results else page_size
+            page = self._search(
+                query, startAt=start_at, maxResults=count, **search_fields)
+            if changelog:
+                self._complete_changelogs(page)
+            if self._cache != None and fields == None and changelog:
+                with timed(self._stats, 'cache'):
+                    self._cache.put([issue.raw for issue in page])
+            return page
+
+        first = fetch(0)
+        total = min(first.total, max_results) if max_results else first.total
+        # The server may cap the page size below what we asked for.
+        page_size = len(first) or page_size
+        starts = iter(range(len(first), total, page_size))
+
+        pool = ThreadPoolExecutor(max_workers=self._fetch_workers)
+        queued = deque()
+        try:
+            for start_at in starts:
+                queued.append(pool.submit(fetch, start_at))
+                if len(queued) == self._fetch_workers:
+                    break
+
+            page = first
+            while True:
+                result = JQLResult(query, issues=self._issues(page, fields, changelog), calendar=self._calendar,
+                                   compact_flow_logs=self._compact_flow_logs, lazy_issues=self._lazy_issues, stats=self._stats)
+                page = None
+                if pages:
+                    yield result
+                else:
+                    yield from result
+                del result
+
+                if not queued:
+                    return
+                page = queued.popleft().result()
+                start_at = next(starts, None)
+                if start_at != None:
+                    queued.append(pool.submit(fetch, start_at))
+        finally:
+            for future in queued:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Take the scheduler and stats off the client's session, giving the session back its own
+        retries, and stop the processes issues are built in. The adapter can still be used afterwards,
+        its requests just aren't scheduled or counted.
+        """
+        if self._process_pool != None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+        if self._release != None:
+            self._release()
+
     def get_query_result(self, label: str = 'JQL') -> Dict[str, object]:
         """Get a cached JQL query result dictionary
 
@@ -842,6 +3311,46 @@ class Jira:
         except KeyError:
             return KeyError(f'No project with key {pid} in the cache. Have you called Jira.populate_projects(["{pid}"])?')
 
+    @property
+    def calendar(self) -> BusinessCalendar:
+        """
+        :py:class:`BusinessCalendar`: `calendar`
+            The calendar durations are measured against.
+        """
+        return self._calendar
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """
+        :py:class:`engineeringmetrics.scheduler.RequestScheduler`: `scheduler`
+            The scheduler the client's requests are sent through (or None).
+        """
+        return self._scheduler
+
+    @property
+    def stats(self) -> AdapterStats:
+        """
+        :py:class:`engineeringmetrics.stats.AdapterStats`: `stats`
+            The timers and counters of this adapter (or None).
+        """
+        return self._stats
+
+    @property
+    def cache(self) -> IssueCache:
+        """
+        :py:class:`engineeringmetrics.cache.IssueCache`: `cache`
+            The persistent issue cache used by this adapter (or None).
+        """
+        return self._cache
+
+    @property
+    def project_errors(self) -> Dict[str, Exception]:
+        """
+        Dict[str, Exception]: `project_errors`
+            The errors raised pulling projects in the last call to ``populate_projects`` by project key.
+        """
+        return self._project_errors
+
     @property
     def jiraclient(self) -> JIRA:
         """
@@ -859,7 +3368,258 @@ class Jira:
         return self._datastore['projects']
 
 
-def init_jira_adapter(jira_api_token: str = None, jira_oauth_config_path: str = None, jira_server_url: str = None, jira_username: str = None) -> Jira:
+class AsyncJira:
+    """An asyncio wrapper around the :py:class:`Jira` adapter, for pulling data from Jira without
+    blocking an event loop.
+
+    The Jira client is synchronous, so the work of each call (the requests to Jira and building the
+    issues from them) is run on a pool of up to ``max_concurrency`` threads while the event loop gets
+    on with other things. The connection pool of the client's session is sized to match (unless a
+    scheduler is mounted on it, which sizes its own) so concurrent requests reuse connections rather
+    than opening new ones. Results are stored in, and can
+    be read back from, the wrapped adapter just as if it had been called directly.
+
+    Args:
+        jira: The :py:class:`Jira` adapter to wrap.
+        max_concurrency (optional): The most calls to run at the same time.
+
+    Example usage:
+
+        >>> jm = AsyncJira(init_jira_adapter(jira_oauth_config_path=Path.home()))
+        >>> query_result, project = await asyncio.gather(
+                jm.populate_from_jql('project = "INT" AND status = "Done"', label='INT done'),
+                jm.get_project_issues('OPS'))
+    """
+
+    def __init__(self, jira: Jira, max_concurrency: int = 8) -> None:
+        self._jira = jira
+        self._max_concurrency = max(1, max_concurrency or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+        # Each call may itself fetch pages in parallel.
+        _grow_pool(getattr(jira.jiraclient, '_session', None),
+                   self._max_concurrency * jira._fetch_workers)
+
+    async def _run(self, method, *args, **kwargs) -> object:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(method, *args, **kwargs))
+
+    async def populate_projects(self, projectids: List[str], max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> Dict[str, JiraProject]:
+        """Pull the issues of each of a list of projects. Projects are pulled concurrently (up to
+        ``max_concurrency`` at a time) and errors are kept in ``project_errors``. See
+        :py:meth:`Jira.populate_projects`.
+
+        Args:
+            projectids: A list of project ids for which you want to pull issues.
+            max_results: Limit the number of issues returned by the query.
+            incremental (optional): Only fetch issues updated since each project was last pulled.
+            fields (optional): Only fetch what is needed for these :py:class:`JiraIssue` dictionary entries.
+            changelog (optional): Set to False to fetch the issues without their changelogs.
+
+        Returns:
+            Dict[str, JiraProject]: A dictionary of JiraProjects. Each key will be the id for the corresponding project.
+        """
+        if fields != None:
+            fields = JiraIssue.jira_fields(fields)
+
+        async def get(pid: str) -> Tuple[str, JiraProject, Exception]:
+            try:
+                return pid, await self._run(self._jira._get_project, pid, max_results, incremental, fields, changelog), None
+            except Exception as error:
+                return pid, None, error
+
+        outcomes = await asyncio.gather(*[get(pid) for pid in dict.fromkeys(projectids)])
+        projects = {pid: proj for pid, proj, error in outcomes
+                    if error == None and len(proj)}
+        errors = {pid: error for pid, proj, error in outcomes if error != None}
+        self._jira._store_projects(projects, errors)
+        return projects
+
+    async def get_project_issues(self, projectid: str, max_results: int = False, incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> JiraProject:
+        """Get issues for a particular project key. See :py:meth:`Jira.get_project_issues`.
+
+        Args:
+            projectid: A project id for which you want to pull issues.
+            max_results: Limit the number of issues returned by the query.
+            incremental (optional): Only fetch issues updated since the project was last pulled.
+            fields (optional): Only fetch what is needed for these :py:class:`JiraIssue` dictionary entries.
+            changelog (optional): Set to False to fetch the issues without their changelogs.
+
+        Returns:
+            JiraProject: A list of JiraIssue instances.
+        """
+        return await self._run(self._jira.get_project_issues, projectid, max_results, incremental, fields, changelog)
+
+    async def populate_from_jql(self, query: str = None, max_results: int = False, label: str = "JQL", incremental: bool = False, fields: List[str] = None, changelog: bool = True) -> JQLResult:
+        """Pull the issues matching a JQL query. See :py:meth:`Jira.populate_from_jql`.
+
+        Args:
+            query: The JQL query to perform against the Jira data.
+            max_results: Limit the number of issues returned by the query.
+            label (optional): A string label to store the query result internally.
+            incremental (optional): Only fetch the issues updated since the query was last run.
+            fields (optional): Only fetch what is needed for these :py:class:`JiraIssue` dictionary entries.
+            changelog (optional): Set to False to fetch the issues without their changelogs.
+
+        Returns:
+            JQLResult: an instance of :py:class:`JQLResult`
+        """
+        return await self._run(self._jira.populate_from_jql, query, max_results, label, incremental, fields, changelog)
+
+    def get_query_result(self, label: str = 'JQL') -> JQLResult:
+        """Get a stored JQL query result. See :py:meth:`Jira.get_query_result`."""
+        return self._jira.get_query_result(label)
+
+    def get_project(self, pid: str) -> JiraProject:
+        """Get a stored project. See :py:meth:`Jira.get_project`."""
+        return self._jira.get_project(pid)
+
+    def close(self) -> None:
+        """Shut down the thread pool once the calls that are running have finished, then close the
+        wrapped adapter. See :py:meth:`Jira.close`.
+        """
+        self._executor.shutdown(wait=True)
+        self._jira.close()
+
+    @property
+    def jira(self) -> Jira:
+        """
+        :py:class:`Jira`: `jira`
+            The synchronous adapter wrapped by this one.
+        """
+        return self._jira
+
+    @property
+    def project_errors(self) -> Dict[str, Exception]:
+        """
+        Dict[str, Exception]: `project_errors`
+            The errors raised pulling projects in the last call to ``populate_projects`` by project key.
+        """
+        return self._jira.project_errors
+
+    @property
+    def projects(self) -> Dict[str, JiraProject]:
+        """
+        Dict[str, JiraProject]: `projects`
+            A dictionary of Jira Project instances by project key e.g. INT
+        """
+        return self._jira.projects
+
+    @property
+    def stats(self) -> AdapterStats:
+        """
+        :py:class:`engineeringmetrics.stats.AdapterStats`: `stats`
+            The timers and counters of the wrapped adapter (or None).
+        """
+        return self._jira.stats
+
+
+# The adapter whose scheduler and stats are on each session, as the finalizer that takes them off.
+_SESSION_OWNERS = weakref.WeakKeyDictionary()
+
+
+def _release_session(session: object, scheduler: RequestScheduler, stats: AdapterStats) -> None:
+    """Take an adapter's scheduler and stats off a session."""
+    if scheduler != None:
+        scheduler.unmount(session)
+    if stats != None:
+        stats.unwatch(session)
+
+
+def _session_in_use(session: object) -> bool:
+    """Whether an adapter that is still open has its scheduler or stats on a session."""
+    owner = _SESSION_OWNERS.get(session)
+    return owner != None and owner.alive
+
+
+# Jira clients already set up in this process, keyed by server and (a digest of) the credentials.
+_JIRA_CLIENTS: Dict[tuple, JIRA] = {}
+_JIRA_CLIENTS_LOCK = threading.Lock()
+
+# Connections kept open to the server by each client, at the least.
+_JIRA_POOL_SIZE = 10
+
+
+def _session_changelog_pages(jiraclient: JIRA) -> Callable[[str, int, int], dict]:
+    """A function fetching pages of changelogs through a Jira client's session from its ``server_url``,
+    or None if the client doesn't have both. See ``Jira._changelog_pages``.
+    """
+    session = getattr(jiraclient, '_session', None)
+    server_url = getattr(jiraclient, 'server_url', None)
+    if session == None or not server_url:
+        return None
+    options = getattr(jiraclient, '_options', None) or {}
+    url = '{}/rest/{}/{}/issue/{{}}/changelog'.format(
+        server_url.rstrip('/'), options.get('rest_path', 'api'), options.get('rest_api_version', '2'))
+
+    def get_page(key: str, start_at: int, max_results: int) -> dict:
+        response = session.get(url.format(key), params={'startAt': start_at, 'maxResults': max_results})
+        response.raise_for_status()
+        return response.json()
+    return get_page
+
+
+def _grow_pool(session: object, pool_size: int) -> None:
+    """Make sure the transport adapters of a requests session keep at least ``pool_size`` connections
+    open to each host. The adapters are resized where they are, so the session keeps their settings.
+    A session with a scheduler mounted is left alone, as the scheduler sizes its own pool.
+    """
+    if session == None or mounted_scheduler(session) != None:
+        return
+    for prefix in ('http://', 'https://'):
+        adapter = session.adapters.get(prefix)
+        if isinstance(adapter, HTTPAdapter) and adapter._pool_maxsize < pool_size:
+            # Connections already open in the old pool are closed as they are returned.
+            adapter.poolmanager.clear()
+            adapter._pool_connections = adapter._pool_maxsize = pool_size
+            adapter.init_poolmanager(pool_size, pool_size, block=adapter._pool_block)
+
+
+def _credentials_digest(*credentials: str) -> str:
+    return hashlib.sha256('\0'.join(credentials).encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=16)
+def _read_key_cert(path: str, modified: int) -> str:
+    """The contents of a private key file, read once for each time it is modified."""
+    with open(path, 'r') as key_cert_file:
+        return key_cert_file.read()
+
+
+def _jira_client(key: tuple, pool_size: int, reuse: bool, connect, exclusive: bool = False) -> JIRA:
+    """The client for a server and credentials, connected the first time it is asked for and shared after.
+
+    The connection pool of the client's session is made big enough to keep a connection open for each
+    request that may be sent at once, so connections are kept alive between requests rather than
+    dropped when the pool overflows.
+
+    A session carries the scheduler and stats of one adapter at a time. An adapter that brings its own
+    (``exclusive``) gets a client of its own while the shared client's session still has those of an
+    adapter that hasn't been closed.
+    """
+    with _JIRA_CLIENTS_LOCK:
+        jiraclient = _JIRA_CLIENTS.get(key) if reuse else None
+        if jiraclient != None and exclusive and _session_in_use(getattr(jiraclient, '_session', None)):
+            jiraclient = connect()
+        elif jiraclient == None:
+            jiraclient = connect()
+            if reuse:
+                _JIRA_CLIENTS[key] = jiraclient
+
+        _grow_pool(getattr(jiraclient, '_session', None),
+                   max(_JIRA_POOL_SIZE, pool_size))
+        return jiraclient
+
+
+def clear_jira_clients() -> None:
+    """Forget the Jira clients shared by ``init_jira_adapter``, e.g. after credentials have changed.
+    The next adapter set up for each server connects again.
+    """
+    with _JIRA_CLIENTS_LOCK:
+        _JIRA_CLIENTS.clear()
+    _read_key_cert.cache_clear()
+
+
+def init_jira_adapter(jira_api_token: str = None, jira_oauth_config_path: str = None, jira_server_url: str = None, jira_username: str = None, business_calendar: BusinessCalendar = None, compact_flow_logs: bool = False, columnar: bool = False, issue_cache: IssueCache = None, fetch_workers: int = 1, page_size: int = 100, project_workers: int = 1, lazy_issues: bool = False, process_workers: int = None, process_pool_threshold: int = None, share_issues: bool = False, scheduler: RequestScheduler = None, reuse_client: bool = True, stats: AdapterStats = None, record_path: str = None, replay_path: str = None) -> Jira:
     """Set up an adapter to pull data from Jira. Handles the auth flow and returns an instance of the Jira
     class that facilitates metircs analysis around Jira data.
 
@@ -872,16 +3632,59 @@ def init_jira_adapter(jira_api_token: str = None, jira_oauth_config_path: str =
             THe url of the jira instance to pull from.
         jira_username:
             The usename to use for authentication. Should be the username that owns the jira_api_token.
+        business_calendar:
+            The :py:class:`BusinessCalendar` to measure durations against. Defaults to Monday to Friday.
+        compact_flow_logs:
+            Store issue flow logs as :py:class:`CompactFlowLog` instances.
+        columnar:
+            Build the :py:class:`IssueColumns` store of each result as the issues are pulled.
+        issue_cache:
+            An :py:class:`engineeringmetrics.cache.IssueCache` to keep raw issues in between sessions.
+        fetch_workers:
+            The number of pages of search results to fetch at the same time.
+        page_size:
+            The number of issues to ask for in each page when fetching in parallel.
+        project_workers:
+            The number of projects to pull at the same time in ``populate_projects``.
+        lazy_issues:
+            Only parse the fields of each issue that are used.
+        process_workers:
+            The number of processes to build large search results in.
+        process_pool_threshold:
+            The number of issues a search has to return before they are built in processes.
+        share_issues:
+            Reuse one :py:class:`JiraIssue` for each unchanged issue across results. Changes made to
+            an issue through one result show in the others. Defaults to False.
+        scheduler:
+            A :py:class:`engineeringmetrics.scheduler.RequestScheduler` to pace and retry requests with.
+        reuse_client:
+            Share one Jira client (and its HTTP session and connections) between every adapter set up
+            in this process for the same server and credentials, so only the first one has to connect.
+            An adapter with a scheduler or stats gets a client of its own instead while another adapter
+            that hasn't been closed has its scheduler or stats on the shared one. See ``clear_jira_clients``.
+        stats:
+            An :py:class:`engineeringmetrics.stats.AdapterStats` to time and count the adapter's work in.
+        record_path:
+            Record every search, project and changelog response from Jira to a
+            :py:class:`engineeringmetrics.replay.JiraArchive` at this path.
+        replay_path:
+            Serve the responses recorded in the archive at this path instead of connecting to Jira. No
+            credentials are needed.
     Returns:
         Jira: An instance of the Jira adapter class
     """
-    if jira_api_token and jira_username and jira_server_url:
+    if replay_path != None:
+        jiraclient = ReplayJIRA(replay_path)
+    elif jira_api_token and jira_username and jira_server_url:
         options = {
             'server': jira_server_url
         }
-        return Jira(JIRA(options, basic_auth=(jira_username, jira_api_token)))
-
-    if jira_oauth_config_path != None:
+        jiraclient = _jira_client(
+            (jira_server_url, jira_username, _credentials_digest(jira_api_token)),
+            fetch_workers * project_workers, reuse_client,
+            lambda: JIRA(options, basic_auth=(jira_username, jira_api_token)),
+            scheduler != None or stats != None)
+    elif jira_oauth_config_path != None:
         path_to_config = os.path.join(jira_oauth_config_path,
                                       '.oauthconfig/.oauth_jira_config')
 
@@ -894,10 +3697,11 @@ def init_jira_adapter(jira_api_token: str = None, jira_oauth_config_path: str =
             "oauth_token_config", "oauth_token_secret")
         consumer_key = config.get("oauth_token_config", "consumer_key")
 
-        rsa_private_key = None
         # Load RSA Private Key file.
-        with open(os.path.join(jira_oauth_config_path, '.oauthconfig/oauth.pem'), 'r') as key_cert_file:
-            rsa_private_key = key_cert_file.read()
+        key_cert_path = os.path.join(
+            jira_oauth_config_path, '.oauthconfig/oauth.pem')
+        rsa_private_key = _read_key_cert(
+            key_cert_path, os.stat(key_cert_path).st_mtime_ns)
 
         if jira_url[-1] == '/':
             jira_url = jira_url[0:-1]
@@ -909,4 +3713,16 @@ def init_jira_adapter(jira_api_token: str = None, jira_oauth_config_path: str =
             'key_cert': rsa_private_key
         }
 
-        return Jira(JIRA(oauth=oauth_dict, server=jira_url))
+        jiraclient = _jira_client(
+            (jira_url, consumer_key, oauth_token, _credentials_digest(
+                oauth_token_secret, rsa_private_key)),
+            fetch_workers * project_workers, reuse_client,
+            lambda: JIRA(oauth=oauth_dict, server=jira_url),
+            scheduler != None or stats != None)
+    else:
+        return None
+
+    if record_path != None and replay_path == None:
+        # Wrapped after it is shared, so other adapters using the client aren't recorded.
+        jiraclient = RecordingJIRA(jiraclient, record_path)
+    return Jira(jiraclient, business_calendar, compact_flow_logs, columnar, issue_cache, fetch_workers, page_size, project_workers, lazy_issues, process_workers, process_pool_threshold, share_issues, scheduler, stats)
@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Persistent caches for raw issue data pulled from Jira.
+
+A cache stores the raw JSON of each issue (including its changelog) keyed by the issue key and the
+``updated`` timestamp Jira reported for it. The :py:class:`engineeringmetrics.adapters.Jira` adapter
+uses it to rebuild issues that have not changed since they were cached rather than downloading them
+again, so restarting a notebook kernel doesn't mean pulling everything from the server.
+"""
+import abc
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List
+
+
+class IssueCache(abc.ABC):
+    """Interface for issue caches. Subclass this to store issues somewhere other than SQLite.
+
+    Issues are passed in and out as the raw JSON dictionaries returned by the Jira REST api, i.e. with
+    ``"key"`` and ``"fields"`` keys (and ``"changelog"`` if it was expanded).
+    """
+
+    @abc.abstractmethod
+    def updated(self, keys: List[str]) -> Dict[str, str]:
+        """The ``updated`` timestamp stored for each of a list of issue keys.
+
+        Args:
+            keys: The issue keys to look up.
+
+        Returns:
+            Dict[str, str]: The raw ``updated`` string for each key that is in the cache.
+        """
+
+    @abc.abstractmethod
+    def get(self, keys: List[str]) -> Dict[str, dict]:
+        """The cached raw JSON of a list of issues.
+
+        Args:
+            keys: The issue keys to look up.
+
+        Returns:
+            Dict[str, dict]: The raw issue for each key that is in the cache.
+        """
+
+    @abc.abstractmethod
+    def put(self, issues: List[dict]) -> None:
+        """Add issues to the cache, replacing any older copies.
+
+        Args:
+            issues: A list of raw issues.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove everything from the cache."""
+
+
+class SQLiteIssueCache(IssueCache):
+    """An :py:class:`IssueCache` stored in a local SQLite database file. Nothing other than the file
+    is needed, so it works on a laptop with no other services running.
+
+    Issues are stored as compressed JSON. If the cache grows beyond either of its limits the least
+    recently used issues are evicted.
+
+    Args:
+        path: The path of the database file. It is created if it doesn't exist.
+        max_issues (optional): The most issues to keep in the cache.
+        max_bytes (optional): The most (compressed) bytes of issue data to keep in the cache.
+
+    Example usage:
+
+        >>> from engineeringmetrics.cache import SQLiteIssueCache
+        >>> cache = SQLiteIssueCache('~/.engineeringmetrics/issues.sqlite', max_issues=500000)
+    """
+
+    def __init__(self, path: str, max_issues: int = None, max_bytes: int = None) -> None:
+        path = os.path.expanduser(str(path))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._max_issues = max_issues
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS issues (
+                    key TEXT PRIMARY KEY,
+                    updated TEXT NOT NULL,
+                    raw BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed REAL NOT NULL
+                )''')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS issues_accessed ON issues (accessed)')
+
+    # SQLite limits the number of parameters in a statement so we look keys up in chunks.
+    __CHUNK_SIZE__ = 500
+
+    def _chunks(self, keys: List[str]) -> List[List[str]]:
+        keys = list(keys)
+        return [keys[i:i + self.__CHUNK_SIZE__] for i in range(0, len(keys), self.__CHUNK_SIZE__)]
+
+    @property
+    def path(self) -> str:
+        """
+        str: `path`
+            The path of the database file.
+        """
+        return self._path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM issues').fetchone()[0]
+
+    def updated(self, keys: List[str]) -> Dict[str, str]:
+        found = {}
+        with self._lock:
+            for chunk in self._chunks(keys):
+                rows = self._connection.execute(
+                    'SELECT key, updated FROM issues WHERE key IN ({})'.format(
+                        ','.join('?' * len(chunk))),
+                    chunk)
+                found.update(rows)
+        return found
+
+    def get(self, keys: List[str]) -> Dict[str, dict]:
+        found = {}
+        now = time.time()
+        with self._lock, self._connection:
+            for chunk in self._chunks(keys):
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    'SELECT key, raw FROM issues WHERE key IN ({})'.format(placeholders), chunk)
+                for key, raw in rows:
+                    found[key] = json.loads(zlib.decompress(raw))
+                self._connection.execute(
+                    'UPDATE issues SET accessed = ? WHERE key IN ({})'.format(placeholders), [now] + chunk)
+        return found
+
+    def put(self, issues: List[dict]) -> None:
+        now = time.time()
+        rows = []
+        for issue in issues:
+            raw = zlib.compress(json.dumps(
+                issue, separators=(',', ':')).encode('utf-8'))
+            rows.append((issue['key'], issue['fields']
+                         ['updated'], raw, len(raw), now))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO issues (key, updated, raw, size, accessed) VALUES (?, ?, ?, ?, ?)', rows)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used issues until the cache is within its limits."""
+        if self._max_issues != None:
+            self._connection.execute('''
+                DELETE FROM issues WHERE key IN (
+                    SELECT key FROM issues ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                )''', (self._max_issues,))
+        if self._max_bytes != None:
+            self._connection.execute('''
+                DELETE FROM issues WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total FROM issues
+                    ) WHERE total > ?
+                )''', (self._max_bytes,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM issues')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
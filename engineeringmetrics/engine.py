@@ -3,12 +3,21 @@
 """A library that provides a set of wrappers around data pulled from data sources from across the business"""
 
 from engineeringmetrics import adapters
+from engineeringmetrics.cache import SQLiteIssueCache
+from engineeringmetrics.scheduler import RequestScheduler
+from engineeringmetrics.stats import AdapterStats
 from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Mapping
 
 CONFIG_KEYS = ['jira_api_token', 'jira_username',
-               'jira_server_url', 'jira_oauth_config_path']
+               'jira_server_url', 'jira_oauth_config_path', 'business_calendar',
+               'compact_flow_logs', 'columnar', 'jira_cache', 'jira_cache_path',
+               'jira_cache_max_issues', 'jira_cache_max_bytes', 'jira_fetch_workers',
+               'jira_page_size', 'jira_project_workers', 'lazy_issues', 'jira_async',
+               'jira_async_concurrency', 'process_workers', 'process_pool_threshold',
+               'share_issues', 'jira_rate_limit', 'jira_scheduler',
+               'jira_reuse_client', 'jira_stats', 'jira_record_path', 'jira_replay_path']
 
 
 class EngineeringMetrics:
@@ -24,6 +33,70 @@ class EngineeringMetrics:
             Path to the jira oauth config and keys (str)
         ``"jira_access_token"``
             A valid access token for Jira cloud (str)
+        ``"jira_api_token"``
+            A valid api token for Jira cloud (str)
+        ``"jira_username"``
+            The username for jira cloud instance (str)
+        ``"jira_server_url"``
+            The url of your jira cloud instance (str)
+        ``"business_calendar"``
+            The working week durations are measured against. Either an instance of
+            :py:class:`engineeringmetrics.adapters.BusinessCalendar` or a dict of arguments
+            for one e.g. ``{'weekmask': 'Sun Mon Tue Wed Thu', 'holidays': ['2019-12-25']}`` (optional)
+        ``"compact_flow_logs"``
+            Store issue flow logs in compact arrays to save memory on large pulls (bool, optional)
+        ``"columnar"``
+            Build the numpy column store of each query result as issues are pulled (bool, optional)
+        ``"lazy_issues"``
+            Only parse the fields of each issue when they are first used (bool, optional)
+        ``"process_workers"``
+            The number of processes to build issues in for large query results. Defaults to the number
+            of CPUs, set it to 1 to turn this off (int, optional)
+        ``"process_pool_threshold"``
+            The number of issues a query has to return before they are built in processes. Defaults to
+            10000 (int, optional)
+        ``"share_issues"``
+            Reuse one parsed issue for each issue that hasn't changed across query results, so changes
+            made to an issue through one result show in the others. Defaults to False (bool, optional)
+        ``"jira_cache_path"``
+            Path to a SQLite file to cache raw Jira issues in between sessions (str, optional)
+        ``"jira_cache_max_issues"``
+            The most issues to keep in the cache before evicting the least recently used (int, optional)
+        ``"jira_cache_max_bytes"``
+            The most bytes of issue data to keep in the cache before evicting the least recently used (int, optional)
+        ``"jira_cache"``
+            An :py:class:`engineeringmetrics.cache.IssueCache` to use instead of the SQLite cache (optional)
+        ``"jira_fetch_workers"``
+            The number of pages of Jira search results to fetch concurrently. Defaults to 1 (int, optional)
+        ``"jira_page_size"``
+            The number of issues in each page when fetching concurrently. Defaults to 100 (int, optional)
+        ``"jira_project_workers"``
+            The number of projects ``populate_projects`` pulls concurrently. Defaults to 1 (int, optional)
+        ``"jira_async"``
+            Make ``jirametrics`` an :py:class:`engineeringmetrics.adapters.AsyncJira` adapter with awaitable
+            methods, for use in asyncio applications (bool, optional)
+        ``"jira_async_concurrency"``
+            The most calls the ``AsyncJira`` adapter runs at the same time. Defaults to 8 (int, optional)
+        ``"jira_rate_limit"``
+            The most requests per second to send to Jira. Setting it sends requests through an
+            :py:class:`engineeringmetrics.scheduler.RequestScheduler` that also retries throttled requests
+            and adjusts how many are sent at once (float, optional)
+        ``"jira_scheduler"``
+            A :py:class:`engineeringmetrics.scheduler.RequestScheduler` to send Jira requests through,
+            instead of one made from ``jira_rate_limit`` (optional)
+        ``"jira_reuse_client"``
+            Share the Jira client, and its connections, with every other ``EngineeringMetrics`` in this
+            process set up for the same server and credentials. Defaults to True (bool, optional)
+        ``"jira_stats"``
+            True, or an :py:class:`engineeringmetrics.stats.AdapterStats`, to time each phase of pulling
+            issues and count requests, bytes, issues, transitions and cache hits. The stats are the
+            ``stats`` property of ``jirametrics`` (bool or AdapterStats, optional)
+        ``"jira_record_path"``
+            Record every search, project and changelog response from Jira to an archive file at this path
+            (str, optional)
+        ``"jira_replay_path"``
+            Serve the responses recorded in the archive at this path rather than connecting to Jira, for
+            running a report again offline against the same data. No credentials are needed (str, optional)
 
     Example usage:
 
@@ -48,6 +121,8 @@ class EngineeringMetrics:
                     Path to the jira oauth config and keys (str)
                 ``"jira_access_token"``
                     A valid access token for Jira cloud (str)
+
+                See :py:class:`EngineeringMetrics` for every key.
         """
         if not config:
             config = {'jira_oauth_config_path': Path.home()}
@@ -70,15 +145,62 @@ class EngineeringMetrics:
         jira_api_token, jira_username, jira_server_url, jira_oauth_config_path = itemgetter(
             'jira_api_token', 'jira_username', 'jira_server_url', 'jira_oauth_config_path')(config)
 
-        if jira_api_token and jira_username and jira_server_url:
+        business_calendar = config['business_calendar']
+        compact_flow_logs = bool(config['compact_flow_logs'])
+        columnar = bool(config['columnar'])
+
+        issue_cache = config['jira_cache']
+        if issue_cache == None and config['jira_cache_path'] != None:
+            issue_cache = SQLiteIssueCache(
+                config['jira_cache_path'], max_issues=config['jira_cache_max_issues'],
+                max_bytes=config['jira_cache_max_bytes'])
+
+        scheduler = config['jira_scheduler']
+        if scheduler == None and config['jira_rate_limit'] != None:
+            scheduler = RequestScheduler(rate=config['jira_rate_limit'], max_concurrency=max(
+                8, (config['jira_fetch_workers'] or 1) * (config['jira_project_workers'] or 1)))
+
+        stats = config['jira_stats']
+        if stats == True:
+            stats = AdapterStats()
+
+        jira_options = dict(fetch_workers=config['jira_fetch_workers'] or 1,
+                            page_size=config['jira_page_size'] or 100,
+                            project_workers=config['jira_project_workers'] or 1,
+                            lazy_issues=bool(config['lazy_issues']),
+                            process_workers=config['process_workers'],
+                            process_pool_threshold=config['process_pool_threshold'],
+                            share_issues=bool(config['share_issues']),
+                            scheduler=scheduler,
+                            reuse_client=config['jira_reuse_client'] != False,
+                            stats=stats or None,
+                            record_path=config['jira_record_path'])
+        if isinstance(business_calendar, dict):
+            business_calendar = adapters.BusinessCalendar(**business_calendar)
+
+        if config['jira_replay_path'] != None:
+            jira_adapter = adapters.init_jira_adapter(
+                replay_path=config['jira_replay_path'], business_calendar=business_calendar,
+                compact_flow_logs=compact_flow_logs, columnar=columnar, issue_cache=issue_cache,
+                **jira_options)
+            data_adapters['jira'] = jira_adapter
+        elif jira_api_token and jira_username and jira_server_url:
             jira_adapter = adapters.init_jira_adapter(
-                jira_api_token=jira_api_token, jira_username=jira_username, jira_server_url=jira_server_url)
+                jira_api_token=jira_api_token, jira_username=jira_username, jira_server_url=jira_server_url,
+                business_calendar=business_calendar, compact_flow_logs=compact_flow_logs, columnar=columnar, issue_cache=issue_cache,
+                **jira_options)
             data_adapters['jira'] = jira_adapter
         elif jira_oauth_config_path != None:
             jira_adapter = adapters.init_jira_adapter(
-                jira_oauth_config_path=jira_oauth_config_path)
+                jira_oauth_config_path=jira_oauth_config_path, business_calendar=business_calendar,
+                compact_flow_logs=compact_flow_logs, columnar=columnar, issue_cache=issue_cache,
+                **jira_options)
             data_adapters['jira'] = jira_adapter
 
+        if config['jira_async'] and 'jira' in data_adapters:
+            data_adapters['jira'] = adapters.AsyncJira(
+                data_adapters['jira'], config['jira_async_concurrency'] or 8)
+
         return data_adapters
 
     @property
@@ -87,6 +209,7 @@ class EngineeringMetrics:
         Jira: `jirametrics`
             If Jira authentication is configured in the constructor this property
             is populated with an instance of the Jira adapter for pulling data from Jira.
+            With the ``jira_async`` config key it is an instance of AsyncJira instead.
         """
         return self._data_adapters['jira']
 
@@ -106,6 +229,8 @@ def jirametrics(config: Dict[str, str] = None) -> adapters.Jira:
             ``"jira_server_url"``
                 The url of your jira cloud instance (str)
 
+            See :py:class:`EngineeringMetrics` for every key.
+
     Returns:
         adapters.Jira: An instance of :py:class:`adapters.Jira`
 
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Dictionaries whose entries are worked out the first time they are used.
+
+A :py:class:`LazyDict` is the base of :py:class:`engineeringmetrics.adapters.JiraIssue`. It keeps
+track of the dictionary entries that haven't been worked out yet, and of the methods that set the
+attributes they are worked out from, so a subclass only says how to work out an entry
+(``_key_value``) and which method sets each attribute (``__ATTRIBUTE_LOADERS__``). Reading an entry
+works out just that entry, and anything that needs all of them (iterating, ``len()``, comparing,
+copying or pickling) fills in every entry first.
+"""
+from typing import Dict
+
+# Marks a dictionary entry that a dictionary doesn't have, e.g. assigneeName for an unassigned issue.
+_MISSING = object()
+
+
+class LazyDict(dict):
+    """A dictionary whose entries, and the attributes they are worked out from, are worked out the first
+    time they are used.
+
+    Subclasses set these up in their ``__init__``
+
+        ``_pending``
+            A dict whose keys are the entries still to be worked out, in order, or None once all of them
+            have been.
+        ``_key_order``
+            The order entries have once they have all been worked out.
+        ``_unloaded``
+            The names of the methods in ``__ATTRIBUTE_LOADERS__`` that haven't been called yet.
+
+    and override ``_key_value``.
+    """
+
+    # The method that sets each attribute worked out on first use.
+    __ATTRIBUTE_LOADERS__: Dict[str, str] = {}
+
+    def _key_value(self, key: str) -> object:
+        """Work out a dictionary entry, or _MISSING if the dictionary doesn't have it.
+
+        By default a dictionary has none of its pending entries. This isn't an abstract method as dict
+        subclasses can be created whether or not they implement those.
+        """
+        return _MISSING
+
+    def _load_attributes(self, loader: str) -> None:
+        if loader in self._unloaded:
+            self._unloaded.discard(loader)
+            getattr(self, loader)()
+
+    def __getattr__(self, name: str) -> object:
+        # Only called for attributes that haven't been set, i.e. ones that haven't been loaded yet.
+        loader = type(self).__ATTRIBUTE_LOADERS__.get(name)
+        if loader != None and '_unloaded' in self.__dict__:
+            self._load_attributes(loader)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            type(self).__name__, name))
+
+    def _load(self, key: str) -> None:
+        """Fill in a dictionary entry if it hasn't been loaded yet."""
+        if self._pending and key in self._pending:
+            del self._pending[key]
+            value = self._key_value(key)
+            if value is not _MISSING:
+                dict.__setitem__(self, key, value)
+
+    def _materialize(self) -> None:
+        """Fill in every dictionary entry that hasn't been loaded yet."""
+        pending = self._pending
+        if pending == None:
+            return
+        loaded_out_of_order = len(pending) < len(self._key_order)
+        # No entry needs another to work it out, so they can all be marked as loaded up front.
+        self._pending = None
+        for key in pending:
+            value = self._key_value(key)
+            if value is not _MISSING:
+                dict.__setitem__(self, key, value)
+        if loaded_out_of_order:
+            # Put the entries back in the order they have when nothing is lazy.
+            order = {key: i for i, key in enumerate(self._key_order)}
+            entries = sorted(dict.items(self),
+                             key=lambda e: order.get(e[0], len(order)))
+            dict.clear(self)
+            dict.update(self, entries)
+
+    def _loading_key(method):
+        """Wrap a dict method that takes a key so it loads that entry first."""
+        def wrapper(self, key, *args, **kwargs):
+            self._load(key)
+            return method(self, key, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def _materializing(method):
+        """Wrap a dict method that needs every entry so it loads them all first."""
+        def wrapper(self, *args, **kwargs):
+            self._materialize()
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    __getitem__ = _loading_key(dict.__getitem__)
+    __delitem__ = _loading_key(dict.__delitem__)
+    __contains__ = _loading_key(dict.__contains__)
+    get = _loading_key(dict.get)
+    pop = _loading_key(dict.pop)
+    setdefault = _loading_key(dict.setdefault)
+    __iter__ = _materializing(dict.__iter__)
+    __reversed__ = _materializing(dict.__reversed__)
+    __len__ = _materializing(dict.__len__)
+    __repr__ = _materializing(dict.__repr__)
+    __or__ = _materializing(dict.__or__)
+    __ior__ = _materializing(dict.__ior__)
+    keys = _materializing(dict.keys)
+    values = _materializing(dict.values)
+    items = _materializing(dict.items)
+    copy = _materializing(dict.copy)
+    update = _materializing(dict.update)
+    popitem = _materializing(dict.popitem)
+    clear = _materializing(dict.clear)
+    del _loading_key, _materializing
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # copy.copy, copy.deepcopy and pickle all start here. The copy gets every entry, and its own
+        # record of the attributes still to load so loading one on the copy doesn't lose it here.
+        self._materialize()
+        reduced = super().__reduce_ex__(protocol)
+        state = reduced[2]
+        if isinstance(state, dict) and isinstance(state.get('_unloaded'), set):
+            state = dict(state, _unloaded=set(state['_unloaded']))
+            reduced = reduced[:2] + (state,) + reduced[3:]
+        return reduced
+
+    def __setitem__(self, key: str, value: object) -> None:
+        # Look _pending up with getattr as entries are set before it when a dictionary is unpickled,
+        # and subclasses may only make it when it is needed.
+        pending = getattr(self, '_pending', None)
+        if pending:
+            pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyDict):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __bool__(self) -> bool:
+        return bool(self._pending) or dict.__len__(self) > 0
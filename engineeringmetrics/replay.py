@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Recording the Jira traffic of a run and replaying it without a server.
+
+A :py:class:`RecordingJIRA` wraps a ``jira.JIRA`` client and writes every search, project and
+changelog response the :py:class:`engineeringmetrics.adapters.Jira` adapter gets through it to a
+:py:class:`JiraArchive`. That is a single SQLite file of compressed JSON. A :py:class:`ReplayJIRA`
+serves the same responses from the archive with no network, so a report can be run again against
+exactly the data it first ran against. This is useful for profiling, debugging and regression tests.
+
+Example usage:
+
+    >>> from engineeringmetrics.replay import RecordingJIRA, ReplayJIRA
+    >>> jm = Jira(RecordingJIRA(jiraclient, 'runs/2020-06-01.jira'))
+    >>> jm.populate_projects(['INT', 'OPS'])
+    >>> offline = Jira(ReplayJIRA('runs/2020-06-01.jira'))
+    >>> offline.populate_projects(['INT', 'OPS'])
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from typing import Callable, Dict, List
+
+from jira import JIRA, client
+from jira.resources import Issue, Project
+
+# The client options resource URLs are built from, which a replay needs to build the same resources.
+_URL_OPTIONS = ('server', 'context_path', 'rest_path', 'rest_api_version',
+                'agile_rest_path', 'agile_rest_api_version')
+
+# Incremental pulls ask for issues updated in the last so many minutes, counted from the time of the
+# run. The count is left out of the request a response is recorded against so a replay finds it later.
+_RELATIVE_UPDATED = re.compile(r'(\bupdated\s*>=\s*")-\d+m(")', flags=re.IGNORECASE)
+
+
+def _request_key(method: str, *args: object) -> str:
+    """The key a response to a client call is stored under."""
+    if method == 'search_issues':
+        args = (_RELATIVE_UPDATED.sub(r'\1-m\2', args[0]),) + args[1:]
+    return json.dumps([method] + list(args), sort_keys=True, separators=(',', ':'))
+
+
+def _search_fields(fields: object) -> object:
+    """The fields of a search as a list, however the caller gave them."""
+    return fields.split(',') if isinstance(fields, str) else fields
+
+
+class JiraArchive:
+    """The responses recorded from a Jira client, stored in a local SQLite file.
+
+    Each response is stored as compressed JSON against the call that got it. A call made more than
+    once keeps each of its responses in order, so a run that asks for the same thing twice and gets
+    different answers (an incremental pull, say) is replayed the same way.
+
+    Args:
+        path: The path of the archive file. It is created if it doesn't exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        path = os.path.expanduser(str(path))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    request TEXT NOT NULL,
+                    sequence INTEGER NOT NULL,
+                    response BLOB NOT NULL,
+                    PRIMARY KEY (request, sequence)
+                )''')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS options (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )''')
+
+    @property
+    def path(self) -> str:
+        """
+        str: `path`
+            The path of the archive file.
+        """
+        return self._path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def add(self, request: str, response: object) -> None:
+        """Store a response after any others to the same request.
+
+        Args:
+            request: The request key.
+            response: The JSON of the response.
+        """
+        raw = zlib.compress(json.dumps(
+            response, separators=(',', ':')).encode('utf-8'))
+        with self._lock, self._connection:
+            self._connection.execute('''
+                INSERT INTO responses (request, sequence, response)
+                SELECT ?, COALESCE(MAX(sequence), -1) + 1, ? FROM responses WHERE request = ?''',
+                                     (request, raw, request))
+
+    def responses(self, request: str) -> List[object]:
+        """The responses stored for a request, in the order they were recorded.
+
+        Args:
+            request: The request key.
+
+        Returns:
+            List[object]: The JSON of each response.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT response FROM responses WHERE request = ? ORDER BY sequence', (request,))
+            return [json.loads(zlib.decompress(raw)) for raw, in rows]
+
+    def response(self, request: str, sequence: int) -> object:
+        """One of the responses stored for a request, or the last of them if there are fewer.
+
+        Args:
+            request: The request key.
+            sequence: The position of the response in the order they were recorded, from 0.
+
+        Returns:
+            object: The JSON of the response, or None if nothing was recorded for the request.
+        """
+        with self._lock:
+            row = self._connection.execute('''
+                SELECT response FROM responses WHERE request = ? AND sequence <= ?
+                ORDER BY sequence DESC LIMIT 1''', (request, sequence)).fetchone()
+        return None if row == None else json.loads(zlib.decompress(row[0]))
+
+    @property
+    def options(self) -> Dict[str, object]:
+        """
+        Dict[str, object]: `options`
+            The options of the client that was recorded, that resource URLs are built from.
+        """
+        with self._lock:
+            rows = self._connection.execute('SELECT name, value FROM options')
+            return {name: json.loads(value) for name, value in rows}
+
+    @options.setter
+    def options(self, options: Dict[str, object]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO options (name, value) VALUES (?, ?)',
+                [(name, json.dumps(options[name])) for name in _URL_OPTIONS if name in options])
+
+    def clear(self) -> None:
+        """Remove every recorded response."""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class RecordingJIRA:
+    """Wraps a ``jira.JIRA`` client and records the searches, projects and changelog pages it returns.
+
+    The :py:class:`engineeringmetrics.adapters.Jira` adapter can be given this in place of the client.
+    Anything else is passed straight on to the client, including its HTTP session, so a scheduler or
+    stats given to the adapter see the real requests.
+
+    Args:
+        jiraclient: The client to record.
+        archive: A :py:class:`JiraArchive`, or the path of one to record to.
+    """
+
+    def __init__(self, jiraclient: JIRA, archive: JiraArchive) -> None:
+        self._client = jiraclient
+        self._archive = archive if isinstance(
+            archive, JiraArchive) else JiraArchive(archive)
+        self._archive.options = getattr(jiraclient, '_options', None) or {}
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._client, name)
+
+    @property
+    def archive(self) -> JiraArchive:
+        """
+        :py:class:`JiraArchive`: `archive`
+            The archive responses are recorded to.
+        """
+        return self._archive
+
+    def search_issues(self, jql_str: str, startAt: int = 0, maxResults: int = 50, validate_query: bool = True, fields: object = None, expand: str = None, **kwargs) -> client.ResultList:
+        result = self._client.search_issues(jql_str, startAt=startAt, maxResults=maxResults,
+                                            validate_query=validate_query, fields=fields, expand=expand, **kwargs)
+        self._archive.add(_request_key('search_issues', jql_str, startAt, maxResults, _search_fields(fields), expand), {
+            'startAt': result.startAt,
+            'maxResults': result.maxResults,
+            'total': result.total,
+            'isLast': result.isLast,
+            'issues': [issue.raw for issue in result],
+        })
+        return result
+
+    def project(self, id: str) -> Project:
+        project = self._client.project(id)
+        self._archive.add(_request_key('project', id), project.raw)
+        return project
+
+    @property
+    def jiraclient(self) -> JIRA:
+        """
+        JIRA: `jiraclient`
+            The client being recorded.
+        """
+        return self._client
+
+    def record_changelog_pages(self, get_page: Callable[[str, int, int], dict]) -> Callable[[str, int, int], dict]:
+        """Record the changelog pages fetched by a function, for a :py:class:`ReplayJIRA` to serve.
+
+        The adapter fetches changelog pages through the client's session rather than a client method,
+        so it hands its fetcher to the recording client to wrap.
+
+        Args:
+            get_page: The function fetching a page, called as ``get_page(key, start_at, max_results)``.
+
+        Returns:
+            A function called the same way that records each page it returns.
+        """
+        def recorded(key: str, start_at: int, max_results: int) -> dict:
+            page = get_page(key, start_at, max_results)
+            self._archive.add(_request_key('_get_json', 'issue/{}/changelog'.format(key), {
+                'startAt': start_at, 'maxResults': max_results}), page)
+            return page
+        return recorded
+
+
+class ReplayJIRA:
+    """Stands in for a ``jira.JIRA`` client, serving the responses recorded by a :py:class:`RecordingJIRA`.
+
+    Nothing is sent over the network. Each call gets the responses recorded for the same call in
+    turn, and the last of them once they have all been served. A call that wasn't recorded raises a
+    ``KeyError``.
+
+    Args:
+        archive: A :py:class:`JiraArchive`, or the path of one to replay.
+
+    Attributes:
+        requests (int): The number of calls served so far.
+    """
+
+    def __init__(self, archive: JiraArchive) -> None:
+        self._archive = archive if isinstance(
+            archive, JiraArchive) else JiraArchive(archive)
+        self._options = dict(JIRA.DEFAULT_OPTIONS, **self._archive.options)
+        # There is no session, so nothing can be sent to a server by mistake.
+        self._session = None
+        self._lock = threading.Lock()
+        self._served = {}
+        self.requests = 0
+
+    @property
+    def archive(self) -> JiraArchive:
+        """
+        :py:class:`JiraArchive`: `archive`
+            The archive responses are served from.
+        """
+        return self._archive
+
+    def _response(self, request: str) -> object:
+        with self._lock:
+            served = self._served.get(request, 0)
+            self._served[request] = served + 1
+            self.requests += 1
+        response = self._archive.response(request, served)
+        if response == None:
+            raise KeyError(
+                'No response to {} was recorded in {}'.format(request, self._archive.path))
+        return response
+
+    def search_issues(self, jql_str: str, startAt: int = 0, maxResults: int = 50, validate_query: bool = True, fields: object = None, expand: str = None, **kwargs) -> client.ResultList:
+        response = self._response(_request_key(
+            'search_issues', jql_str, startAt, maxResults, _search_fields(fields), expand))
+        issues = [Issue(self._options, self._session, raw=raw)
+                  for raw in response['issues']]
+        return client.ResultList(issues, response['startAt'], response['maxResults'],
+                                 response['total'], response['isLast'])
+
+    def project(self, id: str) -> Project:
+        return Project(self._options, self._session, raw=self._response(_request_key('project', id)))
+
+    def _get_json(self, path: str, params: dict = None, **kwargs) -> dict:
+        return self._response(_request_key('_get_json', path, params))
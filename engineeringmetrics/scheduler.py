@@ -0,0 +1,323 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Pacing and retrying of the HTTP requests made to Jira.
+
+Jira Cloud throttles clients that send too many requests, answering with a 429 and a ``Retry-After``
+header. A :py:class:`RequestScheduler` sits under the Jira client's HTTP session. It limits the rate
+at which requests are sent with a token bucket and the number in flight with a limit that grows while
+requests go through quickly and halves when the server pushes back. It also retries throttled
+requests after the delay the server asks for, or with jittered exponential backoff if it doesn't say.
+"""
+import random
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+
+# The scheduler mounted on each session, with the transport adapters and retries it replaced.
+_MOUNTS = weakref.WeakKeyDictionary()
+_MOUNTS_LOCK = threading.Lock()
+
+_PREFIXES = ('http://', 'https://')
+
+
+class RequestScheduler:
+    """Rate limits, retries and adapts the concurrency of the requests sent through it.
+
+    Args:
+        rate (optional): The most requests to send per second. Defaults to no limit.
+        burst (optional): The most requests that can be sent at once after a quiet spell. Defaults to
+            ``rate`` (or 1 if that is less).
+        max_concurrency (optional): The most requests to have in flight at a time.
+        min_concurrency (optional): The fewest requests in flight the limit is cut down to.
+        max_retries (optional): The number of times to retry a throttled or failed request before
+            giving up and returning the last response (or raising the last connection error).
+        backoff (optional): The delay in seconds before the first retry when the server doesn't say how
+            long to wait. Each retry after that waits up to twice as long.
+        max_backoff (optional): The longest delay in seconds between retries.
+        latency_tolerance (optional): How many times slower than the quickest response seen so far a
+            response has to be before the concurrency limit is cut back.
+
+    The concurrency limit starts at ``max_concurrency``. Each throttled request halves it and each
+    slow response takes a tenth off it, down to ``min_concurrency``. It grows back by one for about
+    every round of quick responses.
+
+    Example usage:
+
+        >>> from engineeringmetrics.scheduler import RequestScheduler
+        >>> scheduler = RequestScheduler(rate=20, max_concurrency=8)
+        >>> jm = Jira(jiraclient, fetch_workers=8, scheduler=scheduler)
+        >>> jm.populate_projects(['INT', 'OPS'])
+        >>> scheduler.metrics['throughput']
+    """
+
+    # Responses that mean the server wants us to slow down and try again.
+    __RETRY_STATUSES__ = (429, 503)
+
+    def __init__(self, rate: float = None, burst: int = None, max_concurrency: int = 8, min_concurrency: int = 1, max_retries: int = 5, backoff: float = 0.5, max_backoff: float = 60.0, latency_tolerance: float = 4.0) -> None:
+        if burst == None:
+            burst = rate if rate != None else 1
+        self._rate = rate
+        self._burst = max(1.0, float(burst))
+        self._max_concurrency = max(1, max_concurrency)
+        self._min_concurrency = max(1, min(min_concurrency, self._max_concurrency))
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._latency_tolerance = latency_tolerance
+
+        self._condition = threading.Condition()
+        self._tokens = self._burst
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._limit = float(self._max_concurrency)
+        self._in_flight = 0
+        self._min_latency = None
+
+        self._started_at = None
+        self._requests = 0
+        self._responses = 0
+        self._throttled = 0
+        self._retries = 0
+        self._errors = 0
+        self._latency = 0.0
+
+    def _wait(self) -> None:
+        """Block until a request can be sent, then count it as in flight. Called with the condition held."""
+        while True:
+            now = time.monotonic()
+            if self._rate != None:
+                self._tokens = min(self._burst, self._tokens +
+                                   (now - self._refilled_at) * self._rate)
+                self._refilled_at = now
+
+            delay = self._paused_until - now
+            if delay <= 0 and self._in_flight < int(self._limit):
+                if self._rate == None or self._tokens >= 1:
+                    break
+                delay = (1 - self._tokens) / self._rate
+            # With nothing to wait for but a slot, another request finishing wakes us up.
+            self._condition.wait(delay if delay > 0 else None)
+
+        if self._rate != None:
+            self._tokens -= 1
+        self._in_flight += 1
+        self._requests += 1
+        if self._started_at == None:
+            self._started_at = time.monotonic()
+
+    def _finished(self, latency: float, throttled: bool, retry_after: float = None) -> None:
+        """Record how a request went and adjust the concurrency limit. Called with the condition held."""
+        self._in_flight -= 1
+        if throttled:
+            self._throttled += 1
+            self._limit = max(self._min_concurrency, self._limit / 2)
+            if retry_after != None:
+                self._paused_until = max(
+                    self._paused_until, time.monotonic() + retry_after)
+        elif latency != None:
+            self._responses += 1
+            self._latency += latency
+            if self._min_latency == None or latency < self._min_latency:
+                self._min_latency = latency
+            if latency > self._min_latency * self._latency_tolerance:
+                self._limit = max(self._min_concurrency, self._limit * 0.9)
+            else:
+                self._limit = min(self._max_concurrency,
+                                  self._limit + 1 / self._limit)
+        else:
+            self._errors += 1
+        self._condition.notify_all()
+
+    @staticmethod
+    def _retry_after(value: str) -> float:
+        """The delay in seconds asked for by a ``Retry-After`` header, or None if there isn't one."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo == None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full jitter exponential backoff: a random delay up to double the last one's ceiling."""
+        return random.uniform(0, min(self._max_backoff, self._backoff * 2 ** attempt))
+
+    def send(self, transport, request, **kwargs):
+        """Send a request when the scheduler allows, retrying it if it is throttled or fails to connect.
+
+        Args:
+            transport: The function that actually sends the request, e.g. ``HTTPAdapter.send``.
+            request: The prepared request.
+            kwargs: Passed on to ``transport``.
+
+        Returns:
+            requests.Response: The response to the last attempt.
+        """
+        attempt = 0
+        while True:
+            with self._condition:
+                self._wait()
+            started = time.monotonic()
+            try:
+                response = transport(request, **kwargs)
+            except ConnectionError:
+                with self._condition:
+                    self._finished(None, False)
+                if attempt >= self._max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+            else:
+                latency = time.monotonic() - started
+                throttled = response.status_code in self.__RETRY_STATUSES__
+                retry_after = self._retry_after(
+                    response.headers.get('Retry-After')) if throttled else None
+                with self._condition:
+                    self._finished(latency, throttled, retry_after)
+                if not throttled or attempt >= self._max_retries:
+                    return response
+                response.close()
+                # The pause set by Retry-After holds back every request, a little jitter on top stops
+                # them all being sent again at the same moment.
+                time.sleep(retry_after + random.uniform(0, self._backoff)
+                           if retry_after != None else self._backoff_delay(attempt))
+
+            attempt += 1
+            with self._condition:
+                self._retries += 1
+
+    def mount(self, session: Session, pool_size: int = None) -> None:
+        """Send every request made by a session through the scheduler.
+
+        A session has one scheduler at a time, mounting another replaces it. If the session is a jira
+        ``ResilientSession`` its own retries are turned off while a scheduler is mounted, as the
+        scheduler retries instead. ``unmount`` puts them back.
+
+        Args:
+            session: The requests session, e.g. the ``_session`` of a ``JIRA`` client.
+            pool_size (optional): The number of connections to keep open to each host. Defaults to
+                ``max_concurrency``.
+        """
+        pool_size = pool_size or self._max_concurrency
+        with _MOUNTS_LOCK:
+            mounted = _MOUNTS.get(session)
+            if mounted == None:
+                replaced = ({prefix: session.adapters.get(prefix) for prefix in _PREFIXES},
+                            getattr(session, 'max_retries', None))
+            else:
+                replaced = mounted[1:]
+            for prefix in _PREFIXES:
+                session.mount(prefix, SchedulingAdapter(
+                    self, pool_connections=pool_size, pool_maxsize=pool_size))
+            if hasattr(session, 'max_retries'):
+                session.max_retries = 0
+            _MOUNTS[session] = (self,) + replaced
+
+    def unmount(self, session: Session) -> None:
+        """Stop sending a session's requests through the scheduler, putting back the transport adapters
+        and retries the session had before a scheduler was mounted. Does nothing if the scheduler isn't
+        the one mounted on the session.
+
+        Args:
+            session: The requests session the scheduler was mounted on.
+        """
+        with _MOUNTS_LOCK:
+            mounted = _MOUNTS.get(session)
+            if mounted == None or mounted[0] is not self:
+                return
+            del _MOUNTS[session]
+            adapters, max_retries = mounted[1:]
+            for prefix, adapter in adapters.items():
+                if adapter == None:
+                    session.adapters.pop(prefix, None)
+                else:
+                    session.mount(prefix, adapter)
+            if max_retries != None:
+                session.max_retries = max_retries
+
+    @property
+    def concurrency(self) -> int:
+        """
+        int: `concurrency`
+            The number of requests currently allowed in flight at once.
+        """
+        return int(self._limit)
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        Dict[str, float]: `metrics`
+            How the requests sent through the scheduler have gone, with the keys
+
+            ``"requests"``
+                The number of requests sent, including retries.
+            ``"responses"``
+                The number of requests that got a response other than a throttling one.
+            ``"throttled"``
+                The number of requests the server throttled.
+            ``"retries"``
+                The number of times a request was sent again.
+            ``"errors"``
+                The number of requests that failed to connect.
+            ``"in_flight"``
+                The number of requests being sent now.
+            ``"concurrency"``
+                The current concurrency limit.
+            ``"mean_latency"``
+                The mean time in seconds to get a response.
+            ``"throughput"``
+                Responses per second since the first request was sent.
+        """
+        with self._condition:
+            elapsed = time.monotonic() - self._started_at if self._started_at != None else 0
+            return {
+                'requests': self._requests,
+                'responses': self._responses,
+                'throttled': self._throttled,
+                'retries': self._retries,
+                'errors': self._errors,
+                'in_flight': self._in_flight,
+                'concurrency': int(self._limit),
+                'mean_latency': self._latency / self._responses if self._responses else 0.0,
+                'throughput': self._responses / elapsed if elapsed > 0 else 0.0,
+            }
+
+
+def mounted_scheduler(session: Session) -> RequestScheduler:
+    """The scheduler mounted on a session, or None.
+
+    Args:
+        session: A requests session.
+    """
+    with _MOUNTS_LOCK:
+        mounted = _MOUNTS.get(session)
+        return mounted[0] if mounted != None else None
+
+
+class SchedulingAdapter(HTTPAdapter):
+    """A requests transport adapter that sends everything through a :py:class:`RequestScheduler`.
+
+    Args:
+        scheduler: The scheduler to send requests through.
+        kwargs: Passed on to ``HTTPAdapter``, e.g. ``pool_maxsize``.
+    """
+
+    def __init__(self, scheduler: RequestScheduler, **kwargs) -> None:
+        self._scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        return self._scheduler.send(super().send, request, **kwargs)
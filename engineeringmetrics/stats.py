@@ -0,0 +1,283 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Timing and counting what the Jira adapter spends its time on.
+
+An :py:class:`AdapterStats` given to the :py:class:`engineeringmetrics.adapters.Jira` adapter collects
+how long each phase of pulling issues takes (searching, completing changelogs, reading the cache,
+building issues) and counts requests, bytes received, issues and transitions and cache hits. The
+results it returns collect the time spent working out lead and cycle times, filtering and building
+column stores in the same object. Hooks can be added to pass each measurement on as it is made, for
+example to a metrics system.
+
+Without stats the adapter only checks for None around each phase, so there is nothing to pay for
+measurements that aren't wanted.
+"""
+import threading
+import time
+import weakref
+from typing import Callable, Dict
+
+# The response hook installed on each watched session.
+_WATCHES = weakref.WeakKeyDictionary()
+_WATCHES_LOCK = threading.Lock()
+
+
+class _NullPhase:
+    """A phase that measures nothing, for when there are no stats to add it to."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Times a ``with`` block and adds it to a phase of an :py:class:`AdapterStats`."""
+
+    __slots__ = ('_stats', '_name', '_started')
+
+    def __init__(self, stats: 'AdapterStats', name: str) -> None:
+        self._stats = stats
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._stats.add_time(self._name, time.perf_counter() - self._started)
+
+
+class _Watch:
+    """The response hook of a watched session, passing each response on to the stats watching it."""
+
+    __slots__ = ('stats',)
+
+    def __init__(self, stats: 'AdapterStats') -> None:
+        self.stats = stats
+
+    def __call__(self, response, *args, **kwargs):
+        size = response.headers.get('Content-Length')
+        if size != None:
+            size = int(size)
+        elif kwargs.get('stream'):
+            # Reading the body would load a streamed response, so its size isn't known.
+            size = 0
+        else:
+            # The session reads the body next anyway when it isn't streaming.
+            size = len(response.content or b'')
+        self.stats.count('requests')
+        self.stats.count('bytes', size)
+        if response.elapsed != None:
+            self.stats.add_time('request', response.elapsed.total_seconds())
+        return response
+
+
+class AdapterStats:
+    """Per-phase timers and counters for the Jira adapter and the results it returns.
+
+    Args:
+        hooks (optional): Functions to call with each measurement, see ``add_hook``.
+
+    The phases timed by the adapter are
+
+        ``"search"``
+            JQL searches, including decoding the pages of issues.
+        ``"changelog"``
+            Fetching the pages of changelogs that searches cut short.
+        ``"cache"``
+            Reading and writing the issue cache.
+        ``"project"``
+            Looking up projects.
+        ``"build"``
+            Building :py:class:`engineeringmetrics.adapters.JiraIssue` instances.
+        ``"request"``
+            Waiting for HTTP responses (only when the client has a requests session).
+
+    and by the results it returns ``"lead_times"``, ``"cycle_times"``, ``"expand_flow_logs"``,
+    ``"filter"`` and ``"columns"``.
+
+    The counters are ``"requests"`` and ``"bytes"`` (received), ``"searches"``, ``"changelog_pages"``,
+    ``"issues_fetched"``, ``"issues_built"``, ``"transitions"`` (status changes in the changelogs of
+    the issues built), and ``"cache_hits"``/``"cache_misses"`` and ``"issue_map_hits"``/``"issue_map_misses"``
+    for the issue cache and the identity map of issues.
+
+    Example usage:
+
+        >>> from engineeringmetrics.stats import AdapterStats
+        >>> stats = AdapterStats()
+        >>> jm = Jira(jiraclient, cache=cache, stats=stats)
+        >>> jm.populate_projects(['INT', 'OPS'])
+        >>> stats.phases['search']['seconds'], stats.counters['bytes'], stats.hit_rate('cache')
+    """
+
+    def __init__(self, hooks: list = None) -> None:
+        self._lock = threading.Lock()
+        self._phases = {}
+        self._counters = {}
+        self._hooks = list(hooks or [])
+
+    def __getstate__(self) -> dict:
+        # Hooks are tied to this process (and sessions aren't pickled), the measurements are not.
+        with self._lock:
+            return {'phases': {name: list(phase) for name, phase in self._phases.items()},
+                    'counters': dict(self._counters)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+        self._phases = state['phases']
+        self._counters = state['counters']
+
+    def phase(self, name: str) -> _Phase:
+        """A context manager that adds the time spent in its ``with`` block to a phase.
+
+        Args:
+            name: The name of the phase.
+        """
+        return _Phase(self, name)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add a measured time to a phase, counting it as one more time through the phase.
+
+        Args:
+            name: The name of the phase.
+            seconds: The time taken.
+        """
+        with self._lock:
+            phase = self._phases.get(name)
+            if phase == None:
+                phase = self._phases[name] = [0, 0.0]
+            phase[0] += 1
+            phase[1] += seconds
+        for hook in self._hooks:
+            hook('phase', name, seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter.
+
+        Args:
+            name: The name of the counter.
+            value (optional): The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+        for hook in self._hooks:
+            hook('count', name, value)
+
+    def add_hook(self, hook: Callable[[str, str, float], None]) -> None:
+        """Call a function with each measurement as it is made.
+
+        The hook is called as ``hook(kind, name, value)``, where ``kind`` is ``"phase"`` (and ``value``
+        the seconds taken) or ``"count"`` (and ``value`` the amount added). It is called on the thread
+        that made the measurement, which may be a worker thread of the adapter, so it should be quick
+        and thread safe.
+
+        Args:
+            hook: The function to call.
+        """
+        self._hooks.append(hook)
+
+    def watch(self, session) -> None:
+        """Count the requests sent and bytes received by a requests session and time its responses.
+
+        A session is watched by one :py:class:`AdapterStats` at a time and has a single response hook
+        however often it is watched. Watching it with these stats stops any other stats watching it.
+        Bytes are counted from the ``Content-Length`` of each response, or the body if there isn't one
+        and the response isn't streamed.
+
+        Args:
+            session: The requests session, e.g. the ``_session`` of a ``JIRA`` client.
+        """
+        with _WATCHES_LOCK:
+            watch = _WATCHES.get(session)
+            if watch == None:
+                watch = _WATCHES[session] = _Watch(self)
+                session.hooks.setdefault('response', []).append(watch)
+            watch.stats = self
+
+    def unwatch(self, session) -> None:
+        """Stop watching a session, taking its response hook off. Does nothing if these stats aren't
+        the ones watching it.
+
+        Args:
+            session: The requests session.
+        """
+        with _WATCHES_LOCK:
+            watch = _WATCHES.get(session)
+            if watch == None or watch.stats is not self:
+                return
+            del _WATCHES[session]
+            hooks = session.hooks.get('response', [])
+            if watch in hooks:
+                hooks.remove(watch)
+
+    @property
+    def phases(self) -> Dict[str, Dict[str, float]]:
+        """
+        Dict[str, Dict[str, float]]: `phases`
+            The ``"count"`` of times through and total ``"seconds"`` spent in each phase so far.
+        """
+        with self._lock:
+            return {name: {'count': count, 'seconds': seconds}
+                    for name, (count, seconds) in self._phases.items()}
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """
+        Dict[str, int]: `counters`
+            The value of each counter so far.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def hit_rate(self, name: str) -> float:
+        """The fraction of lookups that were hits, from the ``<name>_hits`` and ``<name>_misses`` counters.
+
+        Args:
+            name: The counters to use, e.g. ``"cache"`` or ``"issue_map"``.
+
+        Returns:
+            float: The hit rate, or None if there haven't been any lookups.
+        """
+        with self._lock:
+            hits = self._counters.get(name + '_hits', 0)
+            lookups = hits + self._counters.get(name + '_misses', 0)
+        return hits / lookups if lookups else None
+
+    def as_dict(self) -> Dict[str, object]:
+        """The ``"phases"``, ``"counters"`` and cache ``"hit_rates"`` so far, e.g. to log as JSON."""
+        return {
+            'phases': self.phases,
+            'counters': self.counters,
+            'hit_rates': {name: self.hit_rate(name) for name in ('cache', 'issue_map')},
+        }
+
+    def reset(self) -> None:
+        """Start the timers and counters again from zero."""
+        with self._lock:
+            self._phases = {}
+            self._counters = {}
+
+
+def watching_stats(session) -> AdapterStats:
+    """The stats watching a session, or None.
+
+    Args:
+        session: A requests session.
+    """
+    with _WATCHES_LOCK:
+        watch = _WATCHES.get(session)
+        return watch.stats if watch != None else None
+
+
+def timed(stats: AdapterStats, name: str):
+    """A context manager timing a phase in ``stats``, or doing nothing if ``stats`` is None.
+
+    Args:
+        stats: The stats to add the time to (or None).
+        name: The name of the phase.
+    """
+    return _NULL_PHASE if stats == None else _Phase(stats, name)
@@ -26,15 +26,17 @@ def pPriority(priority):
     return s
 
 
-def createMarkdownReport(project):
+def markdownReport(project_name, issues):
+    """Yield the report a section at a time so issues can be streamed through it"""
     s = "# Known Issues Report\n"
     s += "Generated automatically from JIRA\n"
     s += '\n'
-    s += "## {} Known Issues\n".format(project.name)
-    for issue in project.issues:
+    s += "## {} Known Issues\n".format(project_name)
+    yield s
+    for issue in issues:
         url = issue['url']
-        s += "#### {} ([{}]({})) {}\n".format(issue['key'],
-                                              issue['summary'], url, pPriority(issue['priority']))
+        s = "#### {} ([{}]({})) {}\n".format(issue['key'],
+                                             issue['summary'], url, pPriority(issue['priority']))
         # s += pPriority(issue['priority'])
         s += "* JIRA: [{}]({})\n".format(url, url)
         s += "* Status: {}\n".format(issue['status'])
@@ -42,7 +44,11 @@ def createMarkdownReport(project):
             s += "* Fix: This was fixed in version {}\n".format(
                 issue['fixVersion'])
         s += '\n'
-    return s
+        yield s
+
+
+def createMarkdownReport(project):
+    return ''.join(markdownReport(project.name, project.issues))
 
 
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
@@ -50,11 +56,13 @@ MARKDOWN_FILE = f'{SCRIPT_PATH}/report.md'
 
 
 def main():
-    kem = EngineeringMetrics(config_dict)
-    project_list = kem.jirametrics.populate_projects(['INT'], max_results=20)
-    md = createMarkdownReport(project_list['INT'])
+    jm = EngineeringMetrics(config_dict).jirametrics
+    project = jm.jiraclient.project('INT')
+    # Stream the issues in to the report rather than pulling them all first.
+    issues = jm.iter_jql(
+        'project = "INT" ORDER BY priority DESC', max_results=20)
     with open(MARKDOWN_FILE, 'w', encoding='utf-8') as f:
-        f.write(md)
+        f.writelines(markdownReport(project.name, issues))
 
     print('yay, we did it!')
 
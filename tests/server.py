@@ -0,0 +1,106 @@
+"""A stand-in Jira server on localhost, for testing the adapter through a real ``jira.JIRA`` client."""
+import http.server
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from jira import JIRA
+
+from benchmarks.synthetic import FakeJIRA
+
+
+class JiraServer:
+    """Serves searches, projects and changelog pages of synthetic issues over HTTP.
+
+    The responses come from a :py:class:`benchmarks.synthetic.FakeJIRA`, so the paging and changelog
+    behaviour is the same as the fake client's, but they go through the real client's session, paging
+    and JSON decoding. Every request is logged with how many others were in flight when it arrived.
+
+    Args:
+        projects: The raw issues of each project, keyed by project key.
+        max_results (optional): The most issues returned by a single page.
+        max_histories (optional): The most changelog histories returned with an issue by a search.
+        delay (optional): Seconds to wait before answering each request.
+    """
+
+    def __init__(self, projects: dict, max_results: int = 100, max_histories: int = 100, delay: float = 0) -> None:
+        self.fake = FakeJIRA(projects, max_results, max_histories)
+        self.delay = delay
+        self.log = []
+        self.statuses = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: ','.join(v) for k, v in parse_qs(url.query).items()}
+                with server._lock:
+                    server._in_flight += 1
+                    server.log.append((url.path, params, server._in_flight))
+                    status = server.statuses.pop(0) if server.statuses else 200
+                try:
+                    time.sleep(server.delay)
+                    body = server._respond(url.path, params) if status == 200 else {}
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+                if body == None:
+                    status, body = 404, {'errorMessages': ['Not found: ' + url.path]}
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return 'http://127.0.0.1:{}'.format(self._server.server_port)
+
+    def client(self, **options) -> JIRA:
+        """A real client for this server."""
+        return JIRA(self.url, get_server_info=False, options=dict(options))
+
+    def searches(self) -> list:
+        return [params for path, params, _ in self.log if path.endswith('/search')]
+
+    def _respond(self, path: str, params: dict) -> object:
+        api = path.split('/rest/api/2/', 1)[-1]
+        if api == 'search':
+            fields = params.get('fields')
+            result = self.fake.search_issues(
+                params['jql'], startAt=int(params.get('startAt', 0)),
+                maxResults=min(int(params.get('maxResults', 50)), self.fake._max_results),
+                fields=fields.split(',') if fields else None, expand=params.get('expand'))
+            return {'startAt': result.startAt, 'maxResults': self.fake._max_results,
+                    'total': result.total, 'issues': [issue.raw for issue in result]}
+        if api == 'field':
+            return []
+        if api == 'serverInfo':
+            return {'baseUrl': self.url, 'version': '9.4.0', 'versionNumbers': [9, 4, 0],
+                    'deploymentType': 'Server', 'serverTitle': 'Stand-in'}
+        if api.startswith('project/'):
+            key = api.split('/')[1]
+            return self.fake.project(key).raw if key in self.fake._projects else None
+        if api.startswith('issue/') and api.endswith('/changelog'):
+            return self.fake._get_json(api, params)
+        return None
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
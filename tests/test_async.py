@@ -0,0 +1,63 @@
+"""The asyncio wrapper of the Jira adapter, against a stand-in Jira server."""
+import asyncio
+
+import pytest
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import AsyncJira, Jira
+from engineeringmetrics.scheduler import RequestScheduler, SchedulingAdapter, mounted_scheduler
+from tests.server import JiraServer
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(30, 'A'), 'B': raw_issues(12, 'B')}, max_results=10, delay=0.02)
+    yield server
+    server.close()
+
+
+def test_calls_run_concurrently(server):
+    jm = AsyncJira(Jira(server.client(), process_workers=1), max_concurrency=2)
+
+    async def pull():
+        return await asyncio.gather(jm.populate_from_jql('project = A', label='A'),
+                                    jm.get_project_issues('B'))
+
+    result, project = asyncio.run(pull())
+    assert [issue['key'] for issue in result] == ['A-{}'.format(i) for i in range(1, 31)]
+    assert len(project) == 12
+    assert jm.get_query_result('A') is result
+    assert max(in_flight for _, _, in_flight in server.log) > 1
+    jm.close()
+
+
+def test_populate_projects_keeps_errors(server):
+    jm = AsyncJira(Jira(server.client(), process_workers=1))
+    projects = asyncio.run(jm.populate_projects(['A', 'MISSING']))
+    assert list(projects) == ['A']
+    assert list(jm.project_errors) == ['MISSING']
+    jm.close()
+
+
+def test_the_pool_is_grown_in_place(server):
+    client = server.client()
+    adapter = client._session.adapters['http://']
+    jm = AsyncJira(Jira(client, process_workers=1, fetch_workers=2), max_concurrency=8)
+    # The adapter the session already had is resized rather than replaced.
+    assert client._session.adapters['http://'] is adapter
+    assert adapter._pool_maxsize == 16
+    assert len(asyncio.run(jm.populate_from_jql('project = A'))) == 30
+    jm.close()
+
+
+def test_a_mounted_scheduler_is_kept(server):
+    scheduler = RequestScheduler(max_concurrency=2)
+    jira = Jira(server.client(), process_workers=1, scheduler=scheduler)
+    session = jira.jiraclient._session
+    jm = AsyncJira(jira, max_concurrency=8)
+    assert isinstance(session.adapters['http://'], SchedulingAdapter)
+    assert len(asyncio.run(jm.populate_from_jql('project = A'))) == 30
+    assert scheduler.metrics['requests'] > 0
+    # Closing the wrapper closes the adapter, which unmounts its scheduler.
+    jm.close()
+    assert mounted_scheduler(session) == None
@@ -0,0 +1,54 @@
+"""Completing the changelogs that searches cut short."""
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira
+from tests.server import JiraServer
+
+ISSUES = raw_issues(20, 'A', transitions=12)
+
+
+def histories(result):
+    return {issue['key']: len(issue.flow_log) for issue in result}
+
+
+@pytest.fixture
+def full():
+    return histories(Jira(FakeJIRA({'A': ISSUES}), process_workers=1).populate_from_jql('project = A'))
+
+
+def test_pages_are_fetched_through_the_session(full):
+    server = JiraServer({'A': ISSUES}, max_histories=4)
+    try:
+        client = server.client()
+        paths = []
+        get_json = client._get_json
+        client._get_json = lambda path, *args, **kwargs: paths.append(path) or get_json(path, *args, **kwargs)
+        result = Jira(client, process_workers=1, fetch_workers=2).populate_from_jql('project = A')
+        assert histories(result) == full
+        assert any(path.endswith('/changelog') for path, _, _ in server.log)
+        # The adapter doesn't go through the client's private helper for them.
+        assert not any(path.endswith('/changelog') for path in paths)
+    finally:
+        server.close()
+
+
+class SearchOnly:
+    """A client that can search, but has no session or way to fetch changelog pages."""
+
+    def __init__(self, fake):
+        self._fake = fake
+        self._options = fake._options
+        self._session = None
+
+    def search_issues(self, *args, **kwargs):
+        return self._fake.search_issues(*args, **kwargs)
+
+
+def test_changelogs_are_left_short_with_a_warning(full):
+    client = SearchOnly(FakeJIRA({'A': ISSUES}, max_histories=4))
+    with pytest.warns(UserWarning, match='changelog'):
+        result = Jira(client, process_workers=1).populate_from_jql('project = A')
+    assert len(result) == 20
+    assert all(histories(result)[key] <= count for key, count in full.items())
+    assert histories(result) != full
@@ -0,0 +1,61 @@
+"""The column store of a query result and the numpy and pandas exports built from it."""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira
+
+pd = pytest.importorskip('pandas')
+
+
+@pytest.fixture
+def result():
+    client = FakeJIRA({'A': raw_issues(30, 'A', transitions=6, resolved=0.5)})
+    return Jira(client, process_workers=1, columnar=True).populate_from_jql('project = A')
+
+
+def test_columns_match_the_issues(result):
+    columns = result.to_numpy()
+    assert columns['key'].tolist() == [issue['key'] for issue in result]
+    assert columns['leadTime'].dtype == np.int64
+    assert columns['leadTime'].tolist() == [issue.get('leadTime', -1) for issue in result]
+    assert columns['cycleTime'].tolist() == [issue.get('cycleTime', -1) for issue in result]
+    assert columns['status'].tolist() == [issue['status'] for issue in result]
+    assert columns['priority'].tolist() == [issue.get('priority') for issue in result]
+    # Dates are in UTC.
+    assert columns['created'].astype(object).tolist() == [
+        (issue['created'] - issue['created'].utcoffset()).replace(tzinfo=None) for issue in result]
+    # Unresolved issues, whose resolution date is empty, are NaT.
+    unresolved = [not issue['resolutionDate'] for issue in result]
+    assert any(unresolved)
+    assert np.isnat(columns['resolutionDate']).tolist() == unresolved
+
+
+def test_codes_index_the_categories(result):
+    columns = result.to_numpy(decode=False)
+    categories = result.columns.categories['status']
+    assert columns['status'].dtype == np.int32
+    assert categories[columns['status']].tolist() == [issue['status'] for issue in result]
+
+
+def test_dataframes_are_built_from_the_columns(result):
+    frame = result.to_dataframe()
+    assert len(frame) == len(result)
+    assert frame['key'].tolist() == [issue['key'] for issue in result]
+    assert frame['leadTime'].tolist() == result.to_numpy()['leadTime'].tolist()
+    assert str(frame['created'].dt.tz) == 'UTC'
+    assert frame['created'].tolist() == [pd.Timestamp(issue['created']) for issue in result]
+    assert frame['status'].dtype == 'category'
+    assert frame['status'].tolist() == [issue['status'] for issue in result]
+
+
+def test_columns_follow_the_result(result):
+    columns = result.columns
+    result.calculate_cycle_times(begin_status='In Review')
+    # Recalculated times are written to the store in place.
+    assert result.columns is columns
+    assert columns.cycle_time.tolist() == [issue['cycleTime'] for issue in result]
+    # Adding or removing issues drops the store, and it is built again the next time it is used.
+    result.pop()
+    assert result._columns == None
+    assert len(result.columns) == len(result) == 29
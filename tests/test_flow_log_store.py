@@ -0,0 +1,48 @@
+"""The on disk flow log store against the lead and cycle times of the issues it was filled from."""
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import FlowLogStore, Jira
+
+
+@pytest.fixture
+def result():
+    client = FakeJIRA({'A': raw_issues(60, 'A', transitions=6)})
+    return Jira(client, process_workers=1).populate_from_jql('project = A')
+
+
+def _expected(values):
+    return [-1 if value == None else value for value in values]
+
+
+def test_times_match_the_issues(result, tmp_path):
+    store = FlowLogStore(str(tmp_path / 'store'))
+    store.extend(result)
+    assert any(issue.resolution_date for issue in result)
+
+    ids, lead_times = store.lead_times()
+    assert ids.tolist() == sorted(int(issue.id) for issue in result)
+    issues = sorted(result, key=lambda issue: int(issue.id))
+    assert lead_times.tolist() == _expected(
+        issue.calculate_lead_time(override=True) for issue in issues)
+
+    # A resolved issue's cycle time runs to its resolution date, as it does in memory.
+    ids, cycle_times = store.cycle_times()
+    assert cycle_times.tolist() == _expected(
+        issue.calculate_cycle_time(override=True) for issue in issues)
+    store.close()
+
+
+def test_resolution_dates_survive_reopening(result, tmp_path):
+    store = FlowLogStore(str(tmp_path / 'store'))
+    store.extend(result)
+    expected = store.cycle_times(interval='minutes')[1].tolist()
+    store.close()
+
+    store = FlowLogStore(str(tmp_path / 'store'))
+    assert store.cycle_times(interval='minutes')[1].tolist() == expected
+    # Storing the same issues again changes nothing.
+    size = store._size
+    store.extend(result)
+    assert store._size == size
+    store.close()
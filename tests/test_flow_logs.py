@@ -0,0 +1,72 @@
+"""Compact flow logs against the list of dictionaries they stand in for."""
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import CompactFlowLog, JiraIssue, StatusTable
+
+
+@pytest.fixture
+def issues():
+    client = FakeJIRA({'A': raw_issues(20, 'A', transitions=7)})
+    return client.search_issues('project = A', expand='changelog')
+
+
+def test_compact_logs_match_flow_logs(issues):
+    for resource in issues:
+        flow_log = JiraIssue(resource).flow_log
+        compact = JiraIssue(resource, compact_flow_log=True).flow_log
+        assert isinstance(compact, CompactFlowLog)
+        assert len(compact) == len(flow_log)
+        assert compact == flow_log
+        assert compact[-1] == flow_log[-1]
+        assert compact[1:3] == flow_log[1:3]
+        assert compact.as_dict() == flow_log.as_dict()
+        for state in ('Created', 'In Progress', 'Done', 'Never'):
+            assert compact.last_entered_at(state) == flow_log.last_entered_at(state)
+        assert compact.to_flow_log() == flow_log
+
+
+def test_appending_keeps_entries_in_order():
+    utc = timezone.utc
+    start = datetime(2020, 3, 2, 9, tzinfo=utc)
+    log = CompactFlowLog.from_flow_log([
+        dict(entered_at=start, state='Created'),
+        dict(entered_at=start + timedelta(days=2), state='Done', duration=8),
+    ])
+    log.append(dict(entered_at=start + timedelta(days=1), state='In Progress', duration=8))
+    log.append(dict(entered_at=start + timedelta(days=2), state='In Review'))
+    assert [entry['state'] for entry in log] == ['Created', 'In Progress', 'Done', 'In Review']
+    # Entries without a duration don't get one.
+    assert 'duration' not in log[0] and 'duration' not in log[-1]
+    # Timestamps keep their timezone, and naive ones stay naive.
+    offset = timezone(timedelta(hours=-5))
+    log.append(dict(entered_at=datetime(2020, 3, 5, 4, tzinfo=offset), state='Reopened'))
+    log.append(dict(entered_at=datetime(2020, 3, 6), state='Closed'))
+    assert log[-2]['entered_at'].utcoffset() == timedelta(hours=-5)
+    assert log[-1]['entered_at'] == datetime(2020, 3, 6)
+    with pytest.raises(TypeError):
+        log.append(dict(state='Done'))
+
+
+def test_pickled_logs_use_the_table_they_are_loaded_with(issues):
+    table = StatusTable()
+    log = CompactFlowLog.from_flow_log(JiraIssue(issues[0]).flow_log, status_table=table)
+    copied = pickle.loads(pickle.dumps(log))
+    # The copy's codes refer to the shared table, not to the one it was made with.
+    assert copied.status_table is not table
+    assert copied == log
+
+
+def test_status_tables_intern_names():
+    table = StatusTable()
+    assert table.lookup('Done') == -1
+    assert [table.code(name) for name in ('To Do', 'Done', 'To Do')] == [0, 1, 0]
+    assert table.lookup('Done') == 1
+    assert table.name(0) == 'To Do'
+    assert table.names == ['To Do', 'Done']
+    assert len(table) == 2
+    # Copies start out empty.
+    assert len(pickle.loads(pickle.dumps(table))) == 0
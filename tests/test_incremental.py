@@ -0,0 +1,83 @@
+"""Incremental pulls, which only fetch the issues updated since the watermark of the last pull."""
+import copy
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira, parse_jira_timestamp
+
+
+class ChangingJIRA:
+    """Serves the latest of a series of synthetic clients, applying the updated clause of searches."""
+
+    def __init__(self, projects):
+        self.client = FakeJIRA(projects)
+        self.queries = []
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def search_issues(self, jql_str, *args, **kwargs):
+        self.queries.append(jql_str)
+        result = self.client.search_issues(jql_str, *args, **kwargs)
+        minutes = re.search(r'updated >= "-(\d+)m"', jql_str)
+        if minutes:
+            since = datetime.now(timezone.utc) - timedelta(minutes=int(minutes.group(1)))
+            result[:] = [i for i in result if parse_jira_timestamp(i.fields.updated) >= since]
+        return result
+
+
+def updated_now(raw, status):
+    raw = copy.deepcopy(raw)
+    raw['fields']['updated'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+    raw['fields']['status']['name'] = status
+    return raw
+
+
+@pytest.fixture
+def raws():
+    return raw_issues(11, 'A')
+
+
+def test_incremental_pulls_merge_in_the_updates(raws):
+    client = ChangingJIRA({'A': raws[:10]})
+    jm = Jira(client, process_workers=1)
+    result = jm.populate_from_jql('project = A', label='A')
+    watermark = result.watermark
+    assert watermark == max(issue['updatedAt'] for issue in result)
+
+    # One issue changes and another is added.
+    client.client = FakeJIRA({'A': raws[:2] + [updated_now(raws[2], 'Blocked')] + raws[3:10] +
+                                   [updated_now(raws[10], 'To Do')]})
+    merged = jm.populate_from_jql('project = A', label='A', incremental=True)
+    assert re.match(r'\(project = A\) AND updated >= "-\d+m"$', client.queries[-1])
+    assert merged is result
+    assert [issue['key'] for issue in merged] == ['A-{}'.format(i) for i in range(1, 12)]
+    assert merged[2]['status'] == 'Blocked'
+    assert merged.watermark > watermark
+    assert merged.watermark == merged[-1]['updatedAt']
+
+    # Nothing new means nothing changes.
+    jm.populate_from_jql('project = A', label='A', incremental=True)
+    assert len(result) == 11 and result.watermark == merged.watermark
+
+
+def test_incremental_project_pulls_keep_the_order_by(raws):
+    client = ChangingJIRA({'A': raws[:10]})
+    jm = Jira(client, process_workers=1)
+    project = jm.populate_projects(['A'])['A']
+    client.client = FakeJIRA({'A': [updated_now(raws[0], 'Blocked')] + raws[1:10]})
+    assert jm.populate_projects(['A'], incremental=True)['A'] is project
+    assert re.match(r'\(project = "A"\) AND updated >= "-\d+m" ORDER BY priority DESC$', client.queries[-1])
+    assert project[0]['status'] == 'Blocked'
+    assert len(project) == 10
+
+
+def test_the_first_pull_or_a_new_query_fetches_everything(raws):
+    client = ChangingJIRA({'A': raws})
+    jm = Jira(client, process_workers=1)
+    assert len(jm.populate_from_jql('project = A', label='A', incremental=True)) == 11
+    assert len(jm.populate_from_jql('project = A ORDER BY key', label='A', incremental=True)) == 11
+    assert client.queries == ['project = A', 'project = A ORDER BY key']
@@ -0,0 +1,134 @@
+"""The Jira adapter end to end against the synthetic client from the benchmarks."""
+import copy
+
+import pytest
+
+from jira.resources import Issue
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira, JiraIssue
+from engineeringmetrics.cache import IssueCache, SQLiteIssueCache
+
+
+@pytest.fixture
+def client():
+    return FakeJIRA({'A': raw_issues(120, 'A', transitions=8),
+                     'B': raw_issues(40, 'B')}, max_results=25, max_histories=3)
+
+
+def test_raw_issues_are_deterministic():
+    assert raw_issues(5, seed=3) == raw_issues(5, seed=3)
+    assert raw_issues(5, seed=3) != raw_issues(5, seed=4)
+
+
+def test_populate_from_jql_builds_every_issue(client):
+    result = Jira(client, process_workers=1).populate_from_jql('project = A')
+    assert [issue['key'] for issue in result] == ['A-{}'.format(i) for i in range(1, 121)]
+    # Every page of each changelog is merged in, so the flow log matches the whole history.
+    raws = {raw['key']: raw for raw in raw_issues(120, 'A', transitions=8)}
+    for issue in result:
+        full = JiraIssue(Issue(client._options, client._session, raw=raws[issue['key']]))
+        assert issue.flow_log == full.flow_log
+        assert issue['cycleTime'] == full['cycleTime']
+
+
+def test_populate_projects_keeps_projects_apart(client):
+    projects = Jira(client, process_workers=1, project_workers=2).populate_projects(['A', 'B'])
+    assert {key: len(project) for key, project in projects.items()} == {'A': 120, 'B': 40}
+    assert projects['B'].name == 'B'.title()
+
+
+def test_cache_only_fetches_new_issues(client, tmp_path):
+    cache = SQLiteIssueCache(str(tmp_path / 'issues.sqlite'))
+    first = Jira(client, cache=cache, process_workers=1).populate_from_jql('project = B')
+    requests = client.requests
+    second = Jira(client, cache=cache, process_workers=1).populate_from_jql('project = B')
+    # Just the two pages of the search for keys and updated dates, as every issue is in the cache.
+    assert client.requests - requests == 2
+    assert [dict(issue) for issue in second] == [dict(issue) for issue in first]
+
+
+def test_one_process_pool_is_kept_for_the_main_thread(client):
+    jm = Jira(client, process_workers=2, process_pool_threshold=1)
+    first = jm.populate_from_jql('project = B', label='first')
+    pool = jm._process_pool
+    assert pool != None
+    second = jm.populate_from_jql('project = B', label='second')
+    assert jm._process_pool is pool
+    assert [issue['cycleTime'] for issue in first] == [issue['cycleTime'] for issue in second]
+    jm.close()
+    assert jm._process_pool == None
+
+
+def test_project_workers_build_issues_in_this_process(client):
+    jm = Jira(client, process_workers=2, process_pool_threshold=1, project_workers=2)
+    projects = jm.populate_projects(['A', 'B'])
+    assert {key: len(project) for key, project in projects.items()} == {'A': 120, 'B': 40}
+    assert jm._process_pool == None
+
+
+def test_a_cache_smaller_than_the_result(tmp_path):
+    raws = raw_issues(15, 'B')
+    cache = SQLiteIssueCache(str(tmp_path / 'issues.sqlite'), max_issues=10)
+    first = Jira(FakeJIRA({'B': raws}), cache=cache, process_workers=1).populate_from_jql('project = B')
+    assert len(first) == 15
+
+    touched = copy.deepcopy(raws)
+    for raw in touched[:5]:
+        raw['fields']['updated'] = '2030-01-01T00:00:00.000+0000'
+    # Storing the touched issues evicts others, which are fetched again rather than left out.
+    second = Jira(FakeJIRA({'B': touched}), cache=cache, process_workers=1).populate_from_jql('project = B')
+    assert [issue['key'] for issue in second] == [issue['key'] for issue in first]
+
+
+def test_results_only_share_issues_when_asked_to(client):
+    jm = Jira(client, process_workers=1)
+    second = jm.populate_from_jql('project = B')
+    third = jm.populate_from_jql('project = B')
+    before = [dict(issue) for issue in third]
+    second.expand_issue_flow_logs()
+    second.calculate_cycle_times(override=True, begin_status='In Review')
+    # By default each result has issues of its own, so changing one leaves the other alone.
+    assert all(a is not b for a, b in zip(second, third))
+    assert [dict(issue) for issue in third] == before
+
+    jm = Jira(client, process_workers=1, share_issues=True)
+    second = jm.populate_from_jql('project = B')
+    third = jm.populate_from_jql('project = B')
+    assert all(a is b for a, b in zip(second, third))
+    second.calculate_cycle_times(override=True, begin_status='In Review')
+    assert [issue['cycleTime'] for issue in third] != [issue['cycleTime'] for issue in before]
+
+
+class DictCache(IssueCache):
+    def __init__(self):
+        self.issues = {}
+
+    def updated(self, keys):
+        return {k: self.issues[k]['fields']['updated'] for k in keys if k in self.issues}
+
+    def get(self, keys):
+        return {k: self.issues[k] for k in keys if k in self.issues}
+
+    def put(self, issues):
+        self.issues.update((issue['key'], issue) for issue in issues)
+
+    def clear(self):
+        self.issues.clear()
+
+
+def test_caches_implement_the_whole_interface(client):
+    class Incomplete(IssueCache):
+        def updated(self, keys):
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    cache = DictCache()
+    first = Jira(client, cache=cache, process_workers=1).populate_from_jql('project = B')
+    assert len(cache.issues) == 40
+    requests = client.requests
+    second = Jira(client, cache=cache, process_workers=1).populate_from_jql('project = B')
+    assert client.requests - requests == 2
+    assert [dict(issue) for issue in second] == [dict(issue) for issue in first]
@@ -0,0 +1,69 @@
+"""Lazy issues fill in every entry before they are copied, pickled or turned into a plain dict."""
+import copy
+import pickle
+
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import JiraIssue
+from engineeringmetrics.lazy import LazyDict
+
+COPIES = {
+    'copy': copy.copy,
+    'deepcopy': copy.deepcopy,
+    'pickle': lambda issue: pickle.loads(pickle.dumps(issue)),
+    'dict': dict,
+}
+
+
+@pytest.fixture
+def resource():
+    client = FakeJIRA({'A': raw_issues(1, 'A', transitions=5)})
+    return client.search_issues('project = A', expand='changelog')[0]
+
+
+@pytest.mark.parametrize('make', list(COPIES.values()), ids=list(COPIES))
+def test_copies_materialize_the_issue(resource, make):
+    eager = JiraIssue(resource)
+    issue = JiraIssue(resource, lazy=True)
+    assert isinstance(issue, LazyDict)
+    assert dict.__len__(issue) == 0
+
+    copied = make(issue)
+    # Both the issue and the copy have every entry, in the usual order.
+    assert issue._pending == None
+    assert list(dict.keys(issue)) == list(eager)
+    assert list(dict.items(copied)) == list(dict.items(eager))
+    assert type(copied) is (dict if make is dict else JiraIssue)
+
+
+@pytest.mark.parametrize('make', [copy.copy, copy.deepcopy], ids=['copy', 'deepcopy'])
+def test_copies_load_attributes_on_their_own(resource, make):
+    issue = JiraIssue(resource, lazy=True, fields=['status'], changelog=False)
+    copied = make(issue)
+    assert copied._unloaded is not issue._unloaded
+    # Loading an attribute on the copy doesn't stop the issue loading it too.
+    assert '_load_comments' in issue._unloaded
+    assert len(copied.comments) == len(resource.fields.comment.comments)
+    assert len(issue.comments) == len(resource.fields.comment.comments)
+
+
+def test_the_dict_copy_method_is_a_plain_dict(resource):
+    issue = JiraIssue(resource, lazy=True)
+    copied = issue.copy()
+    assert type(copied) is dict
+    assert copied == JiraIssue(resource)
+
+
+def test_pending_entries_are_missing_by_default():
+    class Empty(LazyDict):
+        def __init__(self):
+            self._pending = dict.fromkeys(['a', 'b'])
+            self._key_order = ('a', 'b')
+            self._unloaded = set()
+
+    empty = Empty()
+    assert 'a' not in empty
+    assert empty.get('b', 1) == 1
+    empty['b'] = 2
+    assert dict(empty) == {'b': 2}
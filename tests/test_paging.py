@@ -0,0 +1,45 @@
+"""Fetching pages of search results in parallel, against a stand-in Jira server."""
+import pytest
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import Jira
+from tests.server import JiraServer
+
+KEYS = ['A-{}'.format(i) for i in range(1, 96)]
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(95, 'A')}, max_results=20, delay=0.02)
+    yield server
+    server.close()
+
+
+def keys(result):
+    return [issue['key'] for issue in result]
+
+
+def test_pages_are_put_back_in_server_order(server):
+    jm = Jira(server.client(), fetch_workers=4, page_size=50, process_workers=1)
+    assert keys(jm.populate_from_jql('project = A')) == KEYS
+    # The server capped the page size at 20, so the rest were asked for 20 at a time, once each.
+    assert sorted(int(p['startAt']) for p in server.searches()) == [0, 20, 40, 60, 80]
+
+
+def test_pages_are_fetched_concurrently(server):
+    Jira(server.client(), fetch_workers=4, page_size=20, process_workers=1).populate_from_jql('project = A')
+    assert max(in_flight for _, _, in_flight in server.log) > 1
+
+
+def test_max_results_limits_the_pages_fetched(server):
+    jm = Jira(server.client(), fetch_workers=3, page_size=20, process_workers=1)
+    assert keys(jm.populate_from_jql('project = A', max_results=45)) == KEYS[:45]
+    assert sorted((int(p['startAt']), int(p['maxResults'])) for p in server.searches()) == [
+        (0, 20), (20, 20), (40, 5)]
+
+
+def test_parallel_and_serial_fetches_match(server):
+    serial = Jira(server.client(), process_workers=1).populate_from_jql('project = A')
+    parallel = Jira(server.client(), fetch_workers=4, page_size=20,
+                    process_workers=1).populate_from_jql('project = A')
+    assert [dict(issue) for issue in parallel] == [dict(issue) for issue in serial]
@@ -0,0 +1,44 @@
+"""Pulling only the fields and changelog a caller needs."""
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira, JiraIssue
+
+
+@pytest.fixture
+def jm():
+    return Jira(FakeJIRA({'B': raw_issues(30, 'B')}), process_workers=1)
+
+
+def test_jira_fields_always_include_the_protected_entries():
+    assert JiraIssue.jira_fields(['status']) == ['updated', 'issuetype', 'status']
+    assert JiraIssue.jira_fields([]) == ['updated', 'issuetype']
+
+
+def test_projected_issues_keep_key_and_type(jm):
+    result = jm.populate_from_jql('project = B', fields=['status'], changelog=False)
+    assert all(set(issue) == {'ttype', 'id', 'key', 'status', 'url', 'updatedAt'} for issue in result)
+    stories = result.filter(['Story'])
+    assert len(stories) > 0
+    assert all(issue['ttype'] == 'Story' for issue in stories)
+
+
+def test_projected_issues_have_no_lead_or_cycle_time(jm):
+    result = jm.populate_from_jql('project = B', fields=['status'], changelog=False)
+    assert all(issue.lead_time == None and issue.cycle_time == None for issue in result)
+    assert all(issue.created == None for issue in result)
+
+
+def test_projected_issues_built_in_processes_match(jm):
+    serial = jm.populate_from_jql('project = B', fields=['status'], changelog=False, label='serial')
+    pooling = Jira(jm.jiraclient, process_workers=2, process_pool_threshold=1)
+    pooled = pooling.populate_from_jql('project = B', fields=['status'], changelog=False)
+    pooling.close()
+    assert [dict(issue) for issue in pooled] == [dict(issue) for issue in serial]
+    assert all(issue.lead_time == None for issue in pooled)
+
+
+def test_lead_times_need_the_changelog(jm):
+    result = jm.populate_from_jql('project = B', fields=['leadTime'], changelog=True)
+    assert all(isinstance(issue.lead_time, int) for issue in result)
+    assert all('leadTime' in issue for issue in result)
@@ -0,0 +1,51 @@
+"""Recording the Jira traffic of a run against the stand-in server and replaying it without one."""
+import pytest
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import Jira
+from engineeringmetrics.replay import JiraArchive, RecordingJIRA, ReplayJIRA
+from tests.server import JiraServer
+
+
+def pull(client):
+    jm = Jira(client, process_workers=1, fetch_workers=2, page_size=10)
+    result = jm.populate_from_jql('project = A')
+    projects = jm.populate_projects(['B'])
+    return result, projects['B']
+
+
+def summary(issues):
+    return [(issue['key'], issue['status'], len(issue.flow_log), issue['cycleTime']) for issue in issues]
+
+
+def test_a_replay_gives_the_recorded_results(tmp_path):
+    server = JiraServer({'A': raw_issues(25, 'A', transitions=9), 'B': raw_issues(6, 'B')},
+                        max_results=10, max_histories=4)
+    path = str(tmp_path / 'run.jira')
+    try:
+        client = server.client()
+        paths = []
+        get_json = client._get_json
+        client._get_json = lambda path, *args, **kwargs: paths.append(path) or get_json(path, *args, **kwargs)
+        recorded, project = pull(RecordingJIRA(client, path))
+        # Changelog pages went through the session, and were recorded all the same.
+        assert any(p.endswith('/changelog') for p, _, _ in server.log)
+        assert not any(p.endswith('/changelog') for p in paths)
+    finally:
+        server.close()
+
+    archive = JiraArchive(path)
+    assert len(archive) > 0
+    assert archive.options['server'] == server.url
+    replay = ReplayJIRA(archive)
+    replayed, replayed_project = pull(replay)
+    assert summary(replayed) == summary(recorded)
+    assert summary(replayed_project) == summary(project)
+    assert [issue.flow_log for issue in replayed] == [issue.flow_log for issue in recorded]
+    assert replay.requests > 0
+
+
+def test_unrecorded_calls_fail(tmp_path):
+    replay = ReplayJIRA(str(tmp_path / 'empty.jira'))
+    with pytest.raises(KeyError):
+        replay.project('A')
@@ -0,0 +1,54 @@
+"""Scheduling the requests of a Jira client's session."""
+import pytest
+from requests.adapters import HTTPAdapter
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import Jira
+from engineeringmetrics.scheduler import RequestScheduler, SchedulingAdapter, mounted_scheduler
+from tests.server import JiraServer
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(30, 'A')}, max_results=10)
+    yield server
+    server.close()
+
+
+def test_mount_turns_off_session_retries_until_unmounted(server):
+    session = server.client()._session
+    retries = session.max_retries
+    adapter = session.adapters['http://']
+    scheduler = RequestScheduler()
+    scheduler.mount(session)
+    assert session.max_retries == 0
+    assert isinstance(session.adapters['http://'], SchedulingAdapter)
+    scheduler.unmount(session)
+    assert session.max_retries == retries
+    assert session.adapters['http://'] is adapter
+    assert mounted_scheduler(session) == None
+
+
+def test_a_replaced_scheduler_unmounting_leaves_the_new_one(server):
+    session = server.client()._session
+    retries = session.max_retries
+    first, second = RequestScheduler(), RequestScheduler()
+    first.mount(session)
+    second.mount(session)
+    first.unmount(session)
+    assert mounted_scheduler(session) is second
+    assert session.max_retries == 0
+    second.unmount(session)
+    assert session.max_retries == retries
+    assert type(session.adapters['http://']) is HTTPAdapter
+
+
+def test_throttled_pages_are_retried(server):
+    server.statuses = [200, 429]
+    scheduler = RequestScheduler(backoff=0.01)
+    jm = Jira(server.client(), fetch_workers=2, page_size=10, process_workers=1, scheduler=scheduler)
+    assert len(jm.populate_from_jql('project = A')) == 30
+    assert scheduler.metrics['throttled'] == 1
+    assert scheduler.metrics['retries'] == 1
+    jm.close()
+    assert mounted_scheduler(jm.jiraclient._session) == None
@@ -0,0 +1,71 @@
+"""Sharing Jira clients between adapters set up for the same server and credentials."""
+import gc
+
+import pytest
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import clear_jira_clients, init_jira_adapter
+from engineeringmetrics.scheduler import RequestScheduler, mounted_scheduler
+from engineeringmetrics.stats import AdapterStats, watching_stats
+from tests.server import JiraServer
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(20, 'A')}, max_results=10)
+    yield server
+    clear_jira_clients()
+    server.close()
+
+
+def adapter(server, **kwargs):
+    return init_jira_adapter(jira_api_token='token', jira_username='user', jira_server_url=server.url,
+                             process_workers=1, **kwargs)
+
+
+def test_adapters_share_a_client(server):
+    first, second = adapter(server), adapter(server)
+    assert first.jiraclient is second.jiraclient
+    assert adapter(server, reuse_client=False).jiraclient is not first.jiraclient
+
+
+def test_open_adapters_keep_their_scheduler_and_stats(server):
+    first = adapter(server, scheduler=RequestScheduler(), stats=AdapterStats())
+    second = adapter(server, scheduler=RequestScheduler(), stats=AdapterStats())
+    # The first adapter is still open, so the second gets a client of its own.
+    assert second.jiraclient is not first.jiraclient
+    for jm in (first, second):
+        session = jm.jiraclient._session
+        assert mounted_scheduler(session) is jm.scheduler
+        assert watching_stats(session) is jm.stats
+        assert session.max_retries == 0
+        assert len(jm.populate_from_jql('project = A')) == 20
+        assert jm.scheduler.metrics['requests'] > 0
+        assert jm.stats.counters['requests'] > 0
+
+    # One without them shares the client as it is.
+    third = adapter(server)
+    assert third.jiraclient is first.jiraclient
+    assert mounted_scheduler(first.jiraclient._session) is first.scheduler
+
+
+def test_closed_adapters_hand_the_client_over(server):
+    first = adapter(server, scheduler=RequestScheduler(), stats=AdapterStats())
+    session = first.jiraclient._session
+    hooks = len(session.hooks['response'])
+    first.close()
+    assert session.max_retries > 0
+
+    second = adapter(server, scheduler=RequestScheduler(), stats=AdapterStats())
+    assert second.jiraclient is first.jiraclient
+    assert len(session.hooks['response']) == hooks
+    assert mounted_scheduler(session) is second.scheduler
+    assert watching_stats(session) is second.stats
+
+    # So does one that has been garbage collected.
+    del second
+    gc.collect()
+    assert mounted_scheduler(session) == None
+    assert watching_stats(session) == None
+    assert session.max_retries > 0
+    assert adapter(server, stats=AdapterStats()).jiraclient is first.jiraclient
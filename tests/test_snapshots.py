@@ -0,0 +1,63 @@
+"""Saving query results to snapshots and loading them again."""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import CompactFlowLog, Jira, JiraProject, JQLResult
+
+
+@pytest.fixture
+def jm():
+    client = FakeJIRA({'A': raw_issues(12, 'A', comments=1, transitions=6)}, max_results=5, max_histories=3)
+    return Jira(client, process_workers=1)
+
+
+def test_a_loaded_result_has_the_saved_issues(jm, tmp_path):
+    result = jm.populate_from_jql('project = A', label='all of A')
+    result.save(str(tmp_path))
+    loaded = JQLResult.load(str(tmp_path))
+    assert type(loaded) is JQLResult
+    assert (loaded.query, loaded.label, loaded.watermark) == (result.query, result.label, result.watermark)
+    assert len(loaded) == len(result)
+    assert any(issue['resolution'] == 'Done' for issue in loaded)
+    assert any(isinstance(issue['fixVersion'], str) for issue in loaded)
+    for saved, issue in zip(result, loaded):
+        assert list(issue) == list(saved)
+        # Jira resources are saved by name, so they come back as strings.
+        assert issue['resolution'] == getattr(saved['resolution'], 'name', None)
+        assert issue['fixVersion'] == getattr(saved['fixVersion'], 'name', None)
+        for key in saved:
+            if key not in ('resolution', 'fixVersion'):
+                assert issue[key] == saved[key], key
+        assert issue.flow_log == saved.flow_log
+        assert issue.comments == saved.comments
+        assert issue.status == saved.status
+
+
+def test_compact_flow_logs_come_back_compact(jm, tmp_path):
+    jm._compact_flow_logs = True
+    project = jm.populate_projects(['A'])['A']
+    assert isinstance(project[0].flow_log, CompactFlowLog)
+    project.save(str(tmp_path))
+    loaded = JQLResult.load(str(tmp_path))
+    assert type(loaded) is JiraProject
+    assert isinstance(loaded[0].flow_log, CompactFlowLog)
+    assert [list(issue.flow_log) for issue in loaded] == [list(issue.flow_log) for issue in project]
+
+
+def test_columns_are_read_from_the_snapshot_without_building_issues(jm, tmp_path):
+    result = jm.populate_from_jql('project = A')
+    result.save(str(tmp_path))
+    loaded = JQLResult.load(str(tmp_path))
+    # The length comes from the metadata.
+    assert len(loaded) == 12
+    assert loaded._snapshot != None
+    frame = loaded.to_dataframe()
+    assert isinstance(loaded.columns.lead_time, np.memmap)
+    assert frame.equals(result.to_dataframe())
+    assert loaded.to_numpy()['leadTime'].tolist() == [issue['leadTime'] for issue in result]
+    assert loaded._snapshot != None
+    # Using the issues builds them.
+    assert loaded[0]['key'] == 'A-1'
+    assert loaded._snapshot == None
+    assert len(loaded) == 12
@@ -0,0 +1,89 @@
+"""Timing and counting the work of the Jira adapter."""
+import pytest
+import requests
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import Jira
+from engineeringmetrics.cache import SQLiteIssueCache
+from engineeringmetrics.stats import AdapterStats, timed, watching_stats
+from tests.server import JiraServer
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(30, 'A', transitions=4)}, max_results=10)
+    yield server
+    server.close()
+
+
+def test_counts_issues_and_cache_hits(tmp_path):
+    client = FakeJIRA({'A': raw_issues(30, 'A', transitions=4)})
+    cache = SQLiteIssueCache(str(tmp_path / 'issues.sqlite'))
+    stats = AdapterStats()
+    jm = Jira(client, cache=cache, process_workers=1, stats=stats)
+    jm.populate_from_jql('project = A').calculate_cycle_times()
+    assert stats.counters['issues_built'] == 30
+    assert stats.counters['transitions'] == 30 * 4
+    assert stats.hit_rate('cache') == 0
+    assert {'search', 'cache', 'build', 'cycle_times'} <= set(stats.phases)
+
+    stats.reset()
+    Jira(client, cache=cache, process_workers=1, stats=stats).populate_from_jql('project = A')
+    assert stats.hit_rate('cache') == 1
+    assert stats.hit_rate('issue_map') == 0
+
+
+def test_hooks_see_every_measurement():
+    seen = []
+    stats = AdapterStats(hooks=[lambda *measurement: seen.append(measurement)])
+    with stats.phase('search'):
+        stats.count('searches', 2)
+    assert [kind for kind, _, _ in seen] == ['count', 'phase']
+    assert stats.counters == {'searches': 2}
+    assert stats.phases['search']['count'] == 1
+
+
+def test_no_stats_times_nothing():
+    with timed(None, 'search'):
+        pass
+
+
+def test_a_session_has_one_watch(server):
+    session = server.client()._session
+    hooks = len(session.hooks['response'])
+    first, second = AdapterStats(), AdapterStats()
+    first.watch(session)
+    first.watch(session)
+    second.watch(session)
+    assert len(session.hooks['response']) == hooks + 1
+    assert watching_stats(session) is second
+
+    session.get(server.url + '/rest/api/2/project/A')
+    assert 'requests' not in first.counters
+    assert second.counters['requests'] == 1
+
+    first.unwatch(session)
+    assert watching_stats(session) is second
+    second.unwatch(session)
+    assert len(session.hooks['response']) == hooks
+    assert watching_stats(session) == None
+
+
+def test_bytes_come_from_content_length(server):
+    session = requests.Session()
+    stats = AdapterStats()
+    stats.watch(session)
+    response = session.get(server.url + '/rest/api/2/project/A', stream=True)
+    # The streamed body hasn't been read to count it.
+    assert not response._content_consumed
+    assert stats.counters['bytes'] == int(response.headers['Content-Length'])
+    assert stats.phases['request']['count'] == 1
+
+
+def test_close_stops_watching(server):
+    stats = AdapterStats()
+    jm = Jira(server.client(), process_workers=1, stats=stats)
+    jm.populate_from_jql('project = A')
+    assert stats.counters['requests'] == len(server.log)
+    jm.close()
+    assert watching_stats(jm.jiraclient._session) == None
@@ -0,0 +1,51 @@
+"""Streaming query results a page at a time with iter_jql, against a stand-in Jira server."""
+import time
+
+import pytest
+
+from benchmarks.synthetic import raw_issues
+from engineeringmetrics.adapters import Jira, JQLResult
+from tests.server import JiraServer
+
+KEYS = ['A-{}'.format(i) for i in range(1, 96)]
+
+
+@pytest.fixture
+def server():
+    server = JiraServer({'A': raw_issues(95, 'A', transitions=8)}, max_results=20, max_histories=6, delay=0.005)
+    yield server
+    server.close()
+
+
+def test_issues_are_streamed_in_server_order(server):
+    jm = Jira(server.client(), fetch_workers=3, page_size=20, process_workers=1)
+    assert [issue['key'] for issue in jm.iter_jql('project = A', changelog=False)] == KEYS
+    # Long changelogs are completed just as they are for populate_from_jql.
+    streamed = list(jm.iter_jql('project = A', max_results=25))
+    stored = jm.populate_from_jql('project = A', max_results=25)
+    assert [issue.flow_log for issue in streamed] == [issue.flow_log for issue in stored]
+    assert [dict(issue) for issue in streamed] == [dict(issue) for issue in stored]
+
+
+def test_pages_and_max_results(server):
+    jm = Jira(server.client(), fetch_workers=2, page_size=20, process_workers=1)
+    pages = list(jm.iter_jql('project = A', max_results=45, pages=True, fields=['status'], changelog=False))
+    assert all(isinstance(page, JQLResult) for page in pages)
+    assert [len(page) for page in pages] == [20, 20, 5]
+    assert [issue['key'] for page in pages for issue in page] == KEYS[:45]
+    # Nothing is kept by the adapter.
+    with pytest.raises(KeyError):
+        jm.get_query_result('JQL')
+    with pytest.raises(ValueError):
+        next(jm.iter_jql())
+
+
+def test_stopping_early_stops_fetching(server):
+    jm = Jira(server.client(), fetch_workers=2, page_size=20, process_workers=1)
+    stream = jm.iter_jql('project = A', changelog=False)
+    assert [next(stream)['key'] for _ in range(3)] == KEYS[:3]
+    stream.close()
+    # Let any pages being fetched in the background finish.
+    time.sleep(0.2)
+    # The first page, and no more than the pages that were already being fetched, rather than all five.
+    assert len(server.searches()) <= 1 + 2
@@ -0,0 +1,40 @@
+"""The ISO-8601 fast path of parse_jira_timestamp against dateutil, which it stands in for."""
+import pytest
+from dateutil.parser import parse
+
+from engineeringmetrics.adapters import parse_jira_timestamp
+
+TIMESTAMPS = [
+    '2020-02-19T11:33:00.000+0100',
+    '2020-02-19T11:33:00.123-0530',
+    '2020-02-19T11:33:00.5+05:45',
+    '2020-02-19T11:33:00+0000',
+    '2020-02-19T11:33:00.000000Z',
+    '2020-02-19T11:33:00',
+    '2019-12-31T23:59:59.999-1200',
+]
+
+
+@pytest.mark.parametrize('timestamp', TIMESTAMPS)
+def test_matches_dateutil(timestamp):
+    parsed = parse_jira_timestamp(timestamp)
+    expected = parse(timestamp)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+    # dateutil timezones, which compare equal to those dateutil gives (tzlocal() if it is UTC here).
+    assert parsed.tzinfo == expected.tzinfo
+
+
+def test_other_formats_go_to_dateutil():
+    assert parse_jira_timestamp('19 Feb 2020 11:33') == parse('19 Feb 2020 11:33')
+    with pytest.raises(ValueError):
+        parse_jira_timestamp('2020-02-30T11:33:00.000+0100')
+    with pytest.raises(ValueError):
+        parse_jira_timestamp('not a date')
+
+
+def test_results_are_memoized():
+    parse_jira_timestamp.cache_clear()
+    first = parse_jira_timestamp('2020-02-19T11:33:00.000+0100')
+    assert parse_jira_timestamp('2020-02-19T11:33:00.000+0100') is first
+    assert parse_jira_timestamp.cache_info().hits == 1
@@ -0,0 +1,54 @@
+"""Filtered copies of issues, which are views of the issue they were made from."""
+import pytest
+
+from benchmarks.synthetic import FakeJIRA, raw_issues
+from engineeringmetrics.adapters import CompactFlowLog, JiraIssue
+
+
+@pytest.fixture
+def resources():
+    client = FakeJIRA({'A': raw_issues(5, 'A', comments=2, transitions=4)})
+    return client.search_issues('project = A', expand='changelog')
+
+
+@pytest.mark.parametrize('lazy', [False, True], ids=['eager', 'lazy'])
+def test_views_keep_the_fields_asked_for(resources, lazy):
+    issue = JiraIssue(resources[0], lazy=lazy)
+    view = issue.filtered_copy(['status', 'leadTime'])
+    assert list(view) == ['ttype', 'key', 'status', 'leadTime']
+    assert all(view[key] == issue[key] for key in view)
+    assert view.flow_log == issue.flow_log
+    # Everything else is left out.
+    assert 'summary' not in view
+    assert list(issue.filtered_copy(None)) == list(issue)
+
+
+def test_changing_a_view_leaves_the_issue_alone(resources):
+    issue = JiraIssue(resources[0])
+    view = issue.filtered_copy(['labels', 'issueLinks', 'lastComment'])
+    entries = len(issue.flow_log)
+
+    view.flow_log.append(dict(view.flow_log[-1]))
+    view['labels'].append('changed')
+    view['issueLinks'].append('A-99')
+    view.comments.append({'body': 'changed'})
+    view.status['name'] = 'changed'
+    view['key'] = 'A-99'
+
+    assert len(issue.flow_log) == entries
+    assert 'changed' not in issue['labels']
+    assert 'A-99' not in issue['issueLinks']
+    assert len(issue.comments) == 2
+    assert issue.status['name'] == issue['status'] != 'changed'
+    assert issue['key'] == 'A-1'
+    # The changes stick on the view.
+    assert len(view.flow_log) == entries + 1
+    assert view['labels'][-1] == 'changed'
+
+
+def test_compact_flow_logs_are_copied_too(resources):
+    issue = JiraIssue(resources[0], compact_flow_log=True)
+    view = issue.filtered_copy(['status'])
+    assert isinstance(view.flow_log, CompactFlowLog)
+    view.flow_log.append(view.flow_log[-1])
+    assert len(view.flow_log) == len(issue.flow_log) + 1